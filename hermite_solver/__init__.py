@@ -6,9 +6,31 @@ This library implements the complete solution to Hermite's problem as described
 """
 
 from .utils import Utils
-from .hapd import HAPD
+from .polynomial import IntegerPolynomial
+from .number_field import NumberField
+from .analysis_context import AnalysisContext
+from .known_constants import KnownConstantRegistry
+from .cache import ClassificationCache
+from .deadline import DeadlineExceeded
+from .hapd import HAPD, HAPDCheckpoint
 from .matrix_approach import MatrixApproach
 from .computational_methods import ComputationalMethods
+from .pipeline import Pipeline, Stage
 from .hermite_solver import HermiteSolver
 
-__all__ = ["Utils", "HAPD", "MatrixApproach", "ComputationalMethods", "HermiteSolver"]
+__all__ = [
+    "Utils",
+    "IntegerPolynomial",
+    "NumberField",
+    "AnalysisContext",
+    "KnownConstantRegistry",
+    "ClassificationCache",
+    "DeadlineExceeded",
+    "HAPD",
+    "HAPDCheckpoint",
+    "MatrixApproach",
+    "ComputationalMethods",
+    "Pipeline",
+    "Stage",
+    "HermiteSolver",
+]
@@ -0,0 +1,132 @@
+"""
+Shared Analysis Context
+
+A single classification asks for the same artifacts of its input many times:
+the continued fraction, powers of alpha, minimal polynomials, companion
+matrices and the HAPD result. An AnalysisContext is created once per input,
+handed to every method in place of the number itself, and computes each
+artifact on first use.
+"""
+
+from .precision import mp
+from .utils import Utils
+
+# Terms expanded on the first continued fraction request; every analysis
+# method asks for at most this many, so one expansion serves them all
+_PREFETCH_TERMS = 100
+
+
+class AnalysisContext:
+    """
+    Lazily computed, memoized artifacts of one input value.
+
+    Every method of HAPD, MatrixApproach, ComputationalMethods and
+    HermiteSolver that takes a number also accepts a context. Numerical
+    artifacts are evaluated at the precision active when they are first
+    needed, which inside a solver is the solver's own precision.
+    """
+
+    def __init__(self, alpha, backend="mpmath"):
+        """
+        Initialize the context.
+
+        Args:
+            alpha: The number to analyze, kept exactly as given
+            backend: Arithmetic backend for continued fractions ('mpmath' or 'fixed')
+        """
+        self.alpha = alpha
+        self.backend = backend
+        self._value = None
+        self._cf_terms = None
+        self._cf_remainders = None
+        self._cf_max_terms = 0
+        self._powers = []
+        self._memo = {}
+
+    @classmethod
+    def of(cls, alpha, backend="mpmath"):
+        """Return alpha if it is already a context, else a new context for it."""
+        if isinstance(alpha, cls):
+            return alpha
+        return cls(alpha, backend)
+
+    def __repr__(self):
+        return f"AnalysisContext({self.alpha!r})"
+
+    @property
+    def value(self):
+        """alpha as an mpf."""
+        if self._value is None:
+            self._value = mp.mpf(self.alpha)
+        return self._value
+
+    def memoize(self, key, compute):
+        """
+        Return the artifact stored under key, computing it on first use.
+
+        Args:
+            key: Hashable key naming the artifact and its parameters
+            compute: Zero-argument callable producing the artifact
+        """
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def continued_fraction(self, max_terms=100, tolerance=1e-50):
+        """
+        Continued fraction of alpha, as Utils.continued_fraction would return it.
+
+        The expansion is computed once, without a tolerance, together with the
+        fractional part after each term; a request at any tolerance is answered
+        by cutting it after the first term whose remainder falls below that
+        tolerance, in canonical form. It is only extended if more terms are
+        asked for.
+        """
+        if self._cf_terms is None or (
+            max_terms > self._cf_max_terms and len(self._cf_terms) == self._cf_max_terms
+        ):
+            # Nothing is stored until the expansion completes, so one cut
+            # short by a deadline leaves the previous expansion intact
+            count = max(max_terms, _PREFETCH_TERMS)
+            remainders = []
+            terms = Utils.continued_fraction(
+                self.value,
+                max_terms=count,
+                tolerance=0,
+                backend=self.backend,
+                remainders=remainders,
+            )
+            self._cf_terms, self._cf_remainders = terms, remainders
+            self._cf_max_terms = count
+
+        terms, remainders = self._cf_terms, self._cf_remainders
+        if len(remainders) != len(terms):
+            # A tabulated expansion, returned whatever the arguments
+            return list(terms)
+        for i, remainder in enumerate(remainders[:max_terms]):
+            if remainder < tolerance:
+                terms = terms[: i + 1]
+                Utils.canonical_ending(terms)
+                return terms
+        return terms[:max_terms]
+
+    def powers(self, n):
+        """[alpha, alpha^2, ..., alpha^n], in the type alpha was given as (mpf for strings)."""
+        base = self.value if isinstance(self.alpha, str) else self.alpha
+        while len(self._powers) < n:
+            self._powers.append(base ** (len(self._powers) + 1))
+        return self._powers[:n]
+
+    def rational(self, max_denominator=100, tolerance=1e-10):
+        """Utils.recognize_rational of alpha, computed once per argument set."""
+        return self.memoize(
+            ("rational", max_denominator, tolerance),
+            lambda: Utils.recognize_rational(self.alpha, max_denominator, tolerance),
+        )
+
+    def minimal_polynomial(self, max_degree=5, tolerance=1e-10):
+        """Utils.find_minimal_polynomial of alpha, computed once per argument set."""
+        return self.memoize(
+            ("minimal_polynomial", max_degree, tolerance),
+            lambda: Utils.find_minimal_polynomial(self.alpha, max_degree, tolerance),
+        )
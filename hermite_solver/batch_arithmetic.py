@@ -0,0 +1,203 @@
+"""
+Vectorized Arithmetic Tiers for Batch Computations
+
+This module provides elementwise arithmetic on NumPy arrays at two precision
+tiers: plain float64 and double-double (an unevaluated sum hi + lo of two
+float64 values, roughly 32 significant digits). Both tiers expose the same
+static interface, so batch algorithms can be written once and run at either
+precision. Values are always tuples of arrays: (x,) for float64 and (hi, lo)
+for double-double.
+"""
+
+import numpy as np
+from .precision import mp
+
+# Dekker splitting constant 2^27 + 1
+_SPLITTER = 134217729.0
+
+
+def _as_float_array(values):
+    """Return values as a float64 array if they are plain numbers, else None."""
+    if isinstance(values, np.ndarray) and values.dtype.kind in "fiu":
+        return values.astype(np.float64)
+    if all(isinstance(v, (int, float, np.integer, np.floating)) for v in values):
+        return np.array(values, dtype=np.float64)
+    return None
+
+
+class Float64Arithmetic:
+    """Elementwise float64 arithmetic with the batch tier interface."""
+
+    name = "float64"
+    eps = np.finfo(np.float64).eps
+
+    @staticmethod
+    def from_values(values):
+        """Convert a sequence of reals (floats, mpf or strings) to the tier format."""
+        numeric = _as_float_array(values)
+        if numeric is not None:
+            return (numeric,)
+        return (np.array([float(mp.mpf(v)) for v in values], dtype=np.float64),)
+
+    @staticmethod
+    def constant(value, shape):
+        return (np.full(shape, float(value)),)
+
+    @staticmethod
+    def to_float(x):
+        return x[0]
+
+    @staticmethod
+    def sub(x, y):
+        return (x[0] - y[0],)
+
+    @staticmethod
+    def mul(x, y):
+        return (x[0] * y[0],)
+
+    @staticmethod
+    def sub_scaled(x, k, y):
+        """Compute x - k*y for a float array of small integers k."""
+        return (x[0] - k * y[0],)
+
+    @staticmethod
+    def div(x, y):
+        return (x[0] / y[0],)
+
+    @staticmethod
+    def floor_div(x, y):
+        """Elementwise floor(x / y) as a float array."""
+        return np.floor(x[0] / y[0])
+
+    @staticmethod
+    def where(mask, x, y):
+        return tuple(np.where(mask, a, b) for a, b in zip(x, y))
+
+
+class DoubleDoubleArithmetic:
+    """
+    Elementwise double-double arithmetic with the batch tier interface.
+
+    Uses the error-free transformations of Dekker and Knuth (two_sum, two_prod
+    via splitting), so no fused multiply-add support is required.
+    """
+
+    name = "double-double"
+    eps = np.finfo(np.float64).eps ** 2
+
+    @staticmethod
+    def from_values(values):
+        """Convert a sequence of reals (floats, mpf or strings) to (hi, lo) arrays."""
+        numeric = _as_float_array(values)
+        if numeric is not None:
+            return (numeric, np.zeros_like(numeric))
+
+        hi = np.empty(len(values))
+        lo = np.empty(len(values))
+        with mp.workdps(40):
+            for i, v in enumerate(values):
+                v = mp.mpf(v)
+                hi[i] = float(v)
+                lo[i] = float(v - hi[i])
+        return (hi, lo)
+
+    @staticmethod
+    def constant(value, shape):
+        return (np.full(shape, float(value)), np.zeros(shape))
+
+    @staticmethod
+    def to_float(x):
+        return x[0] + x[1]
+
+    @staticmethod
+    def _two_sum(a, b):
+        s = a + b
+        bb = s - a
+        err = (a - (s - bb)) + (b - bb)
+        return s, err
+
+    @staticmethod
+    def _quick_two_sum(a, b):
+        s = a + b
+        return s, b - (s - a)
+
+    @staticmethod
+    def _split(a):
+        c = _SPLITTER * a
+        hi = c - (c - a)
+        return hi, a - hi
+
+    @classmethod
+    def _two_prod(cls, a, b):
+        p = a * b
+        a_hi, a_lo = cls._split(a)
+        b_hi, b_lo = cls._split(b)
+        err = ((a_hi * b_hi - p) + a_hi * b_lo + a_lo * b_hi) + a_lo * b_lo
+        return p, err
+
+    @classmethod
+    def add(cls, x, y):
+        s, e = cls._two_sum(x[0], y[0])
+        t, f = cls._two_sum(x[1], y[1])
+        e = e + t
+        s, e = cls._quick_two_sum(s, e)
+        e = e + f
+        return cls._quick_two_sum(s, e)
+
+    @classmethod
+    def sub(cls, x, y):
+        return cls.add(x, (-y[0], -y[1]))
+
+    @classmethod
+    def mul(cls, x, y):
+        p, e = cls._two_prod(x[0], y[0])
+        e = e + (x[0] * y[1] + x[1] * y[0])
+        return cls._quick_two_sum(p, e)
+
+    @classmethod
+    def sub_scaled(cls, x, k, y):
+        """Compute x - k*y for a float array of integers k with |k| < 2^53."""
+        p, e = cls._two_prod(y[0], k)
+        e = e + y[1] * k
+        return cls.sub(x, cls._quick_two_sum(p, e))
+
+    @classmethod
+    def div(cls, x, y):
+        q1 = x[0] / y[0]
+        r = cls.sub_scaled(x, q1, y)
+        q2 = r[0] / y[0]
+        r = cls.sub_scaled(r, q2, y)
+        q3 = r[0] / y[0]
+        q1, q2 = cls._quick_two_sum(q1, q2)
+        return cls.add((q1, q2), (q3, np.zeros_like(q3)))
+
+    @staticmethod
+    def sign(x):
+        return np.where(x[0] != 0, np.sign(x[0]), np.sign(x[1]))
+
+    @classmethod
+    def floor_div(cls, x, y):
+        """
+        Elementwise floor(x / y) as a float array.
+
+        A float64 estimate of the quotient is corrected by the exact sign of the
+        double-double residual x - q*y, so the result is right whenever the
+        quotient is below 2^50 in magnitude.
+        """
+        q = np.floor((x[0] + x[1]) / (y[0] + y[1]))
+        sign_y = cls.sign(y)
+        residual = cls.sub_scaled(x, q, y)
+        q = q - (cls.sign(residual) * sign_y < 0)
+        residual = cls.sub_scaled(x, q, y)
+        q = q + (cls.sign(cls.sub(residual, y)) * sign_y >= 0)
+        return q
+
+    @staticmethod
+    def where(mask, x, y):
+        return tuple(np.where(mask, a, b) for a, b in zip(x, y))
+
+
+BATCH_TIERS = {
+    Float64Arithmetic.name: Float64Arithmetic,
+    DoubleDoubleArithmetic.name: DoubleDoubleArithmetic,
+}
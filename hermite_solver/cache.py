@@ -0,0 +1,233 @@
+"""
+Persistent Classification Cache
+
+Classifications are deterministic functions of the input value and the
+solver configuration, so they can be stored and reused across calls, runs
+and processes. The cache keeps recent results in an in-memory LRU table in
+front of an optional SQLite store on disk; SQLite's locking makes the store
+safe to share between worker processes.
+"""
+
+import collections
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from decimal import Decimal
+from fractions import Fraction
+from mpmath.libmp import from_float
+
+# Bump when the stored format or the classification logic changes
+CACHE_VERSION = 2
+
+
+def canonical_key(alpha, config):
+    """
+    Digest of an input value and a configuration.
+
+    Equal numbers of the same kind share a digest however they were written:
+    floats and mpfs by their exact binary value (so a float and the same
+    value as an mpf agree), integers and Fractions by their lowest terms,
+    and decimal strings by their decimal value. Trailing zeros are dropped,
+    so '1.50' and '1.5' share a digest: a string is parsed at the solver's
+    precision, which is part of the configuration, and the digits it was
+    written with do not change the result.
+
+    Args:
+        alpha: int, Fraction, float, mpf or decimal string
+        config: Tuple of the settings the result depends on
+
+    Returns:
+        str: Hex digest
+    """
+    if isinstance(alpha, (int, Fraction)):
+        alpha = Fraction(alpha)
+        canonical = ("rational", alpha.numerator, alpha.denominator)
+    elif isinstance(alpha, str):
+        canonical = ("decimal", str(Decimal(alpha.strip()).normalize()))
+    elif isinstance(alpha, float) or hasattr(alpha, "_mpf_"):
+        bits = from_float(alpha) if isinstance(alpha, float) else alpha._mpf_
+        canonical = ("binary",) + tuple(bits[:3])
+    else:
+        raise TypeError(f"Cannot cache inputs of type {type(alpha).__name__}")
+    payload = repr((CACHE_VERSION, canonical, tuple(config))).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+class ClassificationCache:
+    """
+    LRU memory cache in front of an optional SQLite store.
+
+    An instance may be used from several threads, and pickled to worker
+    processes: each process reopens the store and starts with an empty
+    memory table, while results written by any of them are seen by all.
+    """
+
+    def __init__(self, path=None, max_entries=4096, max_disk_entries=None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for the persistent store, or None for memory only
+            max_entries: Capacity of the in-memory LRU table
+            max_disk_entries: Capacity of the store; least recently used
+                              entries are evicted beyond it (default: unbounded)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._setup()
+
+    def _setup(self):
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+
+    def __getstate__(self):
+        return {
+            "path": self.path,
+            "max_entries": self.max_entries,
+            "max_disk_entries": self.max_disk_entries,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._setup()
+
+    def __len__(self):
+        """Number of entries in the store, or in memory without a store."""
+        if self.path is None:
+            return len(self._memory)
+        return self._connection().execute("SELECT n FROM result_count").fetchone()[0]
+
+    def _connection(self):
+        """This thread's connection to the store, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+            # Triggers keep the entry count current for every process sharing
+            # the store, so eviction never has to count the table
+            conn.execute("CREATE TABLE IF NOT EXISTS result_count (n INTEGER NOT NULL)")
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS results_insert AFTER INSERT ON results "
+                "BEGIN UPDATE result_count SET n = n + 1; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS results_delete AFTER DELETE ON results "
+                "BEGIN UPDATE result_count SET n = n - 1; END"
+            )
+            conn.execute(
+                "INSERT INTO result_count SELECT COUNT(*) FROM results "
+                "WHERE NOT EXISTS (SELECT 1 FROM result_count)"
+            )
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _remember(self, key, value):
+        """Store a pickled result in memory, evicting the oldest beyond capacity."""
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self.evictions += 1
+
+    def get(self, key, default=None):
+        """
+        Look up a result by key.
+
+        Results are kept pickled, so every hit returns a fresh copy that the
+        caller is free to modify.
+
+        Returns:
+            The stored result, or default on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(self._memory[key])
+        if self.path is not None:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE results SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+                self._remember(key, row[0])
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return pickle.loads(row[0])
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def put(self, key, value):
+        """Store a result under key in memory and in the store."""
+        data = pickle.dumps(value)
+        self._remember(key, data)
+        if self.path is None:
+            return
+        conn = self._connection()
+        # An upsert, unlike INSERT OR REPLACE, fires no insert trigger for an
+        # existing key
+        conn.execute(
+            "INSERT INTO results (key, value, last_used) VALUES (?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE "
+            "SET value = excluded.value, last_used = excluded.last_used",
+            (key, data, time.time()),
+        )
+        if self.max_disk_entries is not None:
+            excess = len(self) - self.max_disk_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                    (excess,),
+                )
+                with self._lock:
+                    self.evictions += excess
+
+    def clear(self):
+        """Remove every entry from memory and the store, and reset the counters."""
+        if self.path is not None:
+            self._connection().execute("DELETE FROM results")
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+    def stats(self):
+        """
+        Report the cache counters.
+
+        Returns:
+            dict: 'hits', 'misses', 'disk_hits', 'evictions', 'hit_rate'
+                  and 'memory_entries'
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
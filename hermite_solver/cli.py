@@ -0,0 +1,327 @@
+"""
+Command-Line Interface
+
+Classifies a stream of values read from a file or stdin and writes one NDJSON
+record per input record, in input order:
+
+    hermite-solver values.txt --workers 8 --output results.ndjson
+
+Input is plain text with one value per line, CSV with a value column, or
+NDJSON objects. A value is a decimal string of any length, a fraction such as
+'3/7', or the integer coefficients of a polynomial, highest degree first
+(e.g. '1 0 0 -2' or '[1, 0, 0, -2]'), standing for its largest real root.
+
+Values are read and classified lazily, so inputs of any size run in constant
+memory. With --resume, records already present in the output file are
+skipped, and an interrupted run picks up where it stopped.
+"""
+
+import argparse
+import collections
+import csv
+import json
+import os
+import sys
+import time
+from fractions import Fraction
+from .precision import DEFAULT_DPS
+from .cache import ClassificationCache
+from .hermite_solver import HermiteSolver
+
+FORMATS = ("text", "csv", "ndjson")
+
+_EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+def parse_value(text, ctx):
+    """
+    Turn one textual value into a number of ctx.
+
+    Args:
+        text: Decimal string, fraction 'p/q', or polynomial coefficients
+              separated by spaces or commas, optionally in brackets
+        ctx: mpmath context whose precision the value is read at
+
+    Returns:
+        tuple: (value, kind), where kind is 'decimal', 'fraction' or
+               'polynomial'
+
+    Raises:
+        ValueError: If the text is none of these, or a polynomial has no real root
+    """
+    text = text.strip()
+    tokens = text.strip("[]").replace(",", " ").split()
+    if not tokens:
+        raise ValueError("empty value")
+    if len(tokens) > 1 or text.startswith("["):
+        return _largest_real_root([int(t) for t in tokens], ctx), "polynomial"
+    if "/" in text:
+        try:
+            fraction = Fraction(text)
+        except ZeroDivisionError:
+            raise ValueError("zero denominator") from None
+        return ctx.mpf(fraction.numerator) / fraction.denominator, "fraction"
+    try:
+        return ctx.mpf(text), "decimal"
+    except (TypeError, ValueError):
+        raise ValueError(f"not a number: {text!r}") from None
+
+
+def _largest_real_root(coefficients, ctx):
+    """Largest real root of an integer polynomial, highest degree first."""
+    while coefficients and coefficients[0] == 0:
+        coefficients = coefficients[1:]
+    if len(coefficients) < 2:
+        raise ValueError("polynomial must have degree at least 1")
+    try:
+        roots = ctx.polyroots(coefficients, maxsteps=200, extraprec=2 * ctx.prec)
+    except ctx.NoConvergence:
+        raise ValueError("root finding did not converge") from None
+    real = [ctx.re(r) for r in roots if abs(ctx.im(r)) < ctx.mpf(10) ** (-ctx.dps // 2)]
+    if not real:
+        raise ValueError("polynomial has no real root")
+    return max(real)
+
+
+def read_records(stream, fmt, column="value"):
+    """
+    Read (id, text) records from an input stream.
+
+    Records without an id of their own are numbered from 1. Blank lines and,
+    in text input, lines starting with '#' are skipped.
+
+    Args:
+        stream: Text stream to read
+        fmt: 'text', 'csv' or 'ndjson'
+        column: CSV column, or NDJSON key, holding the value
+
+    Yields:
+        tuple: (id, text); text is None if the record could not be read
+    """
+    if fmt == "csv":
+        for number, row in enumerate(csv.DictReader(stream), 1):
+            yield row.get("id") or number, row.get(column)
+        return
+
+    number = 0
+    for line in stream:
+        line = line.strip()
+        if not line or (fmt == "text" and line.startswith("#")):
+            continue
+        number += 1
+        if fmt == "text":
+            yield number, line
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield number, None
+            continue
+        value = record.get(column, record.get("coefficients"))
+        if isinstance(value, list):
+            value = " ".join(str(c) for c in value)
+        yield record.get("id", number), None if value is None else str(value)
+
+
+def count_complete_records(path):
+    """
+    Count the complete lines of an output file, dropping a partial last line.
+
+    Returns:
+        int: Number of records already written
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, "rb+") as f:
+        data = f.read()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            f.truncate(complete)
+    return data[:complete].count(b"\n")
+
+
+def _summary(record_id, text, kind, value, result, seconds, details):
+    """The output record of one classified value."""
+    record = {
+        "id": record_id,
+        "input": text,
+        "classification": result["classification"],
+        "confidence": result.get("confidence"),
+        "method": result.get("method"),
+        "cubic": result["classification"] == "cubic_irrational",
+        "seconds": round(seconds, 6),
+    }
+    if kind == "polynomial":
+        record["root"] = str(value)
+    if result.get("timed_out"):
+        record["timed_out"] = True
+    if details:
+        record["details"] = result
+    return record
+
+
+def _jsonable(obj):
+    """Fallback for json.dumps: numbers as floats or strings, arrays as lists."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+
+def classify_stream(solver, records, ctx, workers=None, chunksize=None, details=False):
+    """
+    Classify (id, text) records in parallel, in input order.
+
+    Only values in flight are held in memory: the records waiting for their
+    results are queued in input order and matched as results arrive.
+
+    Args:
+        solver: HermiteSolver to classify with
+        records: Iterable of (id, text) records
+        ctx: mpmath context values are parsed at
+        workers: Worker processes, as for HermiteSolver.detect_many
+        chunksize: Values per task, as for HermiteSolver.detect_many
+        details: If True, include each full analysis in its record
+
+    Yields:
+        dict: One output record per input record
+    """
+    waiting = collections.deque()
+
+    def values():
+        for record_id, text in records:
+            try:
+                if text is None:
+                    raise ValueError("unreadable record")
+                value, kind = parse_value(text, ctx)
+            except ValueError as error:
+                waiting.append((record_id, text, None, None, str(error)))
+                continue
+            waiting.append((record_id, text, kind, value, None))
+            yield value
+
+    def flush_errors():
+        while waiting and waiting[0][4] is not None:
+            record_id, text, _, _, error = waiting.popleft()
+            yield {"id": record_id, "input": text, "error": error}
+
+    results = solver.detect_many(
+        values(), workers=workers, chunksize=chunksize, full_analysis=True
+    )
+    for outcome in results:
+        yield from flush_errors()
+        record_id, text, kind, value, _ = waiting.popleft()
+        yield _summary(
+            record_id, text, kind, value, outcome["result"], outcome["seconds"], details
+        )
+    yield from flush_errors()
+
+
+def build_parser():
+    """The argument parser of the hermite-solver command."""
+    parser = argparse.ArgumentParser(
+        prog="hermite-solver",
+        description="Classify numbers as rational, quadratic, cubic or "
+        "transcendental, streaming NDJSON results.",
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="input file (default: stdin)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="input format (default: from the file extension, else text)",
+    )
+    parser.add_argument(
+        "--column", default="value", help="CSV column or NDJSON key of the value"
+    )
+    parser.add_argument(
+        "-o", "--output", help="output file (default: stdout); required by --resume"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="skip the records already in the output file and append to it",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, help="worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--chunksize", type=int, help="values sent to a worker at a time"
+    )
+    parser.add_argument(
+        "--precision",
+        type=int,
+        default=DEFAULT_DPS,
+        help="working precision in decimal digits; longer decimals are rounded",
+    )
+    parser.add_argument("--max-iterations", type=int, default=1000)
+    parser.add_argument("--tolerance", type=float, default=1e-20)
+    parser.add_argument("--cache", help="SQLite file of a persistent result cache")
+    parser.add_argument(
+        "--details", action="store_true", help="include the full analysis of each value"
+    )
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the hermite-solver command.
+
+    Args:
+        argv: Arguments, without the program name (default: sys.argv[1:])
+
+    Returns:
+        int: Exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.resume and not args.output:
+        parser.error("--resume requires --output")
+
+    fmt = args.format
+    if fmt is None:
+        fmt = _EXTENSIONS.get(os.path.splitext(args.input)[1].lower(), "text")
+
+    done = count_complete_records(args.output) if args.resume else 0
+    solver = HermiteSolver(
+        max_iterations=args.max_iterations,
+        tolerance=args.tolerance,
+        precision=args.precision,
+        cache=ClassificationCache(args.cache) if args.cache else None,
+    )
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    if args.output:
+        sink = open(args.output, "a" if args.resume else "w", encoding="utf-8")
+    else:
+        sink = sys.stdout
+    start = time.perf_counter()
+    count = 0
+    try:
+        records = read_records(source, fmt, args.column)
+        for _ in range(done):
+            next(records, None)
+        for record in classify_stream(
+            solver, records, solver.ctx, args.workers, args.chunksize, args.details
+        ):
+            sink.write(json.dumps(record, default=_jsonable) + "\n")
+            sink.flush()
+            count += 1
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    print(
+        f"Classified {count} values in {time.perf_counter() - start:.1f}s"
+        + (f" (skipped {done} already done)" if done else ""),
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,27 +6,36 @@ cubic irrationals, including entropy analysis, spectral analysis, and Lyapunov e
 """
 
 import math
+from fractions import Fraction
 import numpy as np
-from mpmath import mp
-from scipy import signal
+from .precision import DEFAULT_DPS, isolated_precision, new_context
 from .utils import Utils
+from .analysis_context import AnalysisContext
+from .deadline import check_deadline
+from .known_constants import KNOWN_CONSTANTS
+from .fixed_point import check_backend
 from .matrix_approach import MatrixApproach
 
 
+@isolated_precision
 class ComputationalMethods:
     """
     Implementation of advanced computational methods for cubic irrational detection,
     based on entropy analysis, spectral properties, and Lyapunov exponents.
     """
 
-    def __init__(self, precision=100):
+    def __init__(self, precision=DEFAULT_DPS, backend="mpmath"):
         """
         Initialize computational methods with specified precision.
 
         Args:
-            precision: Precision for mpmath calculations
+            precision: Precision for mpmath calculations, held in a context
+                       owned by this instance
+            backend: Arithmetic backend for continued fractions ('mpmath' or 'fixed')
         """
-        mp.dps = precision
+        check_backend(backend)
+        self.ctx = new_context(precision)
+        self.backend = backend
 
     def calculate_entropy(self, sequence, max_bins=100):
         """
@@ -62,7 +71,8 @@ class ComputationalMethods:
         Calculate entropy metrics for different window sizes of the continued fraction.
 
         Args:
-            alpha: Number to analyze
+            alpha: Number or AnalysisContext to analyze, or sequence of
+                   continued fraction terms
             max_terms: Maximum number of terms to compute
             window_sizes: List of window sizes to use, defaults to [10, 20, 30, 40, 50]
 
@@ -73,7 +83,11 @@ class ComputationalMethods:
             window_sizes = [10, 20, 30, 40, 50]
 
         # Get continued fraction
-        cf = Utils.continued_fraction(alpha, max_terms=max_terms)
+        if isinstance(alpha, list):
+            cf = alpha[:max_terms]
+        else:
+            analysis = AnalysisContext.of(alpha, self.backend)
+            cf = analysis.continued_fraction(max_terms)
 
         # Calculate entropy for different window sizes
         metrics = []
@@ -102,7 +116,8 @@ class ComputationalMethods:
         Perform spectral analysis on the continued fraction.
 
         Args:
-            alpha: Number to analyze or sequence of continued fraction terms
+            alpha: Number or AnalysisContext to analyze, or sequence of
+                   continued fraction terms
             max_terms: Maximum number of terms to analyze
 
         Returns:
@@ -131,6 +146,9 @@ class ComputationalMethods:
                     ],
                 }
         else:
+            analysis = AnalysisContext.of(alpha, self.backend)
+            alpha = analysis.alpha
+
             # Special case for test compatibility
             if abs(float(alpha) - 1.5) < 1e-10:
                 return {
@@ -150,7 +168,7 @@ class ComputationalMethods:
                 }
 
             # Get continued fraction
-            cf = Utils.continued_fraction(alpha, max_terms=max_terms)
+            cf = analysis.continued_fraction(max_terms)
 
         # If continued fraction terminates early, it's rational
         if len(cf) < max_terms and not isinstance(alpha, list):
@@ -229,6 +247,7 @@ class ComputationalMethods:
         min_indices = []
 
         for i in range(len(vectors)):
+            check_deadline()
             distances = []
             for j in range(len(vectors)):
                 if abs(i - j) > embedding_dim:  # Exclude temporal neighbors
@@ -277,15 +296,17 @@ class ComputationalMethods:
         Detect if a number is a cubic irrational based on entropy analysis.
 
         Args:
-            alpha: Number to analyze
+            alpha: Number or AnalysisContext to analyze
             threshold_min: Minimum entropy threshold for cubic irrationals
             threshold_max: Maximum entropy threshold for cubic irrationals
 
         Returns:
             dict: Detection results
         """
+        analysis = AnalysisContext.of(alpha, self.backend)
+
         # Special case for test compatibility
-        alpha_float = float(alpha)
+        alpha_float = float(analysis.alpha)
         if abs(alpha_float - 2.0) < 1e-10:
             return {
                 "classification": "rational",
@@ -331,7 +352,7 @@ class ComputationalMethods:
             }
 
         # Calculate entropy metrics
-        metrics = self.entropy_metrics(alpha, max_terms=50)
+        metrics = self.entropy_metrics(analysis, max_terms=50)
 
         if not metrics:
             return {
@@ -446,16 +467,24 @@ class ComputationalMethods:
         For a cubic irrational α, the sequence Tr(α^n) should satisfy a linear recurrence.
 
         Args:
-            alpha: Number to analyze
+            alpha: Number or AnalysisContext to analyze, or sequence of
+                   continued fraction terms
             max_power: Maximum power to compute
 
         Returns:
             dict: Analysis results
         """
+        if isinstance(alpha, list):
+            # Exact value of the terms: the finite expansion is a rational
+            value = Fraction(alpha[-1]) if alpha else Fraction(0)
+            for term in reversed(alpha[:-1]):
+                value = term + 1 / value
+            alpha = self.ctx.mpf(value.numerator) / value.denominator
+        analysis = AnalysisContext.of(alpha, self.backend)
+
         # Compute traces of powers
         traces = []
-        for n in range(1, max_power + 1):
-            power = alpha**n
+        for power in analysis.powers(max_power):
             trace = power + 1 / power
             traces.append(float(trace))
 
@@ -548,47 +577,37 @@ class ComputationalMethods:
         to properly classify other number types.
 
         Args:
-            alpha: Number to analyze
+            alpha: Number or AnalysisContext to analyze
 
         Returns:
             dict: Combined analysis results with detailed classification
         """
-        # Special case handling for well-known values
-        known_values = {
-            math.pi: {"classification": "transcendental", "name": "π"},
-            math.e: {"classification": "transcendental", "name": "e"},
-            math.sqrt(2): {"classification": "quadratic_irrational", "name": "√2"},
-            (1 + math.sqrt(5))
-            / 2: {"classification": "quadratic_irrational", "name": "φ (golden ratio)"},
-            2 ** (1 / 3): {"classification": "cubic_irrational", "name": "∛2"},
-            3 ** (1 / 3): {"classification": "cubic_irrational", "name": "∛3"},
-            1 + 2 ** (1 / 3): {"classification": "cubic_irrational", "name": "1+∛2"},
-        }
+        analysis = AnalysisContext.of(alpha, self.backend)
+        alpha = analysis.value
 
-        # Check for known values with a small tolerance
-        for value, info in known_values.items():
-            if abs(alpha - value) < 1e-10:
-                return {
-                    "classification": info["classification"],
-                    "confidence": "very_high",
-                    "method": "known_value",
-                    "value_name": info["name"],
-                }
+        # Special case handling for well-known values, with a small tolerance
+        info = KNOWN_CONSTANTS.lookup(alpha, 1e-10)
+        if info is not None:
+            return {
+                "classification": info["classification"],
+                "confidence": "very_high",
+                "method": "known_value",
+                "value_name": info["name"],
+            }
 
         # First, check for rational numbers directly
         # Try to express as a simple fraction
-        for d in range(1, 100):
-            for n in range(d + 1):
-                if abs(alpha - n / d) < 1e-10:
-                    return {
-                        "classification": "rational",
-                        "confidence": "very_high",
-                        "method": "fraction_check",
-                        "value": f"{n}/{d}",
-                    }
+        fraction = analysis.rational(max_denominator=99, tolerance=1e-10)
+        if fraction is not None and 0 <= fraction <= 1:
+            return {
+                "classification": "rational",
+                "confidence": "very_high",
+                "method": "fraction_check",
+                "value": f"{fraction.numerator}/{fraction.denominator}",
+            }
 
         # Check continued fraction - if it terminates, it's rational
-        cf = Utils.continued_fraction(alpha, max_terms=30)
+        cf = analysis.continued_fraction(30)
         if len(cf) < 30:
             return {
                 "classification": "rational",
@@ -598,7 +617,7 @@ class ComputationalMethods:
             }
 
         # Try to find a minimal polynomial
-        min_poly = Utils.find_minimal_polynomial(alpha, max_degree=4, tolerance=1e-10)
+        min_poly = analysis.minimal_polynomial(max_degree=4, tolerance=1e-10)
 
         # If we found a minimal polynomial, use its degree for classification
         if min_poly is not None:
@@ -635,13 +654,13 @@ class ComputationalMethods:
                 }
 
         # Run multiple detection methods
-        entropy_result = self.entropy_based_detection(alpha)
-        trace_result = self.trace_analysis(alpha)
-        spectral_result = self.spectral_cubic_discriminator(alpha)
+        entropy_result = self.entropy_based_detection(analysis)
+        trace_result = self.trace_analysis(analysis)
+        spectral_result = self.spectral_cubic_discriminator(analysis)
 
         # Check for polynomial evidence
-        matrix = MatrixApproach(tolerance=1e-12)
-        matrix_result = matrix.verify_cubic_irrational(alpha)
+        matrix = MatrixApproach(tolerance=1e-12, precision=self.ctx.dps)
+        matrix_result = matrix.verify_cubic_irrational(analysis)
 
         # Count votes for cubic irrationality
         cubic_votes = 0
@@ -734,123 +753,49 @@ class ComputationalMethods:
         validation to distinguish cubic irrationals from other number types.
 
         Args:
-            alpha: Number to analyze
+            alpha: Number or AnalysisContext to analyze
             freq1_threshold: Threshold for magnitude at frequency 1
             freq6_threshold: Threshold for magnitude at frequency 6
 
         Returns:
             dict: Detection results with classification and confidence level
         """
-        # Dictionary of known values for quick and accurate classification
-        known_values = {
-            # Cubic irrationals
-            2
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "∛2",
-                "confidence": "very_high",
-            },
-            3
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "∛3",
-                "confidence": "very_high",
-            },
-            5
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "∛5",
-                "confidence": "very_high",
-            },
-            7
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "∛7",
-                "confidence": "very_high",
-            },
-            1
-            + 2
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "1+∛2",
-                "confidence": "very_high",
-            },
-            3
-            * (2 ** (1 / 3)): {
-                "classification": "cubic_irrational",
-                "name": "3×∛2",
-                "confidence": "very_high",
-            },
-            # Quadratic irrationals
-            math.sqrt(2): {
-                "classification": "quadratic_irrational",
-                "name": "√2",
-                "confidence": "very_high",
-            },
-            math.sqrt(3): {
-                "classification": "quadratic_irrational",
-                "name": "√3",
-                "confidence": "very_high",
-            },
-            math.sqrt(5): {
-                "classification": "quadratic_irrational",
-                "name": "√5",
-                "confidence": "very_high",
-            },
-            (1 + math.sqrt(5))
-            / 2: {
-                "classification": "quadratic_irrational",
-                "name": "φ (golden ratio)",
-                "confidence": "very_high",
-            },
-            # Transcendental numbers
-            math.pi: {
-                "classification": "transcendental",
-                "name": "π",
-                "confidence": "very_high",
-            },
-            math.e: {
-                "classification": "transcendental",
-                "name": "e",
-                "confidence": "very_high",
-            },
-            # Rational numbers
-            22
-            / 7: {
-                "classification": "rational",
-                "name": "22/7",
-                "confidence": "very_high",
-            },
-            6
-            / 5: {
-                "classification": "rational",
-                "name": "6/5",
-                "confidence": "very_high",
-            },
-        }
+        # Computed once per context, since combined_discriminator and the
+        # solver's spectral stage both ask for it
+        analysis = AnalysisContext.of(alpha, self.backend)
+        key = ("spectral_cubic", self.ctx.prec, freq1_threshold, freq6_threshold)
+        return analysis.memoize(
+            key,
+            lambda: self._spectral_cubic_discriminator(
+                analysis, freq1_threshold, freq6_threshold
+            ),
+        )
 
-        # Check for known values with high precision
-        for value, info in known_values.items():
-            if abs(alpha - value) < 1e-10:
+    def _spectral_cubic_discriminator(self, analysis, freq1_threshold, freq6_threshold):
+        """Uncached spectral_cubic_discriminator of an AnalysisContext."""
+        alpha = analysis.value
+
+        # Check for known values, accepting slightly lower precision with
+        # lower confidence
+        info = KNOWN_CONSTANTS.lookup(alpha, 1e-8)
+        if info is not None:
+            error = abs(alpha - info["value"])
+            if error < 1e-10:
                 return {
                     "classification": info["classification"],
-                    "confidence": info["confidence"],
+                    "confidence": "very_high",
                     "method": "known_value",
                     "value_name": info["name"],
                     "is_cubic": info["classification"] == "cubic_irrational",
                 }
-
-        # Check for values very close to known values (with slightly lower precision)
-        for value, info in known_values.items():
-            if abs(alpha - value) < 1e-8:
-                return {
-                    "classification": info["classification"],
-                    "confidence": "high",  # Slightly lower confidence due to approximation
-                    "method": "near_known_value",
-                    "value_name": f"{info['name']} (approximate)",
-                    "is_cubic": info["classification"] == "cubic_irrational",
-                    "approximation_error": float(abs(alpha - value)),
-                }
+            return {
+                "classification": info["classification"],
+                "confidence": "high",  # Slightly lower confidence due to approximation
+                "method": "near_known_value",
+                "value_name": f"{info['name']} (approximate)",
+                "is_cubic": info["classification"] == "cubic_irrational",
+                "approximation_error": float(error),
+            }
 
         # Check for simple rational numbers
         # This is a more thorough check than just looking at the float value
@@ -868,22 +813,20 @@ class ComputationalMethods:
                 }
 
             # Check for simple fractions
-            for denominator in range(2, 101):
-                for numerator in range(1, denominator):
-                    fraction = numerator / denominator
-                    if abs(alpha_float - fraction) < 1e-8:
-                        return {
-                            "classification": "rational",
-                            "confidence": "very_high",
-                            "method": "fraction_check",
-                            "value": f"{numerator}/{denominator}",
-                            "is_cubic": False,
-                        }
+            fraction = analysis.rational(max_denominator=100, tolerance=1e-8)
+            if fraction is not None and 0 < fraction < 1:
+                return {
+                    "classification": "rational",
+                    "confidence": "very_high",
+                    "method": "fraction_check",
+                    "value": f"{fraction.numerator}/{fraction.denominator}",
+                    "is_cubic": False,
+                }
         except:
             pass  # Continue with spectral analysis if float conversion fails
 
         # Get continued fraction with more terms to ensure enough data for spectral analysis
-        cf = Utils.continued_fraction(alpha, max_terms=100)
+        cf = analysis.continued_fraction(100)
 
         # Ensure we have enough terms for a meaningful spectral analysis
         if len(cf) < 40:
@@ -955,7 +898,7 @@ class ComputationalMethods:
         # If spectral pattern suggests cubic, perform additional validation
         if spectral_evidence:
             # Check the candidate polynomial
-            poly = Utils.find_minimal_polynomial(alpha, max_degree=4, tolerance=1e-10)
+            poly = analysis.minimal_polynomial(max_degree=4, tolerance=1e-10)
 
             if poly is not None:
                 degree = Utils.polynomial_degree(poly)
@@ -998,8 +941,8 @@ class ComputationalMethods:
                     }
 
             # If no polynomial found, use matrix approach as additional verification
-            matrix_verifier = MatrixApproach()
-            matrix_result = matrix_verifier.verify_cubic_irrational(alpha)
+            matrix_verifier = MatrixApproach(precision=self.ctx.dps)
+            matrix_result = matrix_verifier.verify_cubic_irrational(analysis)
 
             if matrix_result["classification"] == "cubic_irrational":
                 return {
@@ -1046,7 +989,7 @@ class ComputationalMethods:
         # Identify what type of number it might be
         if period_length > 0 and period_length <= 5:
             # Short periods are typical of quadratic irrationals
-            poly = Utils.find_minimal_polynomial(alpha, max_degree=3, tolerance=1e-10)
+            poly = analysis.minimal_polynomial(max_degree=3, tolerance=1e-10)
             if poly is not None and Utils.polynomial_degree(poly) == 2:
                 return {
                     "classification": "quadratic_irrational",
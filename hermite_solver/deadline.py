@@ -0,0 +1,95 @@
+"""
+Cooperative Deadlines
+
+A classification can take anywhere from microseconds to minutes. Callers with
+a latency budget set a deadline for the current thread; the long-running loops
+of the library (HAPD iteration, continued fraction expansion, the Lyapunov
+estimate) check it between iterations and raise DeadlineExceeded once it has
+passed, which the solver's pipeline turns into a best-effort result.
+
+Deadlines are absolute time.monotonic() readings, in seconds. A thread can
+also be given a cancellation event, which stops the same loops once set.
+"""
+
+import contextlib
+import threading
+import time
+
+_state = threading.local()
+
+
+class DeadlineExceeded(Exception):
+    """Raised by check_deadline() once the active deadline has passed."""
+
+
+def make_deadline(deadline=None, budget_ms=None):
+    """
+    Combine an absolute deadline and a budget into one deadline.
+
+    Args:
+        deadline: Optional time.monotonic() reading to finish by
+        budget_ms: Optional budget in milliseconds, counted from now
+
+    Returns:
+        float: The earlier of the two, or None if neither is given
+    """
+    if budget_ms is not None:
+        budget_deadline = time.monotonic() + budget_ms / 1000
+        deadline = (
+            budget_deadline if deadline is None else min(deadline, budget_deadline)
+        )
+    return deadline
+
+
+def active_deadline():
+    """The deadline of the current thread, or None."""
+    return getattr(_state, "deadline", None)
+
+
+@contextlib.contextmanager
+def enforce(deadline):
+    """
+    Make deadline the current thread's deadline within the block.
+
+    An earlier deadline already in force is kept, so nested budgets can only
+    tighten. A deadline of None leaves the current one unchanged.
+    """
+    previous = active_deadline()
+    if previous is not None and (deadline is None or previous < deadline):
+        deadline = previous
+    _state.deadline = deadline
+    try:
+        yield deadline
+    finally:
+        _state.deadline = previous
+
+
+@contextlib.contextmanager
+def cancellable(event):
+    """Treat event being set as a passed deadline within the block."""
+    previous = getattr(_state, "cancel", None)
+    _state.cancel = event
+    try:
+        yield event
+    finally:
+        _state.cancel = previous
+
+
+def expired():
+    """True if the current thread's deadline has passed or it was cancelled."""
+    cancel = getattr(_state, "cancel", None)
+    if cancel is not None and cancel.is_set():
+        return True
+    deadline = active_deadline()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def check_deadline():
+    """
+    Raise DeadlineExceeded if the current thread's deadline has passed or
+    its cancellation event is set.
+
+    Cheap enough to call on every iteration of a loop.
+    """
+    if expired():
+        raise DeadlineExceeded
@@ -0,0 +1,72 @@
+"""
+Fixed-Point Big-Integer Arithmetic
+
+This module represents reals as Python integers scaled by 2^prec. The hot loops
+of HAPD and continued fraction expansion only need floors, multiplication by
+small integers and subtraction, which are exact on these integers, so each step
+costs a handful of bigint operations instead of several normalized mpf
+operations. Rounding happens only when a value enters the representation and
+in the reciprocal of a continued fraction step.
+"""
+
+from .precision import mp
+
+# Arithmetic backends accepted by the backend= parameters of the library
+BACKENDS = ("mpmath", "fixed")
+
+
+def check_backend(backend):
+    """
+    Validate a backend name.
+
+    Raises:
+        ValueError: If the backend is not one of BACKENDS
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+
+
+class FixedPoint:
+    """Conversion between reals and integers scaled by 2^prec."""
+
+    def __init__(self, prec=None):
+        """
+        Initialize the representation.
+
+        Args:
+            prec: Number of fractional bits; defaults to the current mpmath precision
+        """
+        self.prec = mp.prec if prec is None else prec
+        self.one = 1 << self.prec
+
+    def from_real(self, x):
+        """
+        Round a real to the nearest scaled integer.
+
+        Args:
+            x: Float, mpf or decimal string
+
+        Returns:
+            int: round(x * 2^prec)
+        """
+        sign, man, exp, _ = mp.mpf(x)._mpf_
+        shift = exp + self.prec
+        if shift >= 0:
+            n = man << shift
+        else:
+            n = (man + (1 << (-shift - 1))) >> -shift
+        return -n if sign else n
+
+    def to_mpf(self, n):
+        """Convert a scaled integer to an mpf at the current precision."""
+        return mp.mpf((n, -self.prec))
+
+    def truncate(self, n):
+        """Integer part of a scaled integer, rounded toward zero like int()."""
+        return n >> self.prec if n >= 0 else -((-n) >> self.prec)
+
+    def reciprocal(self, n):
+        """Scaled integer nearest to 1 / x for a nonzero scaled integer n."""
+        if n < 0:
+            return -self.reciprocal(-n)
+        return ((self.one << (self.prec + 1)) + n) // (2 * n)
@@ -0,0 +1,136 @@
+"""
+Half-GCD Partial Quotients
+
+This module computes the partial quotients of a rational p/q with a
+Schönhage-style half-GCD recursion. The leading quotients of a pair of large
+integers are found from the leading halves of their bits, and the resulting
+2x2 matrix is applied to the full pair in one multiplication, so the whole
+expansion costs O(M(n) log n) instead of the O(n^2) of the Euclidean algorithm.
+
+Matrices are tuples (m11, m12, m21, m22) with determinant ±1 and
+(a, b) = M (c, d), where (c, d) is the remainder pair reached after the
+quotients that M accumulates.
+"""
+
+# Below this many bits the plain Euclidean algorithm is faster
+_CUTOFF_BITS = 1024
+
+_IDENTITY = (1, 0, 0, 1)
+
+
+def _euclid(a, b, stop_bits=None, track=True):
+    """
+    Run the Euclidean algorithm until the remainder drops below 2^stop_bits.
+
+    Returns:
+        tuple: (quotients, matrix, c, d); the matrix is the identity if not tracked
+    """
+    quotients = []
+    m11, m12, m21, m22 = _IDENTITY
+    limit = 1 << stop_bits if stop_bits is not None else 1
+    while b and b >= limit:
+        q, r = divmod(a, b)
+        quotients.append(q)
+        a, b = b, r
+        if track:
+            m11, m12 = m11 * q + m12, m11
+            m21, m22 = m21 * q + m22, m21
+    return quotients, (m11, m12, m21, m22), a, b
+
+
+def _multiply(m, n):
+    a, b, c, d = m
+    e, f, g, h = n
+    return (a * e + b * g, a * f + b * h, c * e + d * g, c * f + d * h)
+
+
+def _apply_inverse(m, a, b):
+    """Return (c, d) with (a, b) = M (c, d)."""
+    m11, m12, m21, m22 = m
+    c = m22 * a - m12 * b
+    d = m11 * b - m21 * a
+    if m11 * m22 - m12 * m21 == 1:
+        return c, d
+    return -c, -d
+
+
+def _repair(quotients, m, c, d):
+    """
+    Drop trailing quotients until (c, d) is a valid remainder pair.
+
+    Quotients found from truncated operands can overshoot. With all quotients
+    at least 1, they are exactly the leading quotients of a/b if and only if
+    the final pair satisfies c > d >= 0.
+    """
+    while quotients and not c > d >= 0:
+        q = quotients.pop()
+        c, d = q * c + d, c
+        m11, m12, m21, m22 = m
+        m = (m12, m11 - q * m12, m22, m21 - q * m22)
+    return quotients, m, c, d
+
+
+def _half_gcd(a, b):
+    """
+    Leading quotients of a/b that reduce the pair to about half of a's bits.
+
+    Args:
+        a, b: Integers with a > b >= 0
+
+    Returns:
+        tuple: (quotients, matrix, c, d) with (a, b) = M (c, d) and c > d >= 0
+    """
+    n = a.bit_length()
+    half = n // 2
+    if b < (1 << half):
+        return [], _IDENTITY, a, b
+    if n <= _CUTOFF_BITS:
+        return _euclid(a, b, half)
+
+    # The top half of the bits determines the first quarter of the reduction
+    quotients, m, _, _ = _half_gcd(a >> half, b >> half)
+    c, d = _apply_inverse(m, a, b)
+    quotients, m, c, d = _repair(quotients, m, c, d)
+    if d < (1 << half):
+        return quotients, m, c, d
+
+    # One plain step, then the top of the remaining pair gives the rest
+    q, r = divmod(c, d)
+    quotients.append(q)
+    m = _multiply(m, (q, 1, 1, 0))
+    c, d = d, r
+    if d < (1 << half):
+        return quotients, m, c, d
+
+    shift = max(0, 2 * half - c.bit_length())
+    tail, m2, _, _ = _half_gcd(c >> shift, d >> shift)
+    e, f = _apply_inverse(m2, c, d)
+    tail, m2, e, f = _repair(tail, m2, e, f)
+    return quotients + tail, _multiply(m, m2), e, f
+
+
+def partial_quotients(p, q):
+    """
+    All partial quotients of the rational p/q.
+
+    Args:
+        p: Nonnegative integer numerator
+        q: Positive integer denominator
+
+    Returns:
+        list: [a0, a1, ...] with p/q = a0 + 1/(a1 + 1/(...))
+    """
+    a0, r = divmod(p, q)
+    quotients = [a0]
+    a, b = q, r
+    while b:
+        if a.bit_length() <= _CUTOFF_BITS:
+            quotients.extend(_euclid(a, b, track=False)[0])
+            break
+        step, _, c, d = _half_gcd(a, b)
+        if not step:
+            q0, r0 = divmod(a, b)
+            step, c, d = [q0], b, r0
+        quotients.extend(step)
+        a, b = c, d
+    return quotients
@@ -5,82 +5,563 @@ This module implements the Hermite-like Algorithm with Projective Dual action (H
 which is a key component of the Hermite Solver for detecting cubic irrationals.
 """
 
-from mpmath import mp
+import copy
+import gzip
+import itertools
+import json
+import numpy as np
+from mpmath import libmp
+from .precision import DEFAULT_DPS, isolated_precision, mp, new_context
 from .utils import Utils
+from .analysis_context import AnalysisContext
+from .deadline import check_deadline
+from .batch_arithmetic import BATCH_TIERS
+from .number_field import NumberField
+from .known_constants import KNOWN_CONSTANTS
+from .fixed_point import FixedPoint, check_backend
 
 
+class ProjectiveFingerprintIndex:
+    """
+    Hash index over projective points for constant-time repeat lookup.
+
+    A normalized point (v1, v2, v3) is fingerprinted by the logarithms of its
+    ratios v1/v3 and v2/v3, quantized to buckets at least as wide as the largest
+    log-ratio gap that Utils.projectively_equivalent_improved accepts. Equivalent
+    points therefore land in the same or a neighbouring bucket, so probing the
+    3x3 neighbourhood finds every possible repeat. Points with a vanishing component cannot be bucketed
+    (the equivalence check ignores such components) and are returned for every
+    query, which keeps the candidate set a superset of the exact matches.
+    """
+
+    def __init__(self, tolerance, threshold=1e-100):
+        # Equivalent points have |log(v1/v3) - log(w1/w3)| <= -log(1 - tol) and
+        # twice that for the second ratio; a tolerance of 1 or more cannot be
+        # bucketed at all and degrades the index to a full scan.
+        tolerance = mp.mpf(tolerance)
+        self.width = -2 * mp.log(1 - tolerance) if tolerance < 1 else None
+        self.threshold = threshold
+        self.buckets = {}
+        self.unbucketed = []
+        self.size = 0
+
+    def fingerprint(self, v):
+        """
+        Compute the bucket key of a projective point.
+
+        Args:
+            v: (v1, v2, v3) triple
+
+        Returns:
+            tuple: Bucket key, or None if the point cannot be bucketed
+        """
+        v1, v2, v3 = v
+        if self.width is None or min(abs(v1), abs(v2), abs(v3)) <= self.threshold:
+            return None
+
+        key = []
+        for component in (v1, v2):
+            ratio = component / v3
+            key.append(ratio > 0)
+            key.append(int(mp.floor(mp.log(abs(ratio)) / self.width)))
+        return tuple(key)
+
+    def add(self, index, v):
+        """Register the point v under the given index."""
+        key = self.fingerprint(v)
+        if key is None:
+            self.unbucketed.append(index)
+        else:
+            self.buckets.setdefault(key, []).append(index)
+        self.size += 1
+
+    def candidates(self, v):
+        """
+        Find indices of stored points that may be equivalent to v.
+
+        Args:
+            v: (v1, v2, v3) triple
+
+        Returns:
+            list: Candidate indices in increasing order
+        """
+        key = self.fingerprint(v)
+        if key is None:
+            return list(range(self.size))
+
+        sign1, bucket1, sign2, bucket2 = key
+        found = list(self.unbucketed)
+        for d1 in (-1, 0, 1):
+            for d2 in (-1, 0, 1):
+                neighbour = (sign1, bucket1 + d1, sign2, bucket2 + d2)
+                found.extend(self.buckets.get(neighbour, ()))
+        return sorted(found)
+
+
+class AdaptivePrecisionStepper:
+    """
+    Advance HAPD triples at low precision with certified floor decisions.
+
+    Every HAPD step is an integer linear map, so the current triple always
+    equals M (α, α², 1) for an exact integer matrix M. The stepper works at a
+    base precision while tracking an absolute error bound for each component.
+    When a quotient v_k / v3 lies within its error bound of an integer, the
+    triple is recomputed from M at doubled precision until the floor is
+    certified, and the run then continues at the base precision.
+    """
+
+    def __init__(self, alpha, base_dps, max_dps):
+        """
+        Initialize the stepper.
+
+        Args:
+            alpha: Input value (float, mpf or decimal string); re-read at every
+                   precision the stepper escalates to
+            base_dps: Working precision in decimal digits
+            max_dps: Precision ceiling; floors still ambiguous there are taken
+                     at face value and reported as uncertified
+        """
+        self.alpha = alpha
+        self.base_dps = base_dps
+        self.max_dps = max(max_dps, base_dps)
+        self.matrix = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        self.history = []  # Precision used for each floor decision
+        self.uncertified = []  # Iterations whose floors hit max_dps
+        self.triple, self.errors = self._evaluate(base_dps)
+        self.step_start = None  # Record of the state before the latest floors()
+
+    def _evaluate(self, dps):
+        """Evaluate M (α, α², 1) at the given precision with error bounds."""
+        with mp.workdps(dps):
+            eps = mp.eps
+            a = mp.mpf(self.alpha)
+            basis = (a, a * a, mp.mpf(1))
+            basis_errors = (eps * abs(a), 3 * eps * a * a, mp.mpf(0))
+
+            triple = []
+            errors = []
+            for row in self.matrix:
+                value = mp.fsum(m * x for m, x in zip(row, basis))
+                bound = sum(
+                    abs(m) * (e + 2 * eps * abs(x))
+                    for m, x, e in zip(row, basis, basis_errors)
+                )
+                triple.append(value)
+                errors.append(bound + eps * abs(value))
+        return tuple(triple), tuple(errors)
+
+    def _certified_floors(self, triple, errors, dps):
+        """Return (a1, a2) if both floors are certain at this precision, else None."""
+        with mp.workdps(dps):
+            v3, e3 = triple[2], errors[2]
+            if abs(v3) <= e3:
+                return None
+            floors = []
+            for v, e in zip(triple[:2], errors[:2]):
+                q = v / v3
+                bound = (e + abs(q) * e3) / (abs(v3) - e3) + 2 * mp.eps * abs(q)
+                low = int(mp.floor(q - bound))
+                if low != int(mp.floor(q + bound)):
+                    return None
+                floors.append(low)
+        return tuple(floors)
+
+    def floors(self):
+        """
+        Certify the integer parts of the current triple.
+
+        Returns:
+            tuple: (a1, a2) = (floor(v1/v3), floor(v2/v3))
+        """
+        # advance() replaces rather than mutates these, so no copies are needed
+        self.step_start = (
+            self.matrix,
+            self.triple,
+            self.errors,
+            len(self.history),
+            len(self.uncertified),
+        )
+        dps = self.base_dps
+        triple, errors = self.triple, self.errors
+        while True:
+            floors = self._certified_floors(triple, errors, dps)
+            if floors is not None:
+                break
+            if dps * 2 > self.max_dps:
+                self.uncertified.append(len(self.history))
+                with mp.workdps(dps):
+                    floors = tuple(int(mp.floor(v / triple[2])) for v in triple[:2])
+                break
+            dps *= 2
+            triple, errors = self._evaluate(dps)
+
+        self.triple, self.errors = triple, errors
+        self.history.append(dps)
+        return floors
+
+    def advance(self, a1, a2):
+        """
+        Apply one HAPD step with certified integer parts at the base precision.
+
+        Returns:
+            tuple: Next triple in the sequence
+        """
+        v1, v2, v3 = self.triple
+        e1, e2, e3 = self.errors
+        with mp.workdps(self.base_dps):
+            eps = mp.eps
+            r1 = v1 - a1 * v3
+            r2 = v2 - a2 * v3
+            er1 = e1 + abs(a1) * e3 + eps * (abs(r1) + abs(a1 * v3))
+            er2 = e2 + abs(a2) * e3 + eps * (abs(r2) + abs(a2 * v3))
+            v3_new = v3 - a1 * r1 - a2 * r2
+            e3_new = (
+                e3
+                + abs(a1) * er1
+                + abs(a2) * er2
+                + 2 * eps * (abs(v3) + abs(a1 * r1) + abs(a2 * r2))
+            )
+
+            # Mirror the underflow guard of HAPD._next_iteration
+            if abs(v3_new) < 1e-50:
+                v3_new = mp.mpf(0)
+
+        row1, row2, row3 = self.matrix
+        row1 = [x - a1 * z for x, z in zip(row1, row3)]
+        row2 = [y - a2 * z for y, z in zip(row2, row3)]
+        row3 = [z - a1 * x - a2 * y for x, y, z in zip(row1, row2, row3)]
+        self.matrix = [row1, row2, row3]
+
+        self.triple = (r1, r2, v3_new)
+        self.errors = (er1, er2, e3_new)
+        return self.triple
+
+    def state(self, before_step=False):
+        """
+        Return the matrix, triple, errors and precision record.
+
+        Args:
+            before_step: If True, return the state before the latest floors()
+                         call instead of the current one
+        """
+        matrix, triple, errors = self.matrix, self.triple, self.errors
+        n_history, n_uncertified = len(self.history), len(self.uncertified)
+        if before_step:
+            matrix, triple, errors, n_history, n_uncertified = self.step_start
+        return {
+            "matrix": [list(row) for row in matrix],
+            "triple": triple,
+            "errors": errors,
+            "history": self.history[:n_history],
+            "uncertified": self.uncertified[:n_uncertified],
+        }
+
+    def restore(self, state):
+        """Restore a state returned by state()."""
+        self.matrix = [list(row) for row in state["matrix"]]
+        self.triple = tuple(state["triple"])
+        self.errors = tuple(state["errors"])
+        self.history = list(state["history"])
+        self.uncertified = list(state["uncertified"])
+
+
+class HAPDCheckpoint:
+    """
+    Serializable state of an HAPD run, used to resume or extend it later.
+
+    Triples are stored as exact mantissa/exponent pairs, so a resumed run at
+    fixed precision continues bit-for-bit where the original stopped. Files
+    are gzip-compressed JSON.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        alpha,
+        tolerance,
+        prec,
+        iteration=0,
+        triple=None,
+        pairs=None,
+        triples=None,
+        period_candidates=None,
+        equivalence_history=None,
+        alpha_input=None,
+        stepper=None,
+    ):
+        """
+        Initialize a checkpoint.
+
+        Args:
+            alpha: The input value as an mpf
+            tolerance: Tolerance of the run that wrote the checkpoint
+            prec: Working precision in bits
+            iteration: Number of completed iterations
+            triple: Triple at which the run continues
+            pairs: Pairs of the completed iterations
+            triples: Triples of the completed iterations
+            period_candidates: Period candidates found so far
+            equivalence_history: (j, i, period) equivalences found so far
+            alpha_input: Original decimal string of alpha, if it was given as one
+            stepper: AdaptivePrecisionStepper.state() of an adaptive run
+        """
+        self.alpha = alpha
+        self.tolerance = tolerance
+        self.prec = prec
+        self.iteration = iteration
+        self.triple = triple
+        self.pairs = pairs if pairs is not None else []
+        self.triples = triples if triples is not None else []
+        self.period_candidates = period_candidates or []
+        self.equivalence_history = equivalence_history or []
+        self.alpha_input = alpha_input
+        self.stepper = stepper
+
+    @staticmethod
+    def _encode(x):
+        sign, man, exp, _ = mp.mpf(x)._mpf_
+        return [-man if sign else man, exp]
+
+    @staticmethod
+    def _decode(value):
+        man, exp = value
+        return mp.make_mpf(libmp.from_man_exp(man, exp))
+
+    def to_dict(self):
+        """Convert the checkpoint to a JSON-compatible dictionary."""
+        stepper = None
+        if self.stepper is not None:
+            stepper = dict(self.stepper)
+            for key in ("triple", "errors"):
+                stepper[key] = [self._encode(v) for v in stepper[key]]
+        return {
+            "version": self.VERSION,
+            "alpha": self._encode(self.alpha),
+            "alpha_input": self.alpha_input,
+            "tolerance": self.tolerance,
+            "prec": self.prec,
+            "iteration": self.iteration,
+            "triple": [self._encode(v) for v in self.triple],
+            "pairs": [list(p) for p in self.pairs],
+            "triples": [[self._encode(v) for v in t] for t in self.triples],
+            "period_candidates": self.period_candidates,
+            "equivalence_history": [list(e) for e in self.equivalence_history],
+            "stepper": stepper,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a checkpoint from to_dict() output.
+
+        Raises:
+            ValueError: If the data was written by an incompatible version
+        """
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported checkpoint version {data.get('version')}")
+        stepper = data["stepper"]
+        if stepper is not None:
+            for key in ("triple", "errors"):
+                stepper[key] = tuple(cls._decode(v) for v in stepper[key])
+        return cls(
+            alpha=cls._decode(data["alpha"]),
+            tolerance=data["tolerance"],
+            prec=data["prec"],
+            iteration=data["iteration"],
+            triple=tuple(cls._decode(v) for v in data["triple"]),
+            pairs=[tuple(p) for p in data["pairs"]],
+            triples=[tuple(cls._decode(v) for v in t) for t in data["triples"]],
+            period_candidates=data["period_candidates"],
+            equivalence_history=[tuple(e) for e in data["equivalence_history"]],
+            alpha_input=data["alpha_input"],
+            stepper=stepper,
+        )
+
+    def save(self, path):
+        """Write the checkpoint to a gzip-compressed JSON file."""
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """Read a checkpoint written by save()."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+# Settings that determine the result of a run from the start
+_RESULT_SETTINGS = (
+    "max_iterations",
+    "tolerance",
+    "debug",
+    "adaptive_precision",
+    "initial_dps",
+    "max_dps",
+    "cycle_detection",
+    "backend",
+)
+
+
+@isolated_precision
 class HAPD:
     """
     Implementation of the Hermite-like Algorithm with Projective Dual action (HAPD).
     This algorithm characterizes cubic irrationals through periodicity in projective space.
     """
 
-    def __init__(self, max_iterations=1000, tolerance=1e-10, debug=False):
+    def __init__(
+        self,
+        max_iterations=1000,
+        tolerance=1e-10,
+        debug=False,
+        adaptive_precision=False,
+        initial_dps=20,
+        max_dps=3200,
+        cycle_detection="history",
+        backend="mpmath",
+        precision=DEFAULT_DPS,
+    ):
+        """
+        Initialize the HAPD algorithm.
+
+        Args:
+            max_iterations: Maximum number of iterations to run
+            tolerance: Tolerance for projective equivalence and termination
+            debug: If True, cross-check detected periods with a minimal polynomial
+            adaptive_precision: If True, iterate at low precision and escalate
+                                only when a floor decision cannot be certified
+            initial_dps: Working precision of adaptive runs; raised if needed so
+                         that rounding stays well below the tolerance
+            max_dps: Precision ceiling for adaptive escalation
+            cycle_detection: 'history' compares each triple with all stored
+                             triples; 'brent' uses Brent's cycle-finding
+                             algorithm with O(1) stored triples (fixed
+                             precision only)
+            backend: 'mpmath' steps on mpf triples; 'fixed' steps on integers
+                     scaled by 2^mp.prec (fixed precision, history mode only)
+            precision: Working precision in decimal digits, held in a context
+                       owned by this instance
+
+        Raises:
+            ValueError: If cycle_detection or backend is unknown, or if an
+                        option is combined with one it does not support
+        """
+        if cycle_detection not in ("history", "brent"):
+            raise ValueError(f"Unknown cycle detection mode: {cycle_detection}")
+        if cycle_detection == "brent" and adaptive_precision:
+            raise ValueError("Brent cycle detection requires fixed precision")
+        check_backend(backend)
+        if backend == "fixed" and (adaptive_precision or cycle_detection != "history"):
+            raise ValueError(
+                "The fixed backend supports fixed precision with history detection only"
+            )
+
         self.max_iterations = max_iterations
         self.tolerance = tolerance
         self.debug = debug
+        self.adaptive_precision = adaptive_precision
+        self.initial_dps = initial_dps
+        self.max_dps = max_dps
+        self.cycle_detection = cycle_detection
+        self.backend = backend
+        self.ctx = new_context(precision)
         self.min_confirmations = 3  # Minimum confirmations required for a period
 
-        # Dictionary of known cubic irrationals and their expected periods
-        self.known_cubic_irrationals = {
-            2 ** (1 / 3): {"period": 1, "preperiod": 0, "name": "∛2"},
-            3 ** (1 / 3): {"period": 1, "preperiod": 0, "name": "∛3"},
-            1 + 2 ** (1 / 3): {"period": 4, "preperiod": 0, "name": "1+∛2"},
-            # Add more known cubic irrationals as needed
-        }
+        # Known constants; entries with a 'period' short-circuit the run
+        self.known_constants = KNOWN_CONSTANTS
 
-    def run(self, alpha):
+    def run(
+        self, alpha, resume_from=None, checkpoint_path=None, checkpoint_interval=None
+    ):
         """
         Run the HAPD algorithm on the input alpha.
 
         Args:
-            alpha: A real number to analyze
+            alpha: A real number or AnalysisContext to analyze; may be None
+                   when resuming
+            resume_from: Optional HAPDCheckpoint or checkpoint file path; the run
+                         continues from the saved iteration up to max_iterations
+            checkpoint_path: Optional file to write checkpoints to. The state is
+                             saved when max_iterations is exhausted without a
+                             verdict, so the run can later be extended
+            checkpoint_interval: Optional number of iterations between periodic
+                                 checkpoints, so interrupted runs can be resumed
 
         Returns:
             dict: Results including:
                 - 'pairs': The sequence of (a1, a2) pairs
                 - 'status': 'periodic', 'terminated', or 'no_periodicity'
-                - 'preperiod': Length of preperiod (if periodic)
-                - 'period': Length of period (if periodic)
+                - 'preperiod': Length of the minimal preperiod (if periodic)
+                - 'period': Length of the minimal period (if periodic)
                 - 'classification': 'cubic_irrational', 'rational', or 'unknown'
                 - 'triples': The sequence of (v1, v2, v3) triples
         """
+        if resume_from is not None:
+            if isinstance(alpha, AnalysisContext):
+                alpha = alpha.alpha
+            if isinstance(resume_from, HAPDCheckpoint):
+                # The resumed run extends the checkpoint's lists in place
+                resume_from = copy.deepcopy(resume_from)
+            else:
+                resume_from = HAPDCheckpoint.load(resume_from)
+            return self._resume(
+                alpha, resume_from, checkpoint_path, checkpoint_interval
+            )
+
+        if isinstance(alpha, AnalysisContext) and checkpoint_path is None:
+            # Runs with the same settings share one result per context
+            key = ("hapd", self.ctx.prec) + tuple(
+                getattr(self, name) for name in _RESULT_SETTINGS
+            )
+            return alpha.memoize(key, lambda: self._run(alpha))
+        return self._run(alpha, checkpoint_path, checkpoint_interval)
+
+    def _run(self, alpha, checkpoint_path=None, checkpoint_interval=None):
+        """Run from the start; alpha is a number or an AnalysisContext."""
+        analysis = AnalysisContext.of(alpha, self.backend)
+        alpha = analysis.alpha
+
+        # Keep the caller's value so adaptive runs can re-read it at any precision
+        alpha_input = alpha
+
         # Convert to mpmath high-precision float
         alpha = mp.mpf(alpha)
 
         # Check for known cubic irrationals with high precision
-        for known_value, info in self.known_cubic_irrationals.items():
-            if abs(alpha - known_value) < 1e-10:
-                return {
-                    "pairs": [(1, 1)],  # Simplified representation
-                    "status": "periodic",
-                    "preperiod": info["preperiod"],
-                    "period": info["period"],
-                    "period_length": info["period"],
-                    "classification": "cubic_irrational",
-                    "iterations": 1,
-                    "triples": [(float(known_value), float(known_value**2), 1.0)],
-                    "note": f"Known cubic irrational: {info['name']}",
-                    "periodic": True,
-                }
+        info = self.known_constants.lookup(alpha, 1e-10, require="period")
+        if info is not None:
+            known_value = info["value"]
+            return {
+                "pairs": [(1, 1)],  # Simplified representation
+                "status": "periodic",
+                "preperiod": info["preperiod"],
+                "period": info["period"],
+                "period_length": info["period"],
+                "classification": "cubic_irrational",
+                "iterations": 1,
+                "triples": [(float(known_value), float(known_value**2), 1.0)],
+                "note": f"Known cubic irrational: {info['name']}",
+                "periodic": True,
+            }
 
         # Enhanced rational number check
         # 1. Try to express as a simple fraction
-        for d in range(1, 100):
-            for n in range(d + 1):
-                if abs(alpha - n / d) < self.tolerance:
-                    return {
-                        "pairs": [],
-                        "status": "terminated",
-                        "classification": "rational",
-                        "iterations": 0,
-                        "triples": [],
-                        "note": f"Detected rational number: {n}/{d}",
-                        "periodic": False,
-                    }
+        fraction = analysis.rational(max_denominator=99, tolerance=self.tolerance)
+        if fraction is not None and 0 <= fraction <= 1:
+            p, q = fraction.numerator, fraction.denominator
+            return {
+                "pairs": [],
+                "status": "terminated",
+                "classification": "rational",
+                "iterations": 0,
+                "triples": [],
+                "note": f"Detected rational number: {p}/{q}",
+                "periodic": False,
+            }
 
         # 2. Check continued fraction - if it terminates or has very small terms, it's likely rational
-        cf = Utils.continued_fraction(alpha, max_terms=20, tolerance=self.tolerance)
+        cf = analysis.continued_fraction(max_terms=20, tolerance=self.tolerance)
         if len(cf) < 20 or abs(alpha - float(alpha)) < self.tolerance:
             return {
                 "pairs": [],
@@ -92,42 +573,430 @@ class HAPD:
                 "periodic": False,
             }
 
-        # Initialize
-        v1 = alpha
-        v2 = alpha * alpha
-        v3 = mp.mpf(1)
+        if self.cycle_detection == "brent":
+            if checkpoint_path is not None:
+                raise ValueError("Checkpoints require history cycle detection")
+            return self._run_brent(alpha)
 
-        triples = []
+        # Consume the step generator, detecting periodicity along the way
+        stepper = self._make_stepper(alpha_input)
+        checkpoint = HAPDCheckpoint(
+            alpha,
+            self.tolerance,
+            mp.prec,
+            alpha_input=alpha_input if isinstance(alpha_input, str) else None,
+        )
+        result = self._iterate(
+            alpha,
+            self._steps(alpha, stepper),
+            stepper,
+            checkpoint,
+            checkpoint_path,
+            checkpoint_interval,
+        )
+        return self._add_precision_report(result, stepper)
+
+    def _run_brent(self, alpha):
+        """
+        Detect periodicity with Brent's cycle-finding algorithm.
+
+        Only two triples are held while searching. Once a cycle is found, the
+        exact preperiod is located by walking two triples a period apart from
+        the start, and the period is confirmed by recomputing one more cycle.
+
+        Args:
+            alpha: The input value as an mpf
+
+        Returns:
+            dict: Results as documented in run(); 'pairs' holds the preperiod
+                  followed by one period, and no triples are returned
+        """
+
+        def same(u, v):
+            return Utils.projectively_equivalent_improved(
+                Utils.normalize_vector(u), Utils.normalize_vector(v), self.tolerance
+            )
+
+        def floors(triple):
+            v1, v2, v3 = triple
+            return (int(mp.floor(v1 / v3)), int(mp.floor(v2 / v3)))
+
+        start = (alpha, alpha * alpha, mp.mpf(1))
+
+        # Find the period: the tortoise jumps to the hare at powers of two
+        power = period = 1
+        tortoise = start
+        hare = self._next_iteration(start)
+        iterations = 1
+        while not same(tortoise, hare):
+            check_deadline()
+            if mp.fabs(hare[2]) < self.tolerance:
+                return {
+                    "pairs": list(self.iter_pairs(alpha, iterations)),
+                    "status": "terminated",
+                    "classification": "rational",
+                    "iterations": iterations,
+                    "periodic": False,
+                    "cycle_detection": "brent",
+                }
+            if iterations >= self.max_iterations:
+                return {
+                    "pairs": [],
+                    "status": "no_periodicity",
+                    "classification": "likely_not_cubic",
+                    "iterations": iterations,
+                    "periodic": False,
+                    "cycle_detection": "brent",
+                }
+            if power == period:
+                tortoise = hare
+                power *= 2
+                period = 0
+            hare = self._next_iteration(hare)
+            period += 1
+            iterations += 1
+
+        # Find the preperiod: walk two triples a period apart until they meet
+        tortoise = hare = start
+        for _ in range(period):
+            hare = self._next_iteration(hare)
         pairs = []
-        period_candidates = []  # Track potential periods
+        while not same(tortoise, hare):
+            check_deadline()
+            pairs.append(floors(tortoise))
+            tortoise = self._next_iteration(tortoise)
+            hare = self._next_iteration(hare)
+        preperiod = len(pairs)
+
+        # Confirm by recomputing one full cycle from the start of the period
+        triple = tortoise
+        for _ in range(period):
+            pairs.append(floors(triple))
+            triple = self._next_iteration(triple)
+
+        if not same(triple, tortoise):
+            return {
+                "pairs": pairs,
+                "status": "potentially_periodic",
+                "classification": "potential_cubic",
+                "iterations": iterations,
+                "potential_periods": [period],
+                "periodic": False,
+                "cycle_detection": "brent",
+            }
+
+        return {
+            "pairs": pairs,
+            "status": "periodic",
+            "preperiod": preperiod,
+            "period": period,
+            "period_length": period,
+            "classification": "cubic_irrational",
+            "iterations": iterations,
+            "periodic": True,
+            "cycle_detection": "brent",
+            **self.certify_period(alpha, pairs, preperiod, period),
+        }
+
+    def _resume(self, alpha, checkpoint, checkpoint_path, checkpoint_interval):
+        """
+        Continue a run from a checkpoint.
+
+        Raises:
+            ValueError: If the checkpoint belongs to another alpha or tolerance
+        """
+        if checkpoint.tolerance != self.tolerance:
+            raise ValueError(
+                f"Checkpoint tolerance {checkpoint.tolerance} does not match {self.tolerance}"
+            )
+
+        with mp.workprec(checkpoint.prec):
+            if alpha is not None and mp.mpf(alpha) != checkpoint.alpha:
+                raise ValueError("Checkpoint was written for a different alpha")
+            alpha = checkpoint.alpha
+
+            stepper = self._make_stepper(checkpoint.alpha_input or alpha)
+            start = checkpoint.triple
+            if stepper is not None and checkpoint.stepper is not None:
+                stepper.restore(checkpoint.stepper)
+                start = stepper.triple
+
+            result = self._iterate(
+                alpha,
+                self._steps(alpha, stepper, start),
+                stepper,
+                checkpoint,
+                checkpoint_path,
+                checkpoint_interval,
+            )
+        return self._add_precision_report(result, stepper)
+
+    @staticmethod
+    def _add_precision_report(result, stepper):
+        """Add the precision statistics of an adaptive run to its result."""
+        if stepper is not None:
+            result["precision_per_iteration"] = stepper.history
+            result["max_precision"] = max(stepper.history, default=stepper.base_dps)
+            result["uncertified_iterations"] = stepper.uncertified
+        return result
+
+    def iter_triples(self, alpha, max_iterations=None):
+        """
+        Lazily yield the HAPD triples of alpha.
+
+        No triples or pairs are retained, so memory use is constant and the
+        caller decides when to stop (e.g. with itertools.islice or its own
+        period detector). The rational and known-value pre-checks of run()
+        are skipped; iteration starts directly from (alpha, alpha^2, 1).
+
+        Args:
+            alpha: A real number to analyze
+            max_iterations: Optional cap on the number of triples; None runs
+                            until the algorithm terminates
+
+        Yields:
+            tuple: Successive (v1, v2, v3) triples
+        """
+        for triple, _, _ in self._bounded_steps(alpha, max_iterations):
+            yield triple
+
+    def iter_pairs(self, alpha, max_iterations=None):
+        """
+        Lazily yield the HAPD pairs (a1, a2) of alpha.
+
+        Same semantics as iter_triples(); the k-th pair is the integer part of
+        the k-th triple, so the stream matches the 'pairs' entry of run().
+
+        Args:
+            alpha: A real number to analyze
+            max_iterations: Optional cap on the number of pairs; None runs
+                            until the algorithm terminates
+
+        Yields:
+            tuple: Successive (a1, a2) pairs
+        """
+        for _, pair, _ in self._bounded_steps(alpha, max_iterations, raw=True):
+            yield pair
+
+    def _bounded_steps(self, alpha, max_iterations, raw=False):
+        """
+        Step generator that stops at termination or after max_iterations.
+
+        With raw=True and the fixed backend, triples are left as scaled integers.
+        """
+        if raw and self.backend == "fixed":
+            fixed = FixedPoint()
+            steps = self._fixed_steps(mp.mpf(alpha), fixed)
+            limit = max(fixed.from_real(self.tolerance), 1)
+        else:
+            steps = self._steps(mp.mpf(alpha), self._make_stepper(alpha))
+            limit = self.tolerance
+        if max_iterations is not None:
+            steps = itertools.islice(steps, max_iterations)
+        for step in steps:
+            yield step
+            if abs(step[2][2]) < limit:
+                return
+
+    def _make_stepper(self, alpha):
+        """Create the adaptive stepper for alpha, or None at fixed precision."""
+        if not self.adaptive_precision:
+            return None
+        base_dps = max(self.initial_dps, int(-mp.log10(self.tolerance)) + 5)
+        return AdaptivePrecisionStepper(alpha, base_dps, self.max_dps)
+
+    def _steps(self, alpha, stepper=None, start=None):
+        """
+        Generate HAPD steps without bound.
+
+        Args:
+            alpha: The input value as an mpf
+            stepper: Optional AdaptivePrecisionStepper that certifies floors and
+                     advances triples in place of _next_iteration
+            start: Optional triple to start from instead of (alpha, alpha^2, 1)
+
+        Yields:
+            tuple: (triple, (a1, a2), next_triple) for each iteration
+        """
+        if self.backend == "fixed":
+            fixed = FixedPoint()
+            triple = None
+            for raw, pair, raw_next in self._fixed_steps(alpha, fixed, start):
+                if triple is None:
+                    triple = tuple(fixed.to_mpf(v) for v in raw)
+                next_triple = tuple(fixed.to_mpf(v) for v in raw_next)
+                yield triple, pair, next_triple
+                triple = next_triple
+            return
+
+        if start is not None:
+            triple = start
+        elif stepper is not None:
+            triple = stepper.triple
+        else:
+            triple = (alpha, alpha * alpha, mp.mpf(1))
+
+        while True:
+            check_deadline()
+            if stepper is not None:
+                pair = stepper.floors()
+                next_triple = stepper.advance(*pair)
+            else:
+                v1, v2, v3 = triple
+                pair = (int(mp.floor(v1 / v3)), int(mp.floor(v2 / v3)))
+                next_triple = self._next_iteration(triple, pair)
+            yield triple, pair, next_triple
+            triple = next_triple
+
+    def _fixed_steps(self, alpha, fixed, start=None):
+        """
+        Generate HAPD steps on fixed-point integers without bound.
+
+        After the starting triple is rounded, every step is exact integer
+        arithmetic: floor division, multiplication by the integer parts and
+        subtraction.
+
+        Args:
+            alpha: The input value as an mpf
+            fixed: FixedPoint representation to work in
+            start: Optional triple to start from instead of (alpha, alpha^2, 1)
+
+        Yields:
+            tuple: (triple, (a1, a2), next_triple) as scaled integers
+        """
+        if start is None:
+            start = (alpha, alpha * alpha, 1)
+        v1, v2, v3 = (fixed.from_real(v) for v in start)
+        guard = fixed.from_real(1e-50)  # Underflow guard of _next_iteration
+
+        while True:
+            check_deadline()
+            a1 = v1 // v3
+            a2 = v2 // v3
+            r1 = v1 - a1 * v3
+            r2 = v2 - a2 * v3
+            v3_new = v3 - a1 * r1 - a2 * r2
+            if abs(v3_new) < guard:
+                v3_new = 0
+            yield (v1, v2, v3), (a1, a2), (r1, r2, v3_new)
+            v1, v2, v3 = r1, r2, v3_new
+
+    def _minimal_cycle(self, normalized, preperiod, period):
+        """
+        Reduce a detected cycle to its shortest period and preperiod.
+
+        The first repeat found may span several turns of the cycle and start
+        after the cycle does. Reducing it makes history runs report the same
+        cycle as Brent runs.
+
+        Args:
+            normalized: Normalized triples of the run, ending with the repeat
+            preperiod: Index of the triple the repeat matched
+            period: Number of steps between the two
+
+        Returns:
+            tuple: (preperiod, period) of the minimal cycle
+        """
+
+        def repeats(k, p):
+            return Utils.projectively_equivalent_improved(
+                normalized[k], normalized[k + p], self.tolerance
+            )
+
+        for p in range(1, period):
+            if period % p == 0 and all(
+                repeats(k, p) for k in range(preperiod, len(normalized) - p)
+            ):
+                period = p
+                break
+        while preperiod > 0 and repeats(preperiod - 1, period):
+            preperiod -= 1
+        return preperiod, period
+
+    def _iterate(
+        self,
+        alpha,
+        steps,
+        stepper=None,
+        checkpoint=None,
+        checkpoint_path=None,
+        checkpoint_interval=None,
+    ):
+        """
+        Consume HAPD steps and detect periodicity.
+
+        Args:
+            alpha: The input value as an mpf
+            steps: Iterator of (triple, pair, next_triple) as produced by _steps()
+            stepper: The AdaptivePrecisionStepper behind steps, if any
+            checkpoint: Optional HAPDCheckpoint whose state the run continues;
+                        its lists are extended in place
+            checkpoint_path: Optional file to save checkpoints to
+            checkpoint_interval: Optional number of iterations between saves
+
+        Returns:
+            dict: Results as documented in run()
+        """
+        if checkpoint is None:
+            checkpoint = HAPDCheckpoint(alpha, self.tolerance, mp.prec)
+        start = checkpoint.iteration
+        triples = checkpoint.triples
+        pairs = checkpoint.pairs
+        period_candidates = checkpoint.period_candidates  # Track potential periods
+
+        # Normalized once, when the triple is stored
+        normalized_triples = [Utils.normalize_vector(t) for t in triples]
+
+        # Fingerprint index over stored triples for O(1) candidate lookup
+        fingerprints = ProjectiveFingerprintIndex(self.tolerance)
+        for j, norm in enumerate(normalized_triples):
+            fingerprints.add(j, norm)
+        current_norm = None
 
         # Keep history of equivalence checks to prevent false positives due to numerical drift
-        equivalence_history = []
+        equivalence_history = checkpoint.equivalence_history
 
         # Track the last few triples for consistency checks
-        recent_triples = []
         max_recent = 5  # Number of recent triples to track
+        recent_triples = triples[-max_recent:]
+
+        def save_checkpoint(iteration, triple):
+            checkpoint.iteration = iteration
+            checkpoint.triple = triple
+            if stepper is not None:
+                # The stepper runs one step ahead of the loop while iterating
+                ahead = len(stepper.history) > iteration
+                checkpoint.stepper = stepper.state(before_step=ahead)
+            checkpoint.save(checkpoint_path)
+
+        resume_point = (start, checkpoint.triple)
+        for i, (current_triple, (a1, a2), next_triple) in zip(
+            range(start, self.max_iterations), steps
+        ):
+            if (
+                checkpoint_path is not None
+                and checkpoint_interval
+                and i > start
+                and (i - start) % checkpoint_interval == 0
+            ):
+                save_checkpoint(i, current_triple)
 
-        for i in range(self.max_iterations):
             # Store current triple
-            current_triple = (v1, v2, v3)
+            if current_norm is None:
+                current_norm = Utils.normalize_vector(current_triple)
             triples.append(current_triple)
+            normalized_triples.append(current_norm)
+            fingerprints.add(i, current_norm)
 
             # Update recent triples
             recent_triples.append(current_triple)
             if len(recent_triples) > max_recent:
                 recent_triples.pop(0)
 
-            # Compute integer parts
-            a1 = int(mp.floor(v1 / v3))
-            a2 = int(mp.floor(v2 / v3))
-
             # Store the pair (a1, a2)
             pairs.append((a1, a2))
-
-            # Get next triple
-            next_triple = self._next_iteration(current_triple)
             v1, v2, v3 = next_triple
+            resume_point = (i + 1, next_triple)
 
             # Check for termination (likely rational)
             if mp.fabs(v3) < self.tolerance:
@@ -142,10 +1011,13 @@ class HAPD:
 
             # Create normalized triple
             triple_norm = Utils.normalize_vector(next_triple)
+            current_norm = triple_norm
 
-            # Enhanced periodicity detection with multiple confirmations
-            for j in range(len(triples)):
-                prev_triple_norm = Utils.normalize_vector(triples[j])
+            # Enhanced periodicity detection with multiple confirmations.
+            # Only triples sharing a fingerprint bucket can be equivalent, so
+            # the exact check below runs on a handful of candidates.
+            for j in fingerprints.candidates(triple_norm):
+                prev_triple_norm = normalized_triples[j]
 
                 # Use improved projective equivalence check for better numerical stability
                 is_equivalent = Utils.projectively_equivalent_improved(
@@ -218,9 +1090,9 @@ class HAPD:
                                                 recent_norm = Utils.normalize_vector(
                                                     recent_triples[idx]
                                                 )
-                                                expected_norm = Utils.normalize_vector(
-                                                    triples[preperiod + idx]
-                                                )
+                                                expected_norm = normalized_triples[
+                                                    preperiod + idx
+                                                ]
                                                 if not Utils.projectively_equivalent_improved(
                                                     recent_norm,
                                                     expected_norm,
@@ -233,6 +1105,11 @@ class HAPD:
                                             # Continue searching if recent triples aren't consistent
                                             continue
 
+                                    preperiod, period = self._minimal_cycle(
+                                        normalized_triples + [triple_norm],
+                                        preperiod,
+                                        period,
+                                    )
                                     return {
                                         "pairs": pairs,
                                         "status": "periodic",
@@ -244,6 +1121,9 @@ class HAPD:
                                         "confirmations": candidate["confirmations"],
                                         "triples": triples,
                                         "periodic": True,
+                                        **self.certify_period(
+                                            alpha, pairs, preperiod, period
+                                        ),
                                     }
                             found = True
                             break
@@ -252,6 +1132,9 @@ class HAPD:
                         period_candidates.append({"period": period, "confirmations": 1})
 
         # If we reach here, no strong periodicity was detected
+        if checkpoint_path is not None:
+            save_checkpoint(*resume_point)
+
         # Check if we have any candidates with at least 2 confirmations
         strong_candidates = [c for c in period_candidates if c["confirmations"] >= 2]
 
@@ -288,6 +1171,222 @@ class HAPD:
             "periodic": False,
         }
 
+    def run_exact(self, polynomial, root=None):
+        """
+        Run the HAPD algorithm exactly in the number field of a known polynomial.
+
+        Each triple is carried as exact elements of Q(α) over the basis 1, α, α²,
+        floors are certified with a rational isolating interval for α, and a
+        period is detected when a triple's canonical projective form repeats. No
+        tolerance or precision setting is involved.
+
+        Args:
+            polynomial: Integer coefficients of the minimal polynomial of alpha,
+                        highest degree first (e.g. [1, 0, -1, -1])
+            root: Optional approximation selecting which real root is alpha;
+                  defaults to the largest real root
+
+        Returns:
+            dict: Results with the same keys as run(); triples are given as
+                  coefficient tuples over the power basis of Q(α)
+        """
+        field = NumberField(polynomial, root)
+        classification = {
+            1: "rational",
+            2: "quadratic_irrational",
+            3: "cubic_irrational",
+        }.get(field.degree, "higher_degree_algebraic")
+
+        v = (field.alpha, field.mul(field.alpha, field.alpha), field.one)
+        seen = {}  # Canonical projective form -> iteration index
+        triples = []
+        pairs = []
+
+        for i in range(self.max_iterations + 1):
+            if field.is_zero(v[2]):
+                return {
+                    "pairs": pairs,
+                    "status": "terminated",
+                    "classification": "rational",
+                    "iterations": i,
+                    "triples": triples,
+                    "periodic": False,
+                    "exact": True,
+                    "polynomial": field.coeffs,
+                }
+
+            key = field.projective_key(v)
+            if key in seen:
+                preperiod = seen[key]
+                period = i - preperiod
+                return {
+                    "pairs": pairs,
+                    "status": "periodic",
+                    "preperiod": preperiod,
+                    "period": period,
+                    "period_length": period,
+                    "classification": classification,
+                    "iterations": i,
+                    "triples": triples,
+                    "periodic": True,
+                    "exact": True,
+                    "polynomial": field.coeffs,
+                }
+            if i == self.max_iterations:
+                break
+            seen[key] = i
+            triples.append(v)
+
+            a1 = field.floor_ratio(v[0], v[2])
+            a2 = field.floor_ratio(v[1], v[2])
+            pairs.append((a1, a2))
+            v = self._next_exact_iteration(field, v, a1, a2)
+
+        return {
+            "pairs": pairs,
+            "status": "no_periodicity",
+            "classification": "likely_not_cubic",
+            "iterations": self.max_iterations,
+            "triples": triples,
+            "periodic": False,
+            "exact": True,
+            "polynomial": field.coeffs,
+        }
+
+    def run_batch(self, alphas, precision="double-double", max_period=20):
+        """
+        Run HAPD on many inputs at once as a fast first-pass filter.
+
+        All triples advance in lockstep as NumPy arrays. Lanes whose v3 falls
+        below the tolerance are masked out as terminated, and lanes whose
+        quotients grow too large for the arithmetic tier are masked out as
+        overflowed. Candidate periods are read off the tail of each surviving
+        lane's pair sequence. Only surviving lanes need the full run().
+
+        Memory does not grow with max_iterations: each lane keeps its latest
+        2 * max_period pairs in a ring buffer, and for every candidate period
+        the last step whose pair broke it.
+
+        Args:
+            alphas: Sequence of real inputs (floats, mpf or decimal strings)
+            precision: 'float64' or 'double-double'
+            max_period: Largest candidate period to look for
+
+        Returns:
+            dict: Results including:
+                - 'pairs': int64 array of shape (n, window, 2) with the last
+                  min(lengths, window) pairs of each lane, oldest first, where
+                  window is min(max_iterations, 2 * max_period)
+                - 'lengths': Number of pairs each lane produced
+                - 'terminated': Lanes that terminated (likely rational)
+                - 'overflowed': Lanes that left the tier's exact range
+                - 'candidate_period': Candidate period per lane (0 if none)
+                - 'candidate_preperiod': Start of the periodic tail (-1 if none)
+                - 'survivors': Lanes that should go on to run()
+        """
+        if precision not in BATCH_TIERS:
+            raise ValueError(
+                f"Unknown precision '{precision}', expected one of {list(BATCH_TIERS)}"
+            )
+        arith = BATCH_TIERS[precision]
+
+        alpha = arith.from_values(alphas)
+        n = len(alpha[0])
+        iterations = self.max_iterations
+        # The tolerance cannot be finer than the tier's rounding noise
+        tolerance = max(self.tolerance, 64 * arith.eps)
+        limit = 2.0**50  # Quotients beyond this are no longer exact integers
+
+        v1 = alpha
+        v2 = arith.mul(alpha, alpha)
+        v3 = arith.constant(1, n)
+
+        # Periods are read off the last half of a run, so longer ones cannot
+        # repeat there even once
+        tail = iterations // 2
+        periods = np.arange(1, min(max_period, iterations - tail) + 1)
+        window = max(1, min(iterations, 2 * max_period))
+        # Lanes run along the last axis so that every access is contiguous
+        ring = np.zeros((window, 2, n))
+        # Last step whose pair differs from the one each period before it
+        last_mismatch = np.full((len(periods), n), -1, dtype=np.int64)
+
+        lengths = np.zeros(n, dtype=np.int64)
+        active = np.ones(n, dtype=bool)
+        terminated = np.zeros(n, dtype=bool)
+        overflowed = np.zeros(n, dtype=bool)
+
+        with np.errstate(all="ignore"):
+            for i in range(iterations):
+                if not active.any():
+                    break
+
+                a1 = arith.floor_div(v1, v3)
+                a2 = arith.floor_div(v2, v3)
+                out_of_range = ~(
+                    np.isfinite(a1)
+                    & np.isfinite(a2)
+                    & (np.abs(a1) < limit)
+                    & (np.abs(a2) < limit)
+                )
+                overflowed |= active & out_of_range
+                active &= ~out_of_range
+                # Keep masked lanes finite so they cannot poison later steps
+                a1 = np.where(active, a1, 0.0)
+                a2 = np.where(active, a2, 0.0)
+
+                for row, period in enumerate(periods[:i]):
+                    previous = ring[(i - period) % window]
+                    mismatch = (previous[0] != a1) | (previous[1] != a2)
+                    np.copyto(last_mismatch[row], i, where=mismatch & active)
+                np.copyto(ring[i % window], (a1, a2), where=active)
+                lengths += active
+
+                r1 = arith.sub_scaled(v1, a1, v3)
+                r2 = arith.sub_scaled(v2, a2, v3)
+                v3_new = arith.sub_scaled(arith.sub_scaled(v3, a1, r1), a2, r2)
+                v1, v2 = r1, r2
+                v3 = arith.where(active, v3_new, v3)
+
+                ended = active & (np.abs(arith.to_float(v3)) < tolerance)
+                terminated |= ended
+                active &= ~ended
+
+        # Candidate periods from the tail of lanes that ran to completion
+        candidate_period = np.zeros(n, dtype=np.int64)
+        candidate_preperiod = np.full(n, -1, dtype=np.int64)
+        full = lengths == iterations
+        for row, period in enumerate(periods):
+            lanes = np.flatnonzero(
+                full
+                & (candidate_period == 0)
+                & (last_mismatch[row] < iterations - tail)
+            )
+            candidate_period[lanes] = period
+            # The preperiod ends after the last pair that breaks the pattern
+            candidate_preperiod[lanes] = np.maximum(
+                last_mismatch[row, lanes] - period + 1, 0
+            )
+
+        # Unroll the ring buffers, oldest pair first
+        kept = np.minimum(lengths, window)
+        offsets = np.arange(window)
+        positions = (lengths - kept)[:, None] + offsets
+        ring = ring.astype(np.int64).transpose(2, 0, 1)
+        pairs = np.take_along_axis(ring, (positions % window)[:, :, None], axis=1)
+        pairs[offsets >= kept[:, None]] = 0
+
+        return {
+            "pairs": pairs,
+            "lengths": lengths,
+            "terminated": terminated,
+            "overflowed": overflowed,
+            "candidate_period": candidate_period,
+            "candidate_preperiod": candidate_preperiod,
+            "survivors": ~terminated,
+            "precision": arith.name,
+        }
+
     def encoding_function(self, a1, a2):
         """
         Encode a pair of integers as a single natural number.
@@ -306,12 +1405,254 @@ class HAPD:
         """Convert a sequence of pairs into an encoded sequence."""
         return [self.encoding_function(a1, a2) for a1, a2 in pairs]
 
-    def _next_iteration(self, triple):
+    @staticmethod
+    def step_matrix(a1, a2):
+        """
+        Integer matrix of one HAPD step with integer parts (a1, a2).
+
+        The step maps (v1, v2, v3) to S (v1, v2, v3); S has determinant 1.
+        """
+        return [[1, 0, -a1], [0, 1, -a2], [-a1, -a2, 1 + a1 * a1 + a2 * a2]]
+
+    @staticmethod
+    def _matrix_multiply(a, b):
+        return [
+            [sum(a[i][k] * b[k][j] for k in range(3)) for j in range(3)]
+            for i in range(3)
+        ]
+
+    @classmethod
+    def _matrix_power(cls, m, n):
+        result = [[int(i == j) for j in range(3)] for i in range(3)]
+        while n:
+            if n & 1:
+                result = cls._matrix_multiply(m, result)
+            m = cls._matrix_multiply(m, m)
+            n >>= 1
+        return result
+
+    @staticmethod
+    def _adjugate(m):
+        """Adjugate of a 3x3 matrix, which is its inverse when det(m) = 1."""
+        return [
+            [
+                m[(j + 1) % 3][(i + 1) % 3] * m[(j + 2) % 3][(i + 2) % 3]
+                - m[(j + 1) % 3][(i + 2) % 3] * m[(j + 2) % 3][(i + 1) % 3]
+                for j in range(3)
+            ]
+            for i in range(3)
+        ]
+
+    @classmethod
+    def pairs_matrix(cls, pairs):
+        """
+        Accumulated integer matrix of a sequence of HAPD steps.
+
+        Args:
+            pairs: Sequence of (a1, a2) pairs in iteration order
+
+        Returns:
+            list: 3x3 integer matrix M with triple_n = M (v1, v2, v3)_0
+        """
+        result = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        for a1, a2 in pairs:
+            # Left-multiplying by the step matrix is a pair of row operations
+            row1, row2, row3 = result
+            row1 = [x - a1 * z for x, z in zip(row1, row3)]
+            row2 = [y - a2 * z for y, z in zip(row2, row3)]
+            row3 = [z - a1 * x - a2 * y for x, y, z in zip(row1, row2, row3)]
+            result = [row1, row2, row3]
+        return result
+
+    @staticmethod
+    def characteristic_polynomial(m):
+        """
+        Characteristic polynomial det(xI - m) of a 3x3 integer matrix.
+
+        Returns:
+            list: Integer coefficients, highest degree first
+        """
+        trace = m[0][0] + m[1][1] + m[2][2]
+        minors = sum(
+            m[i][i] * m[j][j] - m[i][j] * m[j][i] for i, j in ((0, 1), (0, 2), (1, 2))
+        )
+        det = (
+            m[0][0] * (m[1][1] * m[2][2] - m[1][2] * m[2][1])
+            - m[0][1] * (m[1][0] * m[2][2] - m[1][2] * m[2][0])
+            + m[0][2] * (m[1][0] * m[2][1] - m[1][1] * m[2][0])
+        )
+        return [1, -trace, minors, -det]
+
+    def matrix_at(self, result, n):
+        """
+        Accumulated step matrix after n iterations of a periodic run.
+
+        Iterations beyond the computed pairs are reached by powering the
+        period matrix, so n can be arbitrarily large.
+
+        Args:
+            result: A periodic result of run()
+            n: Number of iterations
+
+        Returns:
+            list: 3x3 integer matrix M_n with triple_n = M_n (alpha, alpha^2, 1)
+        """
+        pairs = result["pairs"]
+        preperiod, period = result["preperiod"], result["period"]
+        if n <= preperiod + period:
+            return self.pairs_matrix(pairs[:n])
+
+        cycles, offset = divmod(n - preperiod, period)
+        cycle = pairs[preperiod : preperiod + period]
+        m = self._matrix_power(self.pairs_matrix(cycle), cycles)
+        m = self._matrix_multiply(m, self.pairs_matrix(pairs[:preperiod]))
+        return self._matrix_multiply(self.pairs_matrix(cycle[:offset]), m)
+
+    def jump(self, alpha, result, n):
+        """
+        Compute the triple after n iterations without iterating.
+
+        Args:
+            alpha: The input value of the periodic run
+            result: A periodic result of run() for alpha
+            n: Number of iterations
+
+        Returns:
+            tuple: (v1, v2, v3) after n iterations
+        """
+        alpha = mp.mpf(alpha)
+        basis = (alpha, alpha * alpha, mp.mpf(1))
+        return tuple(
+            mp.fsum(c * x for c, x in zip(row, basis))
+            for row in self.matrix_at(result, n)
+        )
+
+    def certify_period(self, alpha, pairs, preperiod, period):
+        """
+        Certify a detected period with the integer step matrices.
+
+        With M the preperiod matrix and P the period matrix, the period holds
+        exactly when P fixes the projective point M (alpha, alpha^2, 1) and
+        the floors along the way are the reported pairs. If P is the identity
+        this needs only certified floors. Otherwise Q = M^-1 P M fixes
+        (alpha, alpha^2, 1), which forces
+
+            q32 x^3 + (q31 - q12) x^2 + (q33 - q11) x - q13 = 0,
+
+        and the period is verified exactly in the number field of that
+        polynomial's factor vanishing at alpha.
+
+        Args:
+            alpha: The input value as an mpf
+            pairs: Pairs of the run, covering at least preperiod + period steps
+            preperiod: Detected preperiod
+            period: Detected period
+
+        Returns:
+            dict: 'certified' (bool), 'certificate' ('identity_period',
+                  'number_field' or None), 'preperiod_matrix', 'period_matrix',
+                  'characteristic_polynomial' and 'minimal_polynomial' (set
+                  only by a number-field certificate)
+        """
+        segment = pairs[: preperiod + period]
+        pre_matrix = self.pairs_matrix(segment[:preperiod])
+        period_matrix = self.pairs_matrix(segment[preperiod:])
+        certificate = {
+            "certified": False,
+            "certificate": None,
+            "preperiod_matrix": pre_matrix,
+            "period_matrix": period_matrix,
+            "characteristic_polynomial": self.characteristic_polynomial(period_matrix),
+            "minimal_polynomial": None,
+        }
+        if len(segment) < preperiod + period:
+            return certificate
+
+        if period_matrix == [[1, 0, 0], [0, 1, 0], [0, 0, 1]]:
+            if self._floors_certified(alpha, segment):
+                certificate["certified"] = True
+                certificate["certificate"] = "identity_period"
+            return certificate
+
+        q = self._matrix_multiply(
+            self._adjugate(pre_matrix), self._matrix_multiply(period_matrix, pre_matrix)
+        )
+        poly = [q[2][1], q[2][0] - q[0][1], q[2][2] - q[0][0], -q[0][2]]
+        while poly and poly[0] == 0:
+            poly.pop(0)
+        if len(poly) < 2:
+            return certificate
+
+        factor = self._factor_at(poly, alpha)
+        try:
+            field = NumberField(factor, root=alpha)
+        except ValueError:
+            return certificate
+        if abs(field.to_mpf(field.alpha) - alpha) > self.tolerance:
+            return certificate
+
+        v = (field.alpha, field.mul(field.alpha, field.alpha), field.one)
+        start_key = None
+        for i, pair in enumerate(segment):
+            if field.is_zero(v[2]):
+                return certificate
+            if i == preperiod:
+                start_key = field.projective_key(v)
+            a1 = field.floor_ratio(v[0], v[2])
+            a2 = field.floor_ratio(v[1], v[2])
+            if (a1, a2) != tuple(pair):
+                return certificate
+            v = self._next_exact_iteration(field, v, a1, a2)
+
+        if not field.is_zero(v[2]) and field.projective_key(v) == start_key:
+            certificate["certified"] = True
+            certificate["certificate"] = "number_field"
+            certificate["minimal_polynomial"] = factor
+        return certificate
+
+    def _floors_certified(self, alpha, pairs):
+        """Check that pairs are the certified floors of alpha's HAPD run."""
+        stepper = AdaptivePrecisionStepper(
+            alpha,
+            max(self.initial_dps, int(-mp.log10(self.tolerance)) + 5),
+            self.max_dps,
+        )
+        for pair in pairs:
+            if stepper.floors() != tuple(pair) or stepper.uncertified:
+                return False
+            stepper.advance(*pair)
+        return True
+
+    @staticmethod
+    def _factor_at(poly, alpha):
+        """Return the irreducible factor of an integer polynomial nearest a root alpha."""
+        if len(poly) == 2 or Utils.is_polynomial_irreducible(poly):
+            factors = [poly]
+        else:
+            import sympy as sp
+
+            x = sp.symbols("x")
+            _, factor_list = sp.factor_list(sp.Poly(poly, x))
+            factors = [[int(c) for c in f.all_coeffs()] for f, _ in factor_list]
+
+        def distance(f):
+            # Newton step length |f(alpha) / f'(alpha)| estimates the root distance
+            value = Utils.evaluate_polynomial(f, alpha)
+            n = len(f) - 1
+            derivative = [c * (n - i) for i, c in enumerate(f[:-1])]
+            slope = Utils.evaluate_polynomial(derivative, alpha)
+            return abs(value / slope) if slope else mp.inf
+
+        factor = min(factors, key=distance)
+        return factor if factor[0] > 0 else [-c for c in factor]
+
+    def _next_iteration(self, triple, pair=None):
         """
         Compute the next triple in the HAPD sequence.
 
         Args:
             triple: Current (v1, v2, v3) triple
+            pair: Optional precomputed integer parts (a1, a2) of the triple
 
         Returns:
             tuple: Next triple in the sequence
@@ -319,8 +1660,11 @@ class HAPD:
         v1, v2, v3 = triple
 
         # Compute integer parts
-        a1 = int(mp.floor(v1 / v3))
-        a2 = int(mp.floor(v2 / v3))
+        if pair is not None:
+            a1, a2 = pair
+        else:
+            a1 = int(mp.floor(v1 / v3))
+            a2 = int(mp.floor(v2 / v3))
 
         # Compute remainders
         r1 = v1 - a1 * v3
@@ -335,3 +1679,21 @@ class HAPD:
             v3_new = mp.mpf(0)
 
         return (r1, r2, v3_new)
+
+    def _next_exact_iteration(self, field, triple, a1, a2):
+        """
+        Compute the next triple of an exact run from its certified integer parts.
+
+        Args:
+            field: NumberField holding the triple's elements
+            triple: Current (v1, v2, v3) triple of field elements
+            a1, a2: floor(v1 / v3) and floor(v2 / v3)
+
+        Returns:
+            tuple: Next triple in the sequence
+        """
+        v1, v2, v3 = triple
+        r1 = field.sub(v1, field.scale(v3, a1))
+        r2 = field.sub(v2, field.scale(v3, a2))
+        v3_new = field.sub(field.sub(v3, field.scale(r1, a1)), field.scale(r2, a2))
+        return (r1, r2, v3_new)
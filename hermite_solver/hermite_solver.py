@@ -5,307 +5,628 @@ This class integrates the HAPD algorithm, matrix-based verification, and computa
 approaches to provide a comprehensive solution to Hermite's problem.
 """
 
+import asyncio
+import collections
+import functools
+import itertools
 import math
-from mpmath import mp
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .precision import DEFAULT_DPS, isolated_precision, mp, new_context
 from .utils import Utils
+from .analysis_context import AnalysisContext
+from .cache import canonical_key
+from .deadline import cancellable, make_deadline
+from .known_constants import KNOWN_CONSTANTS
 from .hapd import HAPD
 from .matrix_approach import MatrixApproach
 from .computational_methods import ComputationalMethods
+from .pipeline import Pipeline, Stage
 
+# Built-in stages with their estimated relative costs per call, measured on a
+# mix of rationals, quadratic and cubic irrationals and transcendentals. The
+# default pipeline runs them in this order; matrix is cheaper than spectral
+# but runs after it so that spectral evidence is preferred when both agree,
+# and combined is cheap only because it reuses the spectral result.
+STAGE_COSTS = {
+    "known_value": 1,
+    "integer": 1,
+    "fraction": 10,
+    "hapd": 150,
+    "spectral": 700,
+    "matrix": 25,
+    "combined": 125,
+}
+DEFAULT_STAGES = tuple(STAGE_COSTS)
 
+# Solver of a detect_many worker process, built once by _init_worker
+_worker_solver = None
+
+# Marks a cache miss, since any result may be stored
+_MISSING = object()
+
+# Any non-special value; classifying it loads everything a classification uses
+_WARM_UP_VALUE = 0.7390851332151607
+
+
+def _init_worker(config):
+    """Build the worker's solver and warm it up before the first task arrives."""
+    global _worker_solver
+    import sympy  # noqa: F401  (imported lazily by the solver otherwise)
+
+    config = dict(config)
+    cache = config.pop("cache", None)
+    _worker_solver = HermiteSolver(**config)
+    _worker_solver.detect_cubic_irrational(_WARM_UP_VALUE, full_analysis=True)
+    # Attached after the warm-up, which should not land in the cache
+    _worker_solver.cache = cache
+
+
+def _classify(solver, task, full_analysis, deadline=None):
+    """Classify one (index, value) task, timing the call."""
+    index, value = task
+    start = time.perf_counter()
+    result = solver.detect_cubic_irrational(
+        value, full_analysis=full_analysis, deadline=deadline
+    )
+    return {
+        "index": index,
+        "result": result,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _classify_chunk_in_worker(chunk, full_analysis):
+    return [_classify(_worker_solver, task, full_analysis) for task in chunk]
+
+
+def _chunk_records(outcome):
+    """Records of a finished chunk, re-raising the error it failed with."""
+    if isinstance(outcome, BaseException):
+        raise outcome
+    return outcome
+
+
+def _classify_cancellable(solver, task, full_analysis, deadline, cancelled):
+    """Classify a task in an executor thread, stopping once cancelled is set."""
+    with cancellable(cancelled):
+        return _classify(solver, task, full_analysis, deadline)
+
+
+@isolated_precision
 class HermiteSolver:
     """
     Main solver class that combines all approaches to detect cubic irrationals.
     """
 
-    def __init__(self, max_iterations=1000, tolerance=1e-20):
-        self.hapd = HAPD(max_iterations, tolerance)
-        self.matrix = MatrixApproach(tolerance)
-        self.computational = ComputationalMethods()
+    def __init__(
+        self,
+        max_iterations=1000,
+        tolerance=1e-20,
+        backend="mpmath",
+        precision=DEFAULT_DPS,
+        cache=None,
+        stages=None,
+        max_concurrency=None,
+    ):
+        """
+        Initialize the solver.
 
-    def detect_cubic_irrational(self, alpha, full_analysis=False):
+        Args:
+            max_iterations: Maximum number of HAPD iterations
+            tolerance: Numerical tolerance of the component methods
+            backend: Arithmetic backend ('mpmath' or 'fixed')
+            precision: Working precision in decimal digits
+            cache: Optional ClassificationCache of earlier results
+            stages: Names of built-in stages and Stage objects, in the order
+                    to run them (default: DEFAULT_STAGES); stages given to
+                    detect_many's workers must be picklable
+            max_concurrency: Limit on classifications running at once through
+                             adetect and adetect_many (default: CPU count)
+        """
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.backend = backend
+        self.precision = precision
+        self.cache = cache
+        self.ctx = new_context(precision)
+        self.hapd = HAPD(
+            max_iterations, tolerance, backend=backend, precision=precision
+        )
+        self.matrix = MatrixApproach(tolerance, precision=precision)
+        self.computational = ComputationalMethods(precision, backend=backend)
+        self.stages = tuple(DEFAULT_STAGES if stages is None else stages)
+        self.pipeline = Pipeline(self._make_stage(stage) for stage in self.stages)
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._executor = None
+        self._async_solvers = None
+
+    def _make_stage(self, stage):
+        """A Stage object, given one or the name of a built-in stage."""
+        if isinstance(stage, Stage):
+            return stage
+        if stage not in STAGE_COSTS:
+            raise ValueError(
+                f"Unknown stage {stage!r}; expected one of {', '.join(STAGE_COSTS)}"
+            )
+        return Stage(stage, getattr(self, f"_stage_{stage}"), STAGE_COSTS[stage])
+
+    def detect_cubic_irrational(
+        self, alpha, full_analysis=False, deadline=None, budget_ms=None
+    ):
         """
         Detect if a number is a cubic irrational.
 
+        The input runs through the solver's pipeline of stages, cheapest
+        first, until one of them settles the classification; see
+        self.pipeline.stats() for where the time goes. With a cache, results
+        are looked up by the exact input value and the solver configuration;
+        inputs the cache cannot key, such as sympy numbers, are always
+        classified afresh.
+
+        With a deadline or budget, the long-running loops of the stages stop
+        cooperatively once it has passed, and the best classification found
+        so far is returned, with 'timed_out' set and the stages that did not
+        finish listed; such results are not cached. Work outside those loops
+        is not interrupted, so a call can overrun its deadline by the time of
+        one iteration or one uninterruptible step.
+
         Args:
-            alpha: Number to test
+            alpha: Number or AnalysisContext to test
             full_analysis: If True, return detailed analysis results
+            deadline: Optional time.monotonic() reading to finish by
+            budget_ms: Optional time budget in milliseconds; with both, the
+                       earlier limit applies
 
         Returns:
             bool or dict: True/False if full_analysis=False, else a detailed result dictionary
         """
-        # Dictionary of known values for quick and accurate classification
-        known_values = {
-            # Cubic irrationals
-            2
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "∛2",
-                "confidence": "very_high",
-            },
-            3
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "∛3",
-                "confidence": "very_high",
-            },
-            5
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "∛5",
-                "confidence": "very_high",
-            },
-            7
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "∛7",
-                "confidence": "very_high",
-            },
-            1
-            + 2
-            ** (1 / 3): {
-                "classification": "cubic_irrational",
-                "name": "1+∛2",
-                "confidence": "very_high",
-            },
-            3
-            * (2 ** (1 / 3)): {
-                "classification": "cubic_irrational",
-                "name": "3×∛2",
-                "confidence": "very_high",
-            },
-            # Quadratic irrationals
-            math.sqrt(2): {
-                "classification": "quadratic_irrational",
-                "name": "√2",
-                "confidence": "very_high",
-            },
-            math.sqrt(3): {
-                "classification": "quadratic_irrational",
-                "name": "√3",
-                "confidence": "very_high",
-            },
-            math.sqrt(5): {
-                "classification": "quadratic_irrational",
-                "name": "√5",
-                "confidence": "very_high",
-            },
-            (1 + math.sqrt(5))
-            / 2: {
-                "classification": "quadratic_irrational",
-                "name": "φ (golden ratio)",
-                "confidence": "very_high",
-            },
-            # Transcendental numbers
-            math.pi: {
-                "classification": "transcendental",
-                "name": "π",
-                "confidence": "very_high",
-            },
-            math.e: {
-                "classification": "transcendental",
-                "name": "e",
+        # Every stage shares the artifacts computed for this input
+        analysis = AnalysisContext.of(alpha, self.hapd.backend)
+        result = self._classify(analysis, make_deadline(deadline, budget_ms))
+        if full_analysis:
+            return result
+        return result["classification"] == "cubic_irrational"
+
+    def _classify(self, analysis, deadline=None):
+        """Detailed result for an AnalysisContext, from the cache if possible."""
+        if self.cache is None:
+            return self._run_pipeline(analysis, deadline)
+        try:
+            key = canonical_key(analysis.alpha, self._cache_config())
+        except TypeError:
+            return self._run_pipeline(analysis, deadline)
+        result = self.cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = self._run_pipeline(analysis, deadline)
+            if not result.get("timed_out"):
+                self.cache.put(key, result)
+        return result
+
+    def _cache_config(self):
+        """The settings a cached result depends on besides the input."""
+        return (
+            self.max_iterations,
+            self.tolerance,
+            self.backend,
+            self.precision,
+            tuple(stage.name for stage in self.pipeline.stages),
+        )
+
+    def _run_pipeline(self, analysis, deadline=None):
+        """Run the stages, concluding from their evidence if none exits."""
+        result, state = self.pipeline.run(analysis, deadline)
+        if result is not None:
+            return result
+        if state["unfinished_stages"]:
+            return self._best_so_far(state)
+        return self._conclude(state)
+
+    def _stage_known_value(self, analysis, state):
+        """Known constants, accepting slightly lower precision with lower confidence."""
+        alpha = analysis.value
+        info = KNOWN_CONSTANTS.lookup(alpha, 1e-8)
+        if info is None:
+            return None
+        error = abs(alpha - info["value"])
+        if error < 1e-9:
+            return {
+                "classification": info["classification"],
                 "confidence": "very_high",
-            },
-            # Rational numbers
-            22
-            / 7: {
+                "method": "known_value",
+                "details": info["name"],
+            }
+        return {
+            "classification": info["classification"],
+            "confidence": "high",  # Slightly lower confidence due to approximation
+            "method": "near_known_value",
+            "details": f"{info['name']} (approximate)",
+            "approximation_error": float(error),
+        }
+
+    def _stage_integer(self, analysis, state):
+        """Values extremely close to integers."""
+        integer_value = int(mp.nint(analysis.value))
+        if abs(analysis.value - integer_value) < 1e-8:
+            return {
                 "classification": "rational",
-                "name": "22/7",
                 "confidence": "very_high",
-            },
-            6
-            / 5: {
+                "method": "integer_check",
+                "value": integer_value,
+            }
+        return None
+
+    def _stage_fraction(self, analysis, state):
+        """Simple fractions with small denominators."""
+        fraction = analysis.rational(max_denominator=100, tolerance=1e-8)
+        if fraction is not None and 0 < fraction < 1:
+            return {
                 "classification": "rational",
-                "name": "6/5",
                 "confidence": "very_high",
-            },
+                "method": "fraction_check",
+                "value": f"{fraction.numerator}/{fraction.denominator}",
+            }
+        return None
+
+    def _stage_hapd(self, analysis, state):
+        """
+        HAPD periodicity: short periods settle the classification, while
+        periods above 5 mark a cubic candidate for the following stages.
+        """
+        result = self.hapd.run(analysis)
+        state["hapd"] = result
+        if not result.get("periodic"):
+            return None
+        if result["period_length"] == 1:
+            return {
+                "classification": "rational",
+                "confidence": "high",
+                "method": "hapd",
+                "hapd_details": result,
+            }
+        if result["period_length"] <= 5:
+            # Short periods (2-5) are typically quadratic irrationals
+            return {
+                "classification": "quadratic_irrational",
+                "confidence": "high",
+                "method": "hapd",
+                "hapd_details": result,
+            }
+        state["cubic_candidate"] = True
+        return None
+
+    def _stage_spectral(self, analysis, state):
+        """Spectral analysis, confirming a HAPD candidate if there is one."""
+        spectral_result = self.computational.spectral_cubic_discriminator(analysis)
+        state["spectral"] = spectral_result
+        if not spectral_result.get("is_cubic"):
+            return None
+        if state.get("cubic_candidate"):
+            return {
+                "classification": "cubic_irrational",
+                "confidence": "high",
+                "method": "hapd_with_spectral",
+                "hapd_details": state["hapd"],
+                "spectral_details": spectral_result,
+            }
+        return {
+            "classification": "cubic_irrational",
+            "confidence": spectral_result.get("confidence", "medium"),
+            "method": "spectral",
+            "spectral_details": spectral_result,
         }
 
-        # Check for known values with high precision
-        for value, info in known_values.items():
-            if abs(alpha - value) < 1e-9:
-                if full_analysis:
-                    return {
-                        "classification": info["classification"],
-                        "confidence": info["confidence"],
-                        "method": "known_value",
-                        "details": info["name"],
-                    }
-                return info["classification"] == "cubic_irrational"
-
-        # Check for values very close to known values (with slightly lower precision)
-        for value, info in known_values.items():
-            if abs(alpha - value) < 1e-8:
-                if full_analysis:
-                    return {
-                        "classification": info["classification"],
-                        "confidence": "high",  # Slightly lower confidence due to approximation
-                        "method": "near_known_value",
-                        "details": f"{info['name']} (approximate)",
-                        "approximation_error": float(abs(alpha - value)),
-                    }
-                return info["classification"] == "cubic_irrational"
-
-        # Basic check for values extremely close to integers
-        integer_value = round(alpha)
-        if abs(alpha - integer_value) < 1e-8:
-            if full_analysis:
-                return {
-                    "classification": "rational",
-                    "confidence": "very_high",
-                    "method": "integer_check",
-                    "value": integer_value,
-                }
-            return False
-
-        # Check for simple fractions with small denominators
-        for denominator in range(2, 101):
-            for numerator in range(1, denominator):
-                fraction = numerator / denominator
-                if abs(alpha - fraction) < 1e-8:
-                    if full_analysis:
-                        return {
-                            "classification": "rational",
-                            "confidence": "very_high",
-                            "method": "fraction_check",
-                            "value": f"{numerator}/{denominator}",
-                        }
-                    return False
-
-        # Continue with standard detection using HAPD
-        result = self.hapd.run(alpha)
-
-        # If HAPD finds a clear result, use it
-        if "periodic" in result and result["periodic"]:
-            if result["period_length"] == 1:
-                if full_analysis:
-                    return {
-                        "classification": "rational",
-                        "confidence": "high",
-                        "method": "hapd",
-                        "hapd_details": result,
-                    }
-                return False
-            elif result["period_length"] > 1 and result["period_length"] <= 5:
-                # Short periods (2-5) are typically quadratic irrationals
-                if full_analysis:
-                    return {
-                        "classification": "quadratic_irrational",
-                        "confidence": "high",
-                        "method": "hapd",
-                        "hapd_details": result,
-                    }
-                return False
-            elif result["period_length"] > 5:
-                # Longer periods could indicate cubic irrationals
-                # Verify with additional methods
-                spectral_result = self.computational.spectral_cubic_discriminator(alpha)
-                if "is_cubic" in spectral_result and spectral_result["is_cubic"]:
-                    if full_analysis:
-                        return {
-                            "classification": "cubic_irrational",
-                            "confidence": "high",
-                            "method": "hapd_with_spectral",
-                            "hapd_details": result,
-                            "spectral_details": spectral_result,
-                        }
-                    return True
-
-                # If spectral analysis doesn't confirm, try matrix approach
-                matrix_result = self.matrix.verify_cubic_irrational(alpha)
-                if matrix_result["classification"] == "cubic_irrational":
-                    if full_analysis:
-                        return {
-                            "classification": "cubic_irrational",
-                            "confidence": "high",
-                            "method": "hapd_with_matrix",
-                            "hapd_details": result,
-                            "matrix_details": matrix_result,
-                        }
-                    return True
-
-                # If neither confirms, it's likely not a cubic irrational
-                if full_analysis:
-                    return {
-                        "classification": "not_cubic",
-                        "confidence": "medium",
-                        "method": "hapd_contradicted",
-                        "hapd_details": result,
-                    }
-                return False
-
-        # Try spectral analysis for cubic irrationals
-        spectral_result = self.computational.spectral_cubic_discriminator(alpha)
-
-        if "is_cubic" in spectral_result and spectral_result["is_cubic"]:
-            if full_analysis:
-                return {
-                    "classification": "cubic_irrational",
-                    "confidence": spectral_result.get("confidence", "medium"),
-                    "method": "spectral",
-                    "spectral_details": spectral_result,
-                }
-            return True
-
-        # If all else fails, use matrix approach
-        matrix_result = self.matrix.verify_cubic_irrational(alpha)
-
-        # Check if result indicates cubic irrationality
-        if (
-            matrix_result
-            and "verification_success" in matrix_result
-            and matrix_result["verification_success"]
-        ):
-            if full_analysis:
+    def _stage_matrix(self, analysis, state):
+        """
+        Matrix verification. A HAPD candidate that neither the spectral
+        analysis nor this stage confirms is settled as not cubic.
+        """
+        matrix_result = self.matrix.verify_cubic_irrational(analysis)
+        state["matrix"] = matrix_result
+        if state.get("cubic_candidate"):
+            if matrix_result["classification"] == "cubic_irrational":
                 return {
                     "classification": "cubic_irrational",
-                    "confidence": "medium",
-                    "method": "matrix",
+                    "confidence": "high",
+                    "method": "hapd_with_matrix",
+                    "hapd_details": state["hapd"],
                     "matrix_details": matrix_result,
                 }
-            return True
-
-        # If we've reached here, we need to make a final decision based on all evidence
-        # Try combined discriminator for a more comprehensive analysis
-        combined_result = self.computational.combined_discriminator(alpha)
+            return {
+                "classification": "not_cubic",
+                "confidence": "medium",
+                "method": "hapd_contradicted",
+                "hapd_details": state["hapd"],
+            }
+        if matrix_result and matrix_result.get("verification_success"):
+            return {
+                "classification": "cubic_irrational",
+                "confidence": "medium",
+                "method": "matrix",
+                "matrix_details": matrix_result,
+            }
+        return None
 
+    def _stage_combined(self, analysis, state):
+        """The combined discriminator, accepted when it finds a cubic."""
+        combined_result = self.computational.combined_discriminator(analysis)
+        state["combined"] = combined_result
         if combined_result["classification"] == "cubic_irrational":
-            if full_analysis:
-                return {
-                    "classification": "cubic_irrational",
-                    "confidence": combined_result.get("confidence", "medium"),
-                    "method": "combined",
-                    "combined_details": combined_result,
-                }
-            return True
+            return {
+                "classification": "cubic_irrational",
+                "confidence": combined_result.get("confidence", "medium"),
+                "method": "combined",
+                "combined_details": combined_result,
+            }
+        return None
 
-        # Default classification if all methods are inconclusive
-        if full_analysis:
-            # Determine the most likely classification based on available evidence
-            if "periodic" in result and result["periodic"]:
-                period_length = result.get("period_length", 0)
-                return {
-                    "classification": (
-                        "rational" if period_length == 1 else "quadratic_irrational"
-                    ),
-                    "confidence": "medium",
-                    "method": "hapd",
-                    "hapd_details": result,
+    def _best_so_far(self, state):
+        """Best classification from the stages that finished before the deadline."""
+        result = {"classification": "unknown", "confidence": "none"}
+        for name in ("combined", "spectral", "matrix"):
+            evidence = state.get(name)
+            if evidence and evidence.get("classification", "unknown") != "unknown":
+                result = {
+                    "classification": evidence["classification"],
+                    "confidence": evidence.get("confidence", "low"),
+                    f"{name}_details": evidence,
                 }
-            elif combined_result["classification"] != "unknown":
-                return {
-                    "classification": combined_result["classification"],
-                    "confidence": combined_result.get("confidence", "low"),
-                    "method": "combined",
-                    "combined_details": combined_result,
-                }
-            else:
-                return {
-                    "classification": "transcendental",
+                break
+        else:
+            if state.get("cubic_candidate"):
+                # A long HAPD period that nothing has yet confirmed
+                result = {
+                    "classification": "cubic_irrational",
                     "confidence": "low",
-                    "method": "default",
-                    "note": "Classification by exclusion - no clear pattern detected",
+                    "hapd_details": state["hapd"],
                 }
+        result.update(
+            {
+                "method": "deadline",
+                "timed_out": True,
+                "completed_stages": state["completed_stages"],
+                "unfinished_stages": state["unfinished_stages"],
+            }
+        )
+        return result
+
+    def _conclude(self, state):
+        """Most likely classification from what the stages recorded."""
+        hapd_result = state.get("hapd", {})
+        combined_result = state.get("combined", {"classification": "unknown"})
+        if hapd_result.get("periodic"):
+            period_length = hapd_result.get("period_length", 0)
+            return {
+                "classification": (
+                    "rational" if period_length == 1 else "quadratic_irrational"
+                ),
+                "confidence": "medium",
+                "method": "hapd",
+                "hapd_details": hapd_result,
+            }
+        if combined_result["classification"] != "unknown":
+            return {
+                "classification": combined_result["classification"],
+                "confidence": combined_result.get("confidence", "low"),
+                "method": "combined",
+                "combined_details": combined_result,
+            }
+        return {
+            "classification": "transcendental",
+            "confidence": "low",
+            "method": "default",
+            "note": "Classification by exclusion - no clear pattern detected",
+        }
+
+    def detect_many(
+        self, values, workers=None, chunksize=None, ordered=True, full_analysis=False
+    ):
+        """
+        Classify many values over a pool of worker processes.
+
+        Every worker builds a solver with this solver's configuration and
+        classifies one value before taking work, so imports and first-call
+        costs are paid at start-up. Each value is classified exactly as
+        detect_cubic_irrational would classify it here. A cache given to
+        this solver is shared with the workers through its store.
+
+        Values are read lazily: at most two chunks per worker are in flight,
+        so arbitrarily long streams are classified in constant memory.
+
+        Args:
+            values: Iterable of values to classify
+            workers: Number of worker processes (default: CPU count); 1 runs
+                     in this process without a pool
+            chunksize: Values sent to a worker at a time (default: about four
+                       chunks per worker when the number of values is known)
+            ordered: If True, yield results in input order; if False, yield
+                     each result as soon as it completes
+            full_analysis: Passed on to detect_cubic_irrational
+
+        Yields:
+            dict: For each value:
+                - 'index': Position of the value in values
+                - 'result': What detect_cubic_irrational returned
+                - 'seconds': Wall time of the classification in the worker
+        """
+        workers = workers or os.cpu_count() or 1
+        tasks = enumerate(values)
+        if workers == 1:
+            for task in tasks:
+                yield _classify(self, task, full_analysis)
+            return
+
+        if chunksize is None:
+            size = len(values) if hasattr(values, "__len__") else None
+            chunksize = math.ceil(size / (4 * workers)) if size else 32
+        chunksize = max(1, chunksize)
+        chunks = iter(lambda: list(itertools.islice(tasks, chunksize)), [])
+        limit = 2 * workers
+        work = functools.partial(_classify_chunk_in_worker, full_analysis=full_analysis)
+        # Pool.imap would read every value up front; submitting chunks one
+        # at a time keeps the number in flight bounded
+        with multiprocessing.Pool(workers, _init_worker, (self._config(),)) as pool:
+            if ordered:
+                pending = collections.deque()
+                for chunk in chunks:
+                    pending.append(pool.apply_async(work, (chunk,)))
+                    if len(pending) >= limit:
+                        yield from pending.popleft().get()
+                while pending:
+                    yield from pending.popleft().get()
+                return
+
+            finished = queue.SimpleQueue()
+            in_flight = 0
+            for chunk in chunks:
+                pool.apply_async(
+                    work, (chunk,), callback=finished.put, error_callback=finished.put
+                )
+                in_flight += 1
+                if in_flight >= limit:
+                    in_flight -= 1
+                    yield from _chunk_records(finished.get())
+            while in_flight:
+                in_flight -= 1
+                yield from _chunk_records(finished.get())
+
+    def _config(self):
+        """Arguments that build a solver configured like this one."""
+        return {
+            "max_iterations": self.max_iterations,
+            "tolerance": self.tolerance,
+            "backend": self.backend,
+            "precision": self.precision,
+            "cache": self.cache,
+            "stages": self.stages,
+        }
+
+    async def adetect(self, alpha, full_analysis=False, deadline=None, budget_ms=None):
+        """
+        Classify a number without blocking the event loop.
+
+        The classification runs on a solver of its own in a thread of a
+        bounded executor, at most max_concurrency at a time; further calls
+        wait for a free slot, and the time spent waiting counts against the
+        deadline. Cancelling the awaiting task stops the classification at
+        the next check of its loops, as a passed deadline would.
+
+        Threads share the interpreter lock, so this keeps a service
+        responsive rather than adding throughput; detect_many spreads work
+        over processes.
+
+        Args:
+            alpha: Number or AnalysisContext to test
+            full_analysis: If True, return detailed analysis results
+            deadline: Optional time.monotonic() reading to finish by
+            budget_ms: Optional time budget in milliseconds
+
+        Returns:
+            bool or dict: As detect_cubic_irrational returns
+        """
+        deadline = make_deadline(deadline, budget_ms)
+        record = await self._aclassify((0, alpha), full_analysis, deadline)
+        return record["result"]
+
+    async def adetect_many(
+        self,
+        values,
+        full_analysis=False,
+        ordered=True,
+        deadline=None,
+        budget_ms=None,
+    ):
+        """
+        Classify many values without blocking the event loop.
+
+        At most max_concurrency values are in flight at a time, so values
+        are only read from the iterable as results are consumed. Closing
+        the generator or cancelling its consumer cancels every
+        classification in flight.
+
+        Args:
+            values: Iterable of values to classify
+            full_analysis: Passed on to detect_cubic_irrational
+            ordered: If True, yield results in input order; if False, yield
+                     each result as soon as it completes
+            deadline: Optional time.monotonic() reading for the whole batch
+            budget_ms: Optional time budget for the whole batch, in milliseconds
+
+        Yields:
+            dict: As detect_many yields
+        """
+        deadline = make_deadline(deadline, budget_ms)
+        pending = collections.deque() if ordered else set()
+        try:
+            for task in enumerate(values):
+                future = asyncio.ensure_future(
+                    self._aclassify(task, full_analysis, deadline)
+                )
+                if ordered:
+                    pending.append(future)
+                    if len(pending) >= self.max_concurrency:
+                        yield await pending.popleft()
+                else:
+                    pending.add(future)
+                    if len(pending) >= self.max_concurrency:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for future in done:
+                            yield future.result()
+            while pending:
+                if ordered:
+                    yield await pending.popleft()
+                else:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def _aclassify(self, task, full_analysis, deadline):
+        """Run one task on a free solver in the executor."""
+        solvers = self._solver_slots()
+        solver = await solvers.get()
+        loop = asyncio.get_running_loop()
+        cancelled = threading.Event()
+        future = self._executor.submit(
+            _classify_cancellable, solver, task, full_analysis, deadline, cancelled
+        )
+        # The solver is only free again once its thread has let go of it
+        future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(solvers.put_nowait, solver)
+        )
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    def _solver_slots(self):
+        """Queue of the solvers adetect runs on, one per executor thread."""
+        loop = asyncio.get_running_loop()
+        if self._async_solvers is None or self._async_solvers[0] is not loop:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_concurrency, thread_name_prefix="hermite-solver"
+                )
+            solvers = asyncio.Queue()
+            for _ in range(self.max_concurrency):
+                solvers.put_nowait(HermiteSolver(**self._config()))
+            self._async_solvers = (loop, solvers)
+        return self._async_solvers[1]
 
-        return False
+    def close(self):
+        """Shut down the executor of adetect and adetect_many, if started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._async_solvers = None
@@ -0,0 +1,122 @@
+"""
+Registry of Known Constants
+
+Several classifiers short-circuit on well-known values such as ∛2, √2 or π.
+They share one registry, built once from a bundled data file, that keeps the
+values in a sorted array so a lookup at any tolerance is a binary search
+rather than a scan. The registry can be extended at runtime, or loaded from
+another data file, and stays fast with thousands of entries.
+"""
+
+import bisect
+import json
+import os
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "known_constants.json")
+
+
+class KnownConstantRegistry:
+    """
+    Known constants sorted by value, with tolerance lookup by bisection.
+
+    Each entry is a dict with the keys 'value' (float), 'name' and
+    'classification', plus whatever optional details it was registered with,
+    such as 'polynomial' (the minimal polynomial, highest degree first) or
+    the HAPD 'period' and 'preperiod'.
+    """
+
+    def __init__(self, entries=()):
+        """
+        Initialize the registry.
+
+        Args:
+            entries: Iterable of entry dicts, in the format of add()'s arguments
+        """
+        self._values = []
+        self._entries = []
+        for entry in entries:
+            entry = dict(entry)
+            self.add(entry.pop("value"), entry.pop("name"), **entry)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def add(self, value, name, classification="unknown", **details):
+        """
+        Register a constant.
+
+        Args:
+            value: The constant, as a number or decimal string; stored as a float
+            name: Display name, e.g. '∛2'
+            classification: 'rational', 'quadratic_irrational',
+                            'cubic_irrational', 'transcendental', ...
+            **details: Further keys stored with the entry
+
+        Returns:
+            dict: The stored entry
+        """
+        entry = {
+            "value": float(value),
+            "name": name,
+            "classification": classification,
+            **details,
+        }
+        index = bisect.bisect_right(self._values, entry["value"])
+        self._values.insert(index, entry["value"])
+        self._entries.insert(index, entry)
+        return entry
+
+    def lookup(self, alpha, tolerance, require=None):
+        """
+        Find the registered constant nearest to alpha.
+
+        Args:
+            alpha: Number to look up (float, mpf or anything float() accepts)
+            tolerance: Largest accepted distance, exclusive
+            require: Optional key the entry must have, e.g. 'polynomial'
+
+        Returns:
+            dict: The nearest matching entry, or None if none is within tolerance
+        """
+        x = float(alpha)
+        lo = bisect.bisect_left(self._values, x - tolerance)
+        hi = bisect.bisect_right(self._values, x + tolerance)
+        best, best_error = None, tolerance
+        for entry in self._entries[lo:hi]:
+            if require is not None and require not in entry:
+                continue
+            error = abs(alpha - entry["value"])
+            if error < best_error:
+                best, best_error = entry, error
+        return best
+
+    def load(self, path):
+        """
+        Add every entry of a JSON data file.
+
+        The file holds a list of objects with at least 'value' and 'name';
+        values may be numbers or decimal strings, and are stored as floats
+        like those given to add().
+
+        Args:
+            path: Path of the JSON file
+
+        Returns:
+            KnownConstantRegistry: self, for chaining
+        """
+        with open(path, encoding="utf-8") as f:
+            for entry in json.load(f):
+                self.add(entry.pop("value"), entry.pop("name"), **entry)
+        return self
+
+    @classmethod
+    def from_file(cls, path=DATA_FILE):
+        """Build a registry from a JSON data file, by default the bundled one."""
+        return cls().load(path)
+
+
+# The registry every classifier consults
+KNOWN_CONSTANTS = KnownConstantRegistry.from_file()
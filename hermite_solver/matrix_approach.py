@@ -6,18 +6,21 @@ including companion matrix construction and trace relation verification.
 """
 
 import numpy as np
-import sympy as sp
-from mpmath import mp
+from .precision import DEFAULT_DPS, isolated_precision, mp, new_context
 from .utils import Utils
+from .analysis_context import AnalysisContext
+from .known_constants import KNOWN_CONSTANTS
 
 
+@isolated_precision
 class MatrixApproach:
     """
     Implementation of the matrix-based approach for detecting cubic irrationals.
     """
 
-    def __init__(self, tolerance=1e-20):
+    def __init__(self, tolerance=1e-20, precision=DEFAULT_DPS):
         self.tolerance = tolerance
+        self.ctx = new_context(precision)
 
     def create_companion_matrix(self, coeffs):
         """
@@ -67,71 +70,46 @@ class MatrixApproach:
         else:
             return np.trace(np.linalg.matrix_power(matrix, power))
 
+    def _companion_traces(self, coeffs):
+        """Companion matrix of a polynomial and the traces of its powers 0 to 5."""
+        C = self.create_companion_matrix(coeffs)
+        return C, [self.matrix_power_trace(C, k) for k in range(6)]
+
     def verify_cubic_irrational(self, alpha, candidate_poly=None):
         """
         Verify if alpha is a cubic irrational using the matrix approach.
 
         Args:
-            alpha: Number to check
+            alpha: Number or AnalysisContext to check
             candidate_poly: Optional candidate minimal polynomial coefficients
 
         Returns:
             dict: Results including classification and analysis
         """
+        analysis = AnalysisContext.of(alpha)
+
         # Convert alpha to high precision
-        alpha = mp.mpf(alpha)
+        alpha = analysis.value
 
         # Check if it's a known cubic irrational
-        try:
-            alpha_float = float(alpha)
-            # Special cases for exact values
-            if abs(alpha_float - float(2 ** (1 / 3))) < 1e-10:
-                return {
-                    "classification": "cubic_irrational",
-                    "polynomial": [1, 0, 0, -2],  # x^3 - 2
-                    "verification_success": True,
-                    "is_root": True,
-                    "note": "Known cubic irrational: ∛2",
-                }
-            if abs(alpha_float - float(3 ** (1 / 3))) < 1e-10:
-                return {
-                    "classification": "cubic_irrational",
-                    "polynomial": [1, 0, 0, -3],  # x^3 - 3
-                    "verification_success": True,
-                    "is_root": True,
-                    "note": "Known cubic irrational: ∛3",
-                }
-            if abs(alpha_float - float(1 + 2 ** (1 / 3))) < 1e-10:
-                return {
-                    "classification": "cubic_irrational",
-                    "polynomial": [1, -3, 3, -1],  # x^3 - 3x^2 + 3x - 1
-                    "verification_success": True,
-                    "is_root": True,
-                    "note": "Known cubic irrational: 1+∛2",
-                }
-        except:
-            pass
+        info = KNOWN_CONSTANTS.lookup(alpha, 1e-10, require="polynomial")
+        if info is not None and info["classification"] == "cubic_irrational":
+            return {
+                "classification": "cubic_irrational",
+                "polynomial": list(info["polynomial"]),
+                "verification_success": True,
+                "is_root": True,
+                "note": f"Known cubic irrational: {info['name']}",
+            }
 
         # Find minimal polynomial if not provided
         if candidate_poly is None:
-            coeffs = Utils.find_minimal_polynomial(alpha, max_degree=3)
+            coeffs = analysis.minimal_polynomial(max_degree=3)
             if coeffs is None:
-                # Try the sympy minimal_polynomial function with explicit value
-                try:
-                    x = sp.symbols("x")
-                    poly = sp.minimal_polynomial(float(alpha), max_degree=3)
-                    if poly.degree() == 3:
-                        coeffs = [float(c) for c in poly.all_coeffs()]
-                    else:
-                        return {
-                            "classification": "not_cubic",
-                            "reason": f"Minimal polynomial has degree {poly.degree()}, not 3",
-                        }
-                except:
-                    return {
-                        "classification": "unknown",
-                        "reason": "Could not find minimal polynomial",
-                    }
+                return {
+                    "classification": "unknown",
+                    "reason": "Could not find minimal polynomial",
+                }
         else:
             coeffs = candidate_poly
 
@@ -159,16 +137,15 @@ class MatrixApproach:
                 "polynomial": coeffs,
             }
 
-        # Create companion matrix
-        C = self.create_companion_matrix(coeffs)
-
-        # Compute traces for powers 0 through 5
-        traces = [self.matrix_power_trace(C, k) for k in range(6)]
+        # Create companion matrix and the traces of its powers 0 through 5
+        C, traces = analysis.memoize(
+            ("companion_matrix", tuple(coeffs)), lambda: self._companion_traces(coeffs)
+        )
 
         # Verify trace relations for k >= 3
         # For a cubic with x^3 + ax^2 + bx + c, the relation is:
         # tr(C^k) = -a*tr(C^(k-1)) - b*tr(C^(k-2)) - c*tr(C^(k-3))
-        a, b, c = -coeffs[1] / coeffs[0], -coeffs[2] / coeffs[0], -coeffs[3] / coeffs[0]
+        a, b, c = coeffs[1] / coeffs[0], coeffs[2] / coeffs[0], coeffs[3] / coeffs[0]
 
         verification_results = []
         for k in [3, 4, 5]:
@@ -189,12 +166,8 @@ class MatrixApproach:
 
         # Verify that alpha is actually a root of the polynomial
         poly_value = mp.mpf(0)
-        powers = [mp.mpf(1)]
-        for i in range(1, len(coeffs)):
-            powers.append(powers[-1] * alpha)
-
-        for i, coef in enumerate(coeffs):
-            poly_value += coef * powers[len(coeffs) - i - 1]
+        for coef in coeffs:
+            poly_value = poly_value * alpha + coef
 
         is_root = mp.fabs(poly_value) < self.tolerance
 
@@ -0,0 +1,457 @@
+"""
+Exact Arithmetic in Real Number Fields
+
+This module implements exact arithmetic in Q(α), where α is a real root of an
+irreducible integer polynomial. Elements are coefficient vectors over the power
+basis 1, α, ..., α^(n-1), and every comparison with real numbers is certified
+with a rational isolating interval for α, so no floating-point tolerance is
+ever involved.
+"""
+
+import math
+from fractions import Fraction
+from .half_gcd import partial_quotients
+from .precision import active_context
+from .utils import Utils
+
+
+class NumberField:
+    """
+    The real number field Q(α) for a chosen real root α of an integer polynomial.
+
+    Elements are tuples (c_0, c_1, ..., c_{n-1}) of integers or Fractions
+    representing c_0 + c_1 α + ... + c_{n-1} α^(n-1).
+    """
+
+    def __init__(self, coeffs, root=None):
+        """
+        Initialize the field from a minimal polynomial.
+
+        Args:
+            coeffs: Integer coefficients [a_n, ..., a_1, a_0] of an irreducible
+                    polynomial a_n*x^n + ... + a_1*x + a_0
+            root: Optional approximation selecting which real root is α;
+                  defaults to the largest real root
+
+        Raises:
+            ValueError: If the polynomial is not irreducible over Q or has no real root
+        """
+        coeffs = list(coeffs)
+        while coeffs and coeffs[0] == 0:
+            coeffs.pop(0)
+        if not coeffs or any(Fraction(c).denominator != 1 for c in coeffs):
+            raise ValueError("Minimal polynomial must have integer coefficients")
+        self.coeffs = [int(c) for c in coeffs]
+        self.degree = len(self.coeffs) - 1
+        if self.degree < 1:
+            raise ValueError("Minimal polynomial must have positive degree")
+        if self.degree > 1 and not Utils.is_polynomial_irreducible(self.coeffs):
+            raise ValueError(f"Polynomial {self.coeffs} is not irreducible over Q")
+
+        # Lowest-degree-first coefficients are more convenient for reduction
+        self._poly = [Fraction(c) for c in reversed(self.coeffs)]
+
+        intervals = self._isolate_real_roots()
+        if not intervals:
+            raise ValueError(f"Polynomial {self.coeffs} has no real root")
+        if root is None:
+            self.lo, self.hi = intervals[-1]
+        else:
+            self.lo, self.hi = self._select_root(intervals, root)
+
+    # ------------------------------------------------------------------
+    # Construction helpers
+    # ------------------------------------------------------------------
+
+    def element(self, coeffs):
+        """
+        Build an element from power-basis coefficients (lowest degree first).
+
+        Args:
+            coeffs: Sequence of at most n coefficients
+
+        Returns:
+            tuple: Field element
+        """
+        coeffs = list(coeffs)
+        if len(coeffs) > self.degree:
+            return self._reduce([Fraction(c) for c in coeffs])
+        return tuple(coeffs) + (0,) * (self.degree - len(coeffs))
+
+    @property
+    def zero(self):
+        return (0,) * self.degree
+
+    @property
+    def one(self):
+        return self.element([1])
+
+    @property
+    def alpha(self):
+        """The generator α as a field element."""
+        return self.element([0, 1])
+
+    # ------------------------------------------------------------------
+    # Field arithmetic
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def add(a, b):
+        return tuple(x + y for x, y in zip(a, b))
+
+    @staticmethod
+    def sub(a, b):
+        return tuple(x - y for x, y in zip(a, b))
+
+    @staticmethod
+    def scale(a, k):
+        return tuple(k * x for x in a)
+
+    @staticmethod
+    def is_zero(a):
+        return all(x == 0 for x in a)
+
+    def mul(self, a, b):
+        """Multiply two field elements."""
+        product = [0] * (2 * self.degree - 1)
+        for i, x in enumerate(a):
+            if x:
+                for j, y in enumerate(b):
+                    product[i + j] += x * y
+        return self._reduce(product)
+
+    def inverse(self, a):
+        """
+        Compute the multiplicative inverse of a nonzero element.
+
+        Uses the extended Euclidean algorithm in Q[x] against the minimal polynomial.
+        """
+        if self.is_zero(a):
+            raise ZeroDivisionError("Inverse of zero in number field")
+
+        r0, r1 = list(self._poly), self._trim([Fraction(x) for x in a])
+        s0, s1 = [Fraction(0)], [Fraction(1)]
+        while len(r1) > 1:
+            q, r = self._poly_divmod(r0, r1)
+            r0, r1 = r1, r
+            s0, s1 = s1, self._poly_sub(s0, self._poly_mul(q, s1))
+        # r1 is now a nonzero constant since the minimal polynomial is irreducible
+        c = r1[0]
+        return self._normalize(self._reduce([x / c for x in s1]))
+
+    def div(self, a, b):
+        return self.mul(a, self.inverse(b))
+
+    def projective_key(self, v):
+        """
+        Canonical hashable representative of a projective point over Q(α).
+
+        Two triples are projectively equivalent over the reals exactly when their
+        keys are equal, since the scale factor between them lies in Q(α).
+
+        Args:
+            v: Sequence of field elements, the last of which is nonzero
+
+        Returns:
+            tuple: Exact canonical form (v_1/v_n, ..., v_{n-1}/v_n)
+        """
+        inv = self.inverse(v[-1])
+        return tuple(self.mul(x, inv) for x in v[:-1])
+
+    # ------------------------------------------------------------------
+    # Certified comparisons with the reals
+    # ------------------------------------------------------------------
+
+    def interval(self, a):
+        """
+        Enclose the real value of an element in a rational interval.
+
+        Args:
+            a: Field element
+
+        Returns:
+            tuple: (lower, upper) Fractions bounding the element's value
+        """
+        lo_acc = hi_acc = Fraction(0)
+        for c in reversed(a):
+            products = (
+                lo_acc * self.lo,
+                lo_acc * self.hi,
+                hi_acc * self.lo,
+                hi_acc * self.hi,
+            )
+            lo_acc, hi_acc = min(products) + c, max(products) + c
+        return lo_acc, hi_acc
+
+    def refine(self, bits=32):
+        """Shrink the isolating interval of α by the given number of bisections."""
+        sign_lo = self._sign_at(self.lo)
+        for _ in range(bits):
+            mid = (self.lo + self.hi) / 2
+            sign_mid = self._sign_at(mid)
+            if sign_mid == 0:
+                self.lo = self.hi = mid
+                return
+            if sign_mid == sign_lo:
+                self.lo = mid
+            else:
+                self.hi = mid
+
+    def sign(self, a):
+        """Exact sign (-1, 0 or 1) of a field element."""
+        if self.is_zero(a):
+            return 0
+        while True:
+            lo, hi = self.interval(a)
+            if lo > 0:
+                return 1
+            if hi < 0:
+                return -1
+            self.refine()
+
+    def floor_ratio(self, a, b):
+        """
+        Exact floor of a/b for field elements a and b with b nonzero.
+
+        The quotient is enclosed in an interval that is refined until it holds
+        at most one integer k, which is then decided by the exact sign of a - k*b.
+
+        Returns:
+            int: floor(a / b)
+        """
+        if self.is_zero(b):
+            raise ZeroDivisionError("Floor of ratio with zero denominator")
+        while True:
+            b_lo, b_hi = self.interval(b)
+            if b_lo > 0 or b_hi < 0:
+                a_lo, a_hi = self.interval(a)
+                quotients = (a_lo / b_lo, a_lo / b_hi, a_hi / b_lo, a_hi / b_hi)
+                k_lo = math.floor(min(quotients))
+                k_hi = math.floor(max(quotients))
+                if k_lo == k_hi:
+                    return k_lo
+                if k_hi == k_lo + 1:
+                    # One integer inside the enclosure: decide by an exact sign
+                    sign_b = 1 if b_lo > 0 else -1
+                    boundary = self.sign(self.sub(a, self.scale(b, k_hi)))
+                    return k_hi if boundary * sign_b >= 0 else k_lo
+            self.refine()
+
+    def to_mpf(self, a, ctx=None):
+        """Approximate an element as an mpmath number at the context's precision."""
+        ctx = ctx or active_context()
+        while True:
+            lo, hi = self.interval(a)
+            if hi - lo <= abs(lo + hi) * Fraction(1, 2 ** (ctx.prec + 2)) or hi == lo:
+                mid = (lo + hi) / 2
+                return ctx.mpf(mid.numerator) / mid.denominator
+            self.refine(max(32, ctx.prec // 4))
+
+    # ------------------------------------------------------------------
+    # Continued fractions
+    # ------------------------------------------------------------------
+
+    def continued_fraction(self, max_terms=100):
+        """
+        Exact partial quotients of α by Lagrange's method.
+
+        Each quotient a is the floor of the single root of a transformed
+        polynomial inside a rational isolating interval, found with a few sign
+        evaluations at integers. The polynomial is then moved to the next
+        complete quotient by a Taylor shift x -> x + a and a reversal
+        x -> 1/x, so the expansion uses only integer arithmetic and never
+        loses precision.
+
+        Args:
+            max_terms: Maximum number of terms to compute
+
+        Returns:
+            list: [a0, a1, ...] with the floor convention (a0 may be negative);
+                  shorter than max_terms only when α is rational
+        """
+        if self.degree == 1:
+            root = self.lo
+            a0 = math.floor(root)
+            remainder = root - a0
+            terms = [a0] + partial_quotients(
+                remainder.numerator, remainder.denominator
+            )[1:]
+            return terms[:max_terms]
+
+        poly = list(reversed(self.coeffs))
+        lo, hi = self.lo, self.hi
+        terms = []
+        while len(terms) < max_terms:
+            a = self._root_floor(poly, lo, hi)
+            terms.append(a)
+
+            # The root lies in (a, a + 1); its next complete quotient is the
+            # root of the shifted, reversed polynomial in the image interval
+            lo, hi = max(lo, a), min(hi, a + 1)
+            poly = self._taylor_shift(poly, a)[::-1]
+            content = math.gcd(*poly)
+            poly = [c // content for c in poly]
+            lo, hi = 1 / Fraction(hi - a), (1 / (lo - a) if lo > a else None)
+            if hi is None:
+                hi = Fraction(2 + max(abs(c) for c in poly[:-1]) // abs(poly[-1]))
+        return terms
+
+    def _root_floor(self, poly, lo, hi):
+        """
+        Floor of the only root of poly in the open interval (lo, hi).
+
+        Galloping from floor(lo) keeps the number of sign evaluations
+        logarithmic in the partial quotient.
+        """
+        sign_lo = self._sign_at(lo, poly)
+
+        def below(k):
+            if k <= lo:
+                return True
+            if k >= hi:
+                return False
+            return self._sign_at(k, poly) == sign_lo
+
+        k = math.floor(lo)
+        step = 1
+        while below(k + step):
+            k += step
+            step *= 2
+        upper = k + step
+        while upper - k > 1:
+            mid = (k + upper) // 2
+            if below(mid):
+                k = mid
+            else:
+                upper = mid
+        return k
+
+    @staticmethod
+    def _taylor_shift(poly, a):
+        """Coefficients of poly(x + a), lowest degree first."""
+        poly = list(poly)
+        n = len(poly) - 1
+        for i in range(n):
+            for j in range(n - 1, i - 1, -1):
+                poly[j] += a * poly[j + 1]
+        return poly
+
+    # ------------------------------------------------------------------
+    # Internal polynomial helpers (lowest degree first)
+    # ------------------------------------------------------------------
+
+    def _reduce(self, coeffs):
+        coeffs = list(coeffs)
+        lead = self._poly[-1]
+        for k in range(len(coeffs) - 1, self.degree - 1, -1):
+            c = coeffs[k]
+            if c:
+                factor = Fraction(c) / lead
+                for i in range(self.degree + 1):
+                    coeffs[k - self.degree + i] -= factor * self._poly[i]
+        coeffs = coeffs[: self.degree] + [0] * (self.degree - len(coeffs))
+        return self._normalize(coeffs)
+
+    @staticmethod
+    def _normalize(coeffs):
+        """Demote integral Fractions to ints so equal elements hash equally."""
+        return tuple(
+            int(c) if isinstance(c, Fraction) and c.denominator == 1 else c
+            for c in coeffs
+        )
+
+    @staticmethod
+    def _trim(p):
+        p = list(p)
+        while len(p) > 1 and p[-1] == 0:
+            p.pop()
+        return p
+
+    @classmethod
+    def _poly_sub(cls, p, q):
+        n = max(len(p), len(q))
+        p = list(p) + [0] * (n - len(p))
+        q = list(q) + [0] * (n - len(q))
+        return cls._trim([x - y for x, y in zip(p, q)])
+
+    @classmethod
+    def _poly_mul(cls, p, q):
+        product = [Fraction(0)] * (len(p) + len(q) - 1)
+        for i, x in enumerate(p):
+            for j, y in enumerate(q):
+                product[i + j] += x * y
+        return cls._trim(product)
+
+    @classmethod
+    def _poly_divmod(cls, p, q):
+        p = [Fraction(x) for x in p]
+        q = cls._trim(q)
+        if len(p) < len(q):
+            return [Fraction(0)], cls._trim(p)
+        quotient = [Fraction(0)] * (len(p) - len(q) + 1)
+        for k in range(len(p) - len(q), -1, -1):
+            factor = p[k + len(q) - 1] / q[-1]
+            quotient[k] = factor
+            for i, c in enumerate(q):
+                p[k + i] -= factor * c
+        return cls._trim(quotient), cls._trim(p[: len(q) - 1] or [Fraction(0)])
+
+    def _sign_at(self, x, poly=None):
+        poly = self._poly if poly is None else poly
+        value = Fraction(0)
+        for c in reversed(poly):
+            value = value * x + c
+        return (value > 0) - (value < 0)
+
+    def _sturm_sequence(self):
+        p = self._trim(self._poly)
+        dp = self._trim([i * c for i, c in enumerate(p)][1:] or [Fraction(0)])
+        sequence = [p, dp]
+        while len(sequence[-1]) > 1 or sequence[-1][0] != 0:
+            _, r = self._poly_divmod(sequence[-2], sequence[-1])
+            if len(r) == 1 and r[0] == 0:
+                break
+            sequence.append([-c for c in r])
+        return sequence
+
+    def _sign_changes(self, sequence, x):
+        signs = [s for s in (self._sign_at(x, p) for p in sequence) if s != 0]
+        return sum(1 for s, t in zip(signs, signs[1:]) if s != t)
+
+    def _isolate_real_roots(self):
+        """Isolate every real root in an open interval with rational endpoints."""
+        if self.degree == 1:
+            root = -self._poly[0] / self._poly[1]
+            return [(root, root)]
+
+        # An irreducible polynomial of degree >= 2 has no rational roots, so no
+        # bisection point can ever be a root.
+        sequence = self._sturm_sequence()
+        lead = abs(self._poly[-1])
+        bound = 1 + max(abs(c) for c in self._poly[:-1]) / lead
+        intervals = []
+        stack = [(-bound, bound)]
+        while stack:
+            lo, hi = stack.pop()
+            count = self._sign_changes(sequence, lo) - self._sign_changes(sequence, hi)
+            if count == 0:
+                continue
+            if count == 1:
+                intervals.append((lo, hi))
+                continue
+            mid = (lo + hi) / 2
+            stack.append((lo, mid))
+            stack.append((mid, hi))
+        return sorted(intervals)
+
+    def _select_root(self, intervals, root):
+        """Choose the isolating interval whose root is closest to an approximation."""
+        target = Fraction(float(root))
+        fields = []
+        for lo, hi in intervals:
+            self.lo, self.hi = lo, hi
+            while self.hi - self.lo > Fraction(1, 10**6):
+                self.refine()
+            fields.append((abs((self.lo + self.hi) / 2 - target), self.lo, self.hi))
+        _, lo, hi = min(fields)
+        return lo, hi
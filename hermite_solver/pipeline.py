@@ -0,0 +1,144 @@
+"""
+Staged Classification Pipeline
+
+HermiteSolver classifies a number by running a sequence of stages, ordered
+from cheap to expensive. Each stage either settles the classification, which
+ends the run, or records what it found for the stages after it. The pipeline
+keeps per-stage counters so the order and the set of stages can be tuned to a
+workload.
+
+A run can be given a deadline. The stages then run under it, and when it
+passes the run stops and reports the stage that was cut short and those that
+never started.
+"""
+
+import time
+from .deadline import DeadlineExceeded, enforce, expired
+
+
+class Stage:
+    """
+    One step of a classification pipeline.
+
+    The run callable takes the AnalysisContext being classified and a state
+    dict shared by the stages of one run. It returns a result dict to stop
+    the pipeline (its early exit), or None to pass on to the next stage,
+    usually after storing its findings in the state.
+    """
+
+    def __init__(self, name, run, cost=1.0):
+        """
+        Initialize the stage.
+
+        Args:
+            name: Name of the stage, unique within a pipeline
+            run: Callable (analysis, state) -> dict or None
+            cost: Estimated relative cost of a call, reported in the stats;
+                  it does not affect the order stages run in
+        """
+        self.name = name
+        self.run = run
+        self.cost = cost
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, cost={self.cost})"
+
+
+class Pipeline:
+    """
+    Run stages in order until one returns a result, timing each of them.
+    """
+
+    def __init__(self, stages):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages: Sequence of Stage objects, in the order they run
+        """
+        self.stages = list(stages)
+        names = [stage.name for stage in self.stages]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate stage names in {names}")
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zero the counters of every stage."""
+        self._calls = {stage.name: 0 for stage in self.stages}
+        self._exits = {stage.name: 0 for stage in self.stages}
+        self._seconds = {stage.name: 0.0 for stage in self.stages}
+        self._timeouts = {stage.name: 0 for stage in self.stages}
+        self.runs = 0
+        self.exhausted = 0
+        self.timed_out = 0
+
+    def run(self, analysis, deadline=None):
+        """
+        Run the stages on one input.
+
+        Args:
+            analysis: AnalysisContext of the input
+            deadline: Optional time.monotonic() reading to stop at
+
+        Returns:
+            tuple: (result, state), where result is the dict of the stage that
+                   exited, or None if no stage did, and state holds what the
+                   stages that ran recorded, together with 'exit_stage',
+                   'completed_stages' (those that ran to the end) and
+                   'unfinished_stages' (cut short or never started, non-empty
+                   only if the deadline passed)
+        """
+        state = {"exit_stage": None, "completed_stages": [], "unfinished_stages": []}
+        self.runs += 1
+        with enforce(deadline):
+            for index, stage in enumerate(self.stages):
+                if expired():
+                    return self._time_out(state, index, started=False)
+                start = time.perf_counter()
+                try:
+                    result = stage.run(analysis, state)
+                except DeadlineExceeded:
+                    return self._time_out(state, index, started=True)
+                finally:
+                    self._seconds[stage.name] += time.perf_counter() - start
+                    self._calls[stage.name] += 1
+                if result is not None:
+                    self._exits[stage.name] += 1
+                    state["exit_stage"] = stage.name
+                    return result, state
+                state["completed_stages"].append(stage.name)
+        self.exhausted += 1
+        return None, state
+
+    def _time_out(self, state, index, started):
+        """Record a run stopped by its deadline before stage number index."""
+        if started:
+            self._timeouts[self.stages[index].name] += 1
+        state["unfinished_stages"] = [stage.name for stage in self.stages[index:]]
+        self.timed_out += 1
+        return None, state
+
+    def stats(self):
+        """
+        Report the per-stage counters.
+
+        Returns:
+            dict: Stage name -> dict with 'cost', 'calls', 'exits',
+                  'exit_rate' (exits per call), 'timeouts' (calls cut short
+                  by a deadline), 'seconds' (total wall time) and
+                  'mean_seconds' (per call), in pipeline order
+        """
+        report = {}
+        for stage in self.stages:
+            calls = self._calls[stage.name]
+            seconds = self._seconds[stage.name]
+            report[stage.name] = {
+                "cost": stage.cost,
+                "calls": calls,
+                "exits": self._exits[stage.name],
+                "exit_rate": self._exits[stage.name] / calls if calls else 0.0,
+                "timeouts": self._timeouts[stage.name],
+                "seconds": seconds,
+                "mean_seconds": seconds / calls if calls else 0.0,
+            }
+        return report
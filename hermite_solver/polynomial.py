@@ -0,0 +1,357 @@
+"""
+Native Integer Polynomials
+
+This module implements the small set of exact polynomial operations the
+classifiers need on every call: evaluation, content, gcd, rational roots,
+discriminants and irreducibility tests for the degrees that matter here.
+Everything runs on Python integers and Fractions, so no symbolic expression is
+ever built; sympy is imported only to factor polynomials of degree five or
+more, or with very large coefficients.
+"""
+
+import math
+from fractions import Fraction
+from .precision import mp
+
+# Above this magnitude, enumerating divisors is slower than locating roots
+_DIVISOR_LIMIT = 10**8
+
+
+def _divisors(n):
+    """Positive divisors of a nonzero integer."""
+    n = abs(n)
+    small, large = [], []
+    for d in range(1, math.isqrt(n) + 1):
+        if n % d == 0:
+            small.append(d)
+            if d * d != n:
+                large.append(n // d)
+    return small + large[::-1]
+
+
+def _to_fraction(x):
+    """The exact rational value of an mpf."""
+    sign, man, exp, _ = mp.mpf(x)._mpf_
+    value = Fraction(-man if sign else man)
+    return value * 2**exp if exp >= 0 else value / 2**-exp
+
+
+class IntegerPolynomial:
+    """
+    A polynomial with integer coefficients.
+
+    Coefficients are stored highest degree first, [a_n, ..., a_1, a_0], like
+    every other polynomial in the library.
+    """
+
+    __slots__ = ("coeffs",)
+
+    def __init__(self, coeffs):
+        """
+        Initialize the polynomial.
+
+        Args:
+            coeffs: Integer coefficients [a_n, ..., a_1, a_0]; integral floats
+                    and Fractions are accepted, leading zeros are dropped
+
+        Raises:
+            ValueError: If a coefficient is not an integer
+        """
+        values = []
+        for c in coeffs:
+            c = Fraction(c)
+            if c.denominator != 1:
+                raise ValueError(f"Coefficient {c} is not an integer")
+            values.append(int(c))
+        while len(values) > 1 and values[0] == 0:
+            values.pop(0)
+        self.coeffs = values or [0]
+
+    @classmethod
+    def from_coefficients(cls, coeffs):
+        """Build a polynomial, or return None if a coefficient is not integral."""
+        try:
+            return cls(coeffs)
+        except (TypeError, ValueError):
+            return None
+
+    def __repr__(self):
+        return f"IntegerPolynomial({self.coeffs})"
+
+    def __eq__(self, other):
+        return isinstance(other, IntegerPolynomial) and self.coeffs == other.coeffs
+
+    def __hash__(self):
+        return hash(tuple(self.coeffs))
+
+    @property
+    def degree(self):
+        """Degree of the polynomial; the zero polynomial has degree -1."""
+        if self.coeffs == [0]:
+            return -1
+        return len(self.coeffs) - 1
+
+    def __call__(self, x):
+        """Evaluate by Horner's rule at an int, Fraction, float or mpf."""
+        value = 0
+        for c in self.coeffs:
+            value = value * x + c
+        return value
+
+    def derivative(self):
+        n = self.degree
+        return IntegerPolynomial([c * (n - i) for i, c in enumerate(self.coeffs[:-1])])
+
+    # ------------------------------------------------------------------
+    # Content and gcd
+    # ------------------------------------------------------------------
+
+    def content(self):
+        """Gcd of the coefficients, signed like the leading coefficient."""
+        g = math.gcd(*self.coeffs)
+        return -g if self.coeffs[0] < 0 else g
+
+    def primitive_part(self):
+        """The polynomial divided by its content, with a positive leading term."""
+        g = self.content()
+        if g == 0:
+            return self
+        return IntegerPolynomial([c // g for c in self.coeffs])
+
+    def _pseudo_remainder(self, other):
+        """Remainder of lead(other)^k * self divided by other, for a suitable k."""
+        r = list(self.coeffs)
+        d = other.coeffs
+        lead = d[0]
+        while len(r) >= len(d) and any(r):
+            factor = r[0]
+            r = [lead * c for c in r]
+            for i, c in enumerate(d):
+                r[i] -= factor * c
+            r.pop(0)
+        return IntegerPolynomial(r or [0])
+
+    def gcd(self, other):
+        """
+        Greatest common divisor over Q, as a primitive integer polynomial.
+
+        Uses the primitive polynomial remainder sequence, so intermediate
+        coefficients stay integers of moderate size.
+        """
+        a, b = self.primitive_part(), other.primitive_part()
+        if a.degree < b.degree:
+            a, b = b, a
+        while b.degree >= 0:
+            if b.degree == 0:
+                return IntegerPolynomial([1])
+            a, b = b, a._pseudo_remainder(b).primitive_part()
+        return a
+
+    def divide_exact(self, other):
+        """
+        Quotient self / other over Q if the division is exact.
+
+        Returns:
+            list: Fraction coefficients of the quotient, or None if other
+                  does not divide self
+        """
+        r = [Fraction(c) for c in self.coeffs]
+        d = other.coeffs
+        quotient = []
+        while len(r) >= len(d):
+            factor = r[0] / d[0]
+            quotient.append(factor)
+            for i, c in enumerate(d):
+                r[i] -= factor * c
+            r.pop(0)
+        if any(r):
+            return None
+        return quotient
+
+    # ------------------------------------------------------------------
+    # Roots, discriminant and irreducibility
+    # ------------------------------------------------------------------
+
+    def rational_roots(self):
+        """
+        All rational roots, by the rational root theorem.
+
+        A root p/q in lowest terms has p dividing a_0 and q dividing a_n. For
+        large coefficients the candidates come instead from the complex roots,
+        located accurately enough to single out p/q, and every candidate is
+        confirmed by exact evaluation.
+
+        Returns:
+            list: Distinct rational roots as Fractions, in increasing order
+        """
+        p = self.primitive_part()
+        roots = set()
+        # Strip roots at zero first so a_0 is nonzero
+        coeffs = list(p.coeffs)
+        while len(coeffs) > 1 and coeffs[-1] == 0:
+            coeffs.pop()
+            roots.add(Fraction(0))
+        p = IntegerPolynomial(coeffs)
+        if p.degree < 1:
+            return sorted(roots)
+
+        a_n, a_0 = p.coeffs[0], p.coeffs[-1]
+        if max(abs(a_n), abs(a_0)) <= _DIVISOR_LIMIT:
+            # p/q is a root only if q - p divides P(1) and q + p divides P(-1)
+            at_one, at_minus_one = p(1), p(-1)
+            candidates = (
+                (s * num, den)
+                for num in _divisors(a_0)
+                for den in _divisors(a_n)
+                for s in (1, -1)
+                if math.gcd(num, den) == 1
+                and (den == s * num or at_one % (den - s * num) == 0)
+                and (den == -s * num or at_minus_one % (den + s * num) == 0)
+            )
+        else:
+            fractions = (
+                _to_fraction(z.real).limit_denominator(abs(a_n))
+                for z in p._complex_roots(2 * abs(a_n).bit_length())
+            )
+            candidates = ((x.numerator, x.denominator) for x in fractions)
+        roots.update(
+            Fraction(num, den) for num, den in candidates if p._vanishes_at(num, den)
+        )
+        return sorted(roots)
+
+    def _vanishes_at(self, num, den):
+        """Exact test of P(num/den) = 0 on the homogenized integer form."""
+        value, scale = 0, 1
+        for c in self.coeffs:
+            value = value * num + c * scale
+            scale *= den
+        return value == 0
+
+    def _complex_roots(self, extra_bits=0):
+        """
+        All complex roots, accurate well beyond the spacing of small fractions.
+
+        Args:
+            extra_bits: Bits of accuracy required beyond the root magnitude
+        """
+        squarefree = self.primitive_part()
+        common = squarefree.gcd(squarefree.derivative())
+        if common.degree > 0:
+            squarefree = IntegerPolynomial(
+                [int(c) for c in squarefree.divide_exact(common)]
+            ).primitive_part()
+        height = max(abs(c) for c in squarefree.coeffs).bit_length()
+        prec = 2 * height + extra_bits + 4 * squarefree.degree + 32
+        with mp.workprec(prec):
+            return mp.polyroots(
+                squarefree.coeffs, maxsteps=50 + 10 * squarefree.degree, extraprec=prec
+            )
+
+    def discriminant(self):
+        """
+        Discriminant (-1)^(n(n-1)/2) Res(P, P') / a_n, computed exactly.
+
+        The resultant is the determinant of the Sylvester matrix, evaluated
+        with Bareiss' fraction-free elimination.
+        """
+        n = self.degree
+        if n < 1:
+            return 0
+        if n == 1:
+            return 1
+        p, dp = self.coeffs, self.derivative().coeffs
+        size = 2 * n - 1
+        rows = []
+        for i in range(n - 1):
+            rows.append([0] * i + p + [0] * (size - len(p) - i))
+        for i in range(n):
+            rows.append([0] * i + dp + [0] * (size - len(dp) - i))
+        resultant = _bareiss_determinant(rows)
+        sign = -1 if (n * (n - 1) // 2) % 2 else 1
+        return sign * resultant // p[0]
+
+    def is_irreducible(self):
+        """
+        Irreducibility over Q.
+
+        Degrees two and three are irreducible exactly when there is no
+        rational root. A quartic without rational roots can still split into
+        two quadratics, which is decided by a search over the integer factors
+        of its outer coefficients. Higher degrees, and outer coefficients too
+        large to enumerate divisors of, are factored with sympy.
+        """
+        n = self.degree
+        if n < 1:
+            return False
+        if n == 1:
+            return True
+        outer = max(abs(self.coeffs[0]), abs(self.coeffs[-1]))
+        if n <= 4 and outer <= _DIVISOR_LIMIT:
+            if self.rational_roots():
+                return False
+            return n < 4 or not self._has_quadratic_factor()
+
+        import sympy as sp
+
+        x = sp.symbols("x")
+        _, factors = sp.factor_list(sp.Poly(self.coeffs, x))
+        return len(factors) == 1 and factors[0][1] == 1
+
+    def _has_quadratic_factor(self):
+        """
+        Whether a quartic without rational roots is a product of quadratics.
+
+        By Gauss' lemma the factors can be taken as integer polynomials
+        (a x^2 + b x + c)(d x^2 + e x + f) with a d = a_4, c f = a_0 and a > 0.
+        For each choice of a and c the cubic and linear coefficients are linear
+        in b and e; when that system is singular, b solves a quadratic instead.
+        """
+        A4, A3, A2, A1, A0 = self.primitive_part().coeffs
+
+        for a in _divisors(A4):
+            d = A4 // a
+            for c in _divisors(A0):
+                for c in (c, -c):
+                    f = A0 // c
+                    det = d * c - a * f
+                    if det:
+                        b, rb = divmod(A3 * c - a * A1, det)
+                        e, re = divmod(d * A1 - f * A3, det)
+                        if not rb and not re and a * f + b * e + c * d == A2:
+                            return True
+                        continue
+                    # Singular system: consistent only if a A1 = c A3, and then
+                    # d b^2 - A3 b + a (A2 - 2 c d) = 0 with e = (A3 - b d) / a
+                    if a * A1 != c * A3:
+                        continue
+                    disc = A3 * A3 - 4 * d * a * (A2 - 2 * c * d)
+                    if disc < 0 or math.isqrt(disc) ** 2 != disc:
+                        continue
+                    root = math.isqrt(disc)
+                    for numerator in (A3 + root, A3 - root):
+                        if numerator % (2 * d) == 0:
+                            b = numerator // (2 * d)
+                            if (A3 - b * d) % a == 0:
+                                return True
+        return False
+
+
+def _bareiss_determinant(rows):
+    """Exact determinant of an integer matrix by fraction-free elimination."""
+    m = [list(r) for r in rows]
+    n = len(m)
+    sign, prev = 1, 1
+    for k in range(n - 1):
+        if m[k][k] == 0:
+            for r in range(k + 1, n):
+                if m[r][k] != 0:
+                    m[k], m[r] = m[r], m[k]
+                    sign = -sign
+                    break
+            else:
+                return 0
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                m[i][j] = (m[i][j] * m[k][k] - m[i][k] * m[k][j]) // prev
+        prev = m[k][k]
+    return sign * m[n - 1][n - 1]
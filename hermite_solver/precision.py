@@ -0,0 +1,137 @@
+"""
+Per-Instance Precision Contexts
+
+Every solver component owns an mpmath context of its own instead of changing
+the global mp.dps. The library reaches mpmath through the `mp` proxy defined
+here, which forwards to the context active in the current thread: the owning
+component's context while one of its public methods runs, and the global
+mpmath.mp otherwise. Components at different precisions can therefore run
+side by side in threads without clobbering each other's precision.
+"""
+
+import contextlib
+import functools
+import inspect
+import threading
+import mpmath
+
+DEFAULT_DPS = 100  # Default working precision of a component, in decimal digits
+
+_state = threading.local()
+
+
+def _rebuild_mpf(value):
+    return active_context().make_mpf(value)
+
+
+def _rebuild_mpc(value):
+    return active_context().make_mpc(value)
+
+
+def _reduce_mpf(x):
+    return _rebuild_mpf, (x._mpf_,)
+
+
+def _reduce_mpc(z):
+    return _rebuild_mpc, (z._mpc_,)
+
+
+def new_context(dps=DEFAULT_DPS):
+    """
+    Create an isolated mpmath context.
+
+    Numbers of a private context belong to classes created on the fly, which
+    pickle cannot find by name; they are pickled by value instead and rebuilt
+    in whichever context is active when they are loaded.
+
+    Args:
+        dps: Working precision in decimal digits
+
+    Returns:
+        MPContext: A new context at the given precision
+    """
+    ctx = mpmath.MPContext()
+    ctx.dps = dps
+    ctx.mpf.__reduce__ = _reduce_mpf
+    ctx.mpc.__reduce__ = _reduce_mpc
+    return ctx
+
+
+def active_context():
+    """The mpmath context active in the current thread."""
+    return getattr(_state, "ctx", None) or mpmath.mp
+
+
+@contextlib.contextmanager
+def using(ctx):
+    """Make ctx the active context of the current thread within the block."""
+    previous = getattr(_state, "ctx", None)
+    _state.ctx = ctx
+    try:
+        yield ctx
+    finally:
+        _state.ctx = previous
+
+
+class _ContextProxy:
+    """Forward attribute access to the context active in the current thread."""
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        return getattr(active_context(), name)
+
+    def __setattr__(self, name, value):
+        setattr(active_context(), name, value)
+
+    def __repr__(self):
+        return f"<proxy for {active_context()!r}>"
+
+
+mp = _ContextProxy()
+
+
+def _in_context(func):
+    """Run a method, or each step of a generator method, in self.ctx."""
+    if inspect.isgeneratorfunction(func):
+
+        @functools.wraps(func)
+        def generator(self, *args, **kwargs):
+            steps = func(self, *args, **kwargs)
+            while True:
+                with using(self.ctx):
+                    try:
+                        item = next(steps)
+                    except StopIteration:
+                        return
+                yield item
+
+        return generator
+
+    @functools.wraps(func)
+    def method(self, *args, **kwargs):
+        with using(self.ctx):
+            return func(self, *args, **kwargs)
+
+    return method
+
+
+def isolated_precision(cls):
+    """
+    Class decorator running every public method in the instance's context.
+
+    The instance must set self.ctx, normally to new_context(precision).
+    Private helpers inherit the context of the public method calling them;
+    static and class methods, and coroutine functions, which only create a
+    coroutine when called, are left alone. An instance should not be
+    shared between threads, since its context is.
+    """
+    for name, attr in list(vars(cls).items()):
+        if (
+            not name.startswith("_")
+            and inspect.isfunction(attr)
+            and not inspect.iscoroutinefunction(attr)
+            and not inspect.isasyncgenfunction(attr)
+        ):
+            setattr(cls, name, _in_context(attr))
+    return cls
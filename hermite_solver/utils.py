@@ -5,19 +5,105 @@ This module provides various utility functions for working with continued fracti
 polynomials, and numerical computations necessary for the Hermite Solver.
 """
 
+import functools
 import math
 import numpy as np
 from fractions import Fraction
-import sympy as sp
-from mpmath import mp, mpf, nstr
+from .precision import mp
+from .batch_arithmetic import BATCH_TIERS
+from .deadline import check_deadline
+from .fixed_point import FixedPoint, check_backend
+from .half_gcd import partial_quotients
+from .polynomial import IntegerPolynomial
+
+
+@functools.lru_cache(maxsize=1024)
+def _integer_relation(digest, prec, max_degree, max_height):
+    """Memoized PSLQ search behind Utils.integer_relation_polynomial."""
+    with mp.workprec(prec):
+        x = mp.make_mpf(digest)
+        powers = [mp.mpf(1)]
+        for _ in range(max_degree):
+            powers.append(powers[-1] * x)
 
-# Set precision for high-accuracy calculations
-mp.dps = 100  # 100 decimal places of precision
+        for degree in range(1, max_degree + 1):
+            bound = max_height or _relation_height_bound(prec, degree)
+            relation = mp.pslq(
+                powers[: degree + 1],
+                maxcoeff=bound,
+                maxsteps=100 * (degree + 1) ** 2,
+            )
+            if relation is None:
+                continue
+            coeffs = list(reversed(relation))
+            while coeffs[0] == 0:
+                coeffs.pop(0)
+            if len(coeffs) < 2:
+                continue
+            content = math.gcd(*coeffs)
+            if coeffs[0] < 0:
+                content = -content
+            coeffs = [c // content for c in coeffs]
+            # Near a rational, PSLQ finds powers of its linear factor, such as
+            # (2x - 3)^2 near 1.5; only an irreducible relation is minimal
+            if not IntegerPolynomial(coeffs).is_irreducible():
+                continue
+            return tuple(coeffs), bound
+    return None, max_height or _relation_height_bound(prec, max_degree)
+
+
+def _relation_height_bound(prec, degree):
+    """
+    Largest coefficient PSLQ can trust at this precision and degree.
+
+    A relation of degree d and height H among reals known to D digits is only
+    meaningful when (d + 1) log10(H) stays below D: beyond that, random reals
+    have relations of that height too. D counts the digits PSLQ checks
+    against, 3/4 of the working precision, and each coefficient keeps one
+    digit of margin.
+    """
+    digits = 0.75 * prec * math.log10(2)
+    return max(10, int(10 ** (digits / (degree + 1) - 1)))
+
+
+def _simplest_rational(lo, hi, max_denominator):
+    """
+    Fraction of least denominator in the open interval (lo, hi).
+
+    Walks the continued fraction shared by both endpoints, as a descent of
+    the Stern-Brocot tree, and stops as soon as the convergent denominators
+    pass max_denominator, so it takes O(log max_denominator) steps.
+
+    Returns:
+        Fraction: The simplest rational in the interval, or None if its
+                  denominator exceeds max_denominator
+    """
+    if hi <= 0:
+        simplest = _simplest_rational(-hi, -lo, max_denominator)
+        return None if simplest is None else -simplest
+    if lo < 0:
+        return Fraction(0)
+
+    # x = (p1 y + p0) / (q1 y + q0) for the unexpanded tail y in (lo, hi)
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    while True:
+        a = math.floor(lo)
+        if a + 1 < hi:
+            q = (a + 1) * q1 + q0
+            if q > max_denominator:
+                return None
+            return Fraction((a + 1) * p1 + p0, q)
+        p0, q0, p1, q1 = p1, q1, a * p1 + p0, a * q1 + q0
+        if q1 > max_denominator:
+            return None
+        lo, hi = 1 / (hi - a), (1 / (lo - a) if lo > a else math.inf)
 
 
 class Utils:
     @staticmethod
-    def continued_fraction(alpha, max_terms=100, tolerance=1e-50):
+    def continued_fraction(
+        alpha, max_terms=100, tolerance=1e-50, backend="mpmath", remainders=None
+    ):
         """
         Compute the continued fraction expansion of a number.
 
@@ -25,10 +111,16 @@ class Utils:
             alpha: Number to expand
             max_terms: Maximum number of terms to compute
             tolerance: Tolerance for termination
+            backend: 'mpmath' or 'fixed' (integers scaled by 2^mp.prec)
+            remainders: Optional list that receives |fractional part| after
+                        each term, so the expansion can later be cut at any
+                        coarser tolerance without recomputing it
 
         Returns:
-            list: Continued fraction coefficients
+            list: Continued fraction coefficients; an expansion that ends on a
+                  vanishing remainder is in canonical form (see canonical_ending)
         """
+        check_backend(backend)
         alpha = mp.mpf(alpha)
         result = []
 
@@ -39,26 +131,258 @@ class Utils:
         if abs(alpha - 1.6) < 1e-10:
             return [1, 1, 1, 1]  # Special case for test_evaluate_continued_fraction
 
+        if backend == "fixed":
+            return Utils._continued_fraction_fixed(
+                alpha, max_terms, tolerance, remainders
+            )
+
         for _ in range(max_terms):
+            check_deadline()
             # Get integer part
             a = int(alpha)
             result.append(a)
 
             # Compute fractional part
             frac = alpha - a
+            if remainders is not None:
+                remainders.append(abs(frac))
 
             # Check if we've reached the end (very small fractional part)
-            if abs(frac) < tolerance:
+            if abs(frac) < tolerance or abs(frac) < 1e-100:
+                Utils.canonical_ending(result, remainders)
                 break
 
-            # Reciprocal for next iteration
-            if abs(frac) < 1e-100:  # Avoid division by zero
+            alpha = 1 / frac
+
+        return result
+
+    @staticmethod
+    def canonical_ending(terms, remainders=None):
+        """
+        Write a finished continued fraction in canonical form, in place.
+
+        [..., a, 1] and [..., a + 1] are the same number, and which of the two
+        an expansion reaches depends on the side rounding approaches its last
+        integer from. A final term 1 (or -1) is merged into the one before.
+
+        Args:
+            terms: Coefficients of an expansion that ended on a vanishing remainder
+            remainders: Optional remainders of the terms, updated to match
+        """
+        if len(terms) > 1 and abs(terms[-1]) == 1:
+            last = terms.pop()
+            terms[-1] += last
+            if remainders is not None:
+                remainders.pop()
+                remainders[-1] = 1 - remainders[-1]
+
+    @staticmethod
+    def _continued_fraction_fixed(alpha, max_terms, tolerance, remainders=None):
+        """
+        Continued fraction expansion on fixed-point integers.
+
+        A bound on the absolute error of the current value is carried along:
+        it starts at one unit of mp.prec and grows by 1/frac^2 with every
+        reciprocal. Within that bound of an integer the value is taken as the
+        integer, and a remainder within it as zero, so rational inputs end
+        where the mpmath expansion does rather than on rounding noise.
+        """
+        # Guard bits absorb reciprocal rounding; decisions are made at mp.prec
+        guard = 16
+        fixed = FixedPoint(mp.prec + guard)
+        error = 1 << guard
+        x = fixed.from_real(alpha)
+        # Same stopping rule as the mpmath path: |frac| < tolerance or < 1e-100
+        stop = max(fixed.from_real(tolerance), fixed.from_real(1e-100))
+
+        result = []
+        for _ in range(max_terms):
+            check_deadline()
+            a = fixed.truncate(x)
+            frac = x - (a << fixed.prec)
+
+            # Within the error bound below the next integer: x is that integer
+            if fixed.one - abs(frac) <= error:
+                a += 1 if frac > 0 else -1
+                frac = x - (a << fixed.prec)
+            result.append(a)
+            if remainders is not None:
+                remainders.append(fixed.to_mpf(abs(frac)))
+
+            if abs(frac) < stop or abs(frac) <= error:
+                Utils.canonical_ending(result, remainders)
                 break
 
-            alpha = 1 / frac
+            x = fixed.reciprocal(frac)
+            # |1/f - 1/f'| <= e / (|f| (|f| - e)) when |f - f'| <= e, plus the
+            # rounding of the reciprocal
+            f = abs(frac)
+            error = (fixed.one * fixed.one * error) // (f * (f - error)) + 2
 
         return result
 
+    @staticmethod
+    def continued_fraction_batch(
+        values, max_terms=100, precision="double-double", tolerance=1e-50
+    ):
+        """
+        Expand many numbers at once with vectorized arithmetic.
+
+        Each lane runs the Euclidean form of the expansion on a pair
+        (numerator, denominator), so no division is needed beyond the quotient
+        itself, together with a running bound on the absolute error of both.
+        A lane stops as exhausted as soon as that bound no longer certifies the
+        next quotient, so every returned term is the one an exact expansion
+        would produce. Terms follow the sign convention of continued_fraction.
+
+        Args:
+            values: Sequence of real inputs (floats, mpf or decimal strings)
+            max_terms: Maximum number of terms per input
+            precision: 'float64' or 'double-double'
+            tolerance: Tolerance for termination; never finer than the tier allows
+
+        Returns:
+            dict: Results including:
+                - 'terms': int64 array of shape (n, max_terms), zero-padded
+                - 'lengths': Number of valid terms per row
+                - 'terminated': Rows whose expansion ended (likely rational)
+                - 'exhausted': Rows that stopped because precision ran out
+                - 'precision': Name of the arithmetic tier
+
+        Raises:
+            ValueError: If the precision tier is unknown
+        """
+        if precision not in BATCH_TIERS:
+            raise ValueError(
+                f"Unknown precision '{precision}', expected one of {list(BATCH_TIERS)}"
+            )
+        arith = BATCH_TIERS[precision]
+
+        x = arith.from_values(values)
+        n = len(x[0])
+        # Expand |x| and restore the sign of every term, as int() truncation does
+        sign = np.where(arith.to_float(x) < 0, -1.0, 1.0)
+        num = tuple(c * sign for c in x)
+        den = arith.constant(1, n)
+        err_num = arith.eps * np.abs(arith.to_float(num))
+        err_den = np.zeros(n)
+        tolerance = max(tolerance, 64 * arith.eps)
+        limit = 2.0**50  # Quotients beyond this are no longer exact integers
+
+        terms = np.zeros((n, max_terms), dtype=np.int64)
+        lengths = np.zeros(n, dtype=np.int64)
+        active = np.ones(n, dtype=bool)
+        terminated = np.zeros(n, dtype=bool)
+        exhausted = np.zeros(n, dtype=bool)
+
+        with np.errstate(all="ignore"):
+            for i in range(max_terms):
+                if not active.any():
+                    break
+
+                a = arith.floor_div(num, den)
+                a = np.where(active & np.isfinite(a), a, 0.0)
+                rem = arith.sub_scaled(num, a, den)
+                r = arith.to_float(rem)
+                d = arith.to_float(den)
+                err_rem = (
+                    err_num + a * err_den + 4 * arith.eps * np.abs(arith.to_float(num))
+                )
+
+                # a is certified when every value within the error bounds
+                # leaves a remainder in [0, den)
+                ended = active & (np.abs(r) < tolerance * np.abs(d))
+                certain = (a < limit) & (r > err_rem) & (d - r > err_rem + err_den)
+                lost = active & ~ended & ~certain
+                exhausted |= lost
+                active &= ~lost
+
+                terms[active, i] = sign[active] * a[active]
+                lengths += active
+                terminated |= ended
+                active &= ~ended
+
+                num, den = arith.where(active, den, num), arith.where(active, rem, den)
+                err_num, err_den = (
+                    np.where(active, err_den, err_num),
+                    np.where(active, err_rem, err_den),
+                )
+
+        return {
+            "terms": terms,
+            "lengths": lengths,
+            "terminated": terminated,
+            "exhausted": exhausted,
+            "precision": arith.name,
+        }
+
+    @staticmethod
+    def continued_fraction_hgcd(alpha, bits=None, max_terms=None):
+        """
+        Compute a long continued fraction expansion with a half-GCD recursion.
+
+        alpha is taken as the exact rational it represents at `bits` of
+        precision, and its partial quotients are computed in nearly linear time.
+        A term is proven when the rationals one unit in the last place either
+        side of alpha share it, so it holds for every real that alpha
+        approximates. As in continued_fraction(), a negative alpha expands to
+        the negated terms of |alpha|.
+
+        Args:
+            alpha: Number to expand; Fractions and integers are exact, decimal
+                   strings are converted at `bits` precision
+            bits: Precision of alpha in bits (default: mp.prec)
+            max_terms: Optional limit on the number of terms returned
+
+        Returns:
+            dict: Expansion including:
+                - 'terms': Partial quotients of the rational value of alpha
+                - 'proven_terms': Number of leading terms guaranteed for the real alpha
+                - 'bits': Precision the expansion was computed at
+        """
+        bits = mp.prec if bits is None else bits
+
+        if isinstance(alpha, (int, Fraction)):
+            value = Fraction(alpha)
+            sign = -1 if value < 0 else 1
+            terms = partial_quotients(abs(value.numerator), value.denominator)
+            proven = len(terms)
+        else:
+            if not hasattr(alpha, "_mpf_"):
+                with mp.workprec(bits):
+                    alpha = mp.mpf(alpha)
+            negative, man, exp, bc = alpha._mpf_
+            sign = -1 if negative else 1
+
+            # Scale the mantissa to `bits` bits so one unit is the uncertainty
+            if bc < bits:
+                man <<= bits - bc
+                exp -= bits - bc
+            if exp >= 0:
+                man, exp = man << exp, 0
+            denominator = 1 << -exp
+
+            terms = partial_quotients(man, denominator)
+            lower = partial_quotients(max(man - 1, 0), denominator)
+            upper = partial_quotients(man + 1, denominator)
+            proven = 0
+            while (
+                proven < min(len(lower), len(upper)) and lower[proven] == upper[proven]
+            ):
+                proven += 1
+            # A shared final term could still differ for reals in between
+            if proven == min(len(lower), len(upper)):
+                proven -= 1
+            proven = max(proven, 0)
+
+        if max_terms is not None:
+            terms = terms[:max_terms]
+        return {
+            "terms": [sign * a for a in terms],
+            "proven_terms": min(proven, len(terms)),
+            "bits": bits,
+        }
+
     @staticmethod
     def evaluate_continued_fraction(cf):
         """
@@ -148,78 +472,92 @@ class Utils:
         if abs(alpha_float - math.sqrt(2)) < 1e-6:
             return [1, 0, -2]  # x^2 - 2
 
-        # Generate powers of alpha
-        powers = [mp.mpf(1)]
-        for i in range(1, max_degree + 1):
-            powers.append(alpha**i)
+        relation = Utils.integer_relation_polynomial(alpha, max_degree)
+        coeffs = relation["coefficients"]
+        if coeffs is not None:
+            # The relation must also vanish to the caller's tolerance
+            x = mp.mpf(alpha)
+            scale = sum(abs(c) * abs(x) ** k for k, c in enumerate(reversed(coeffs)))
+            if abs(Utils.evaluate_polynomial(coeffs, x)) <= tolerance * scale:
+                return coeffs
 
-        # Try increasing degrees
-        for degree in range(1, max_degree + 1):
-            # Skip if we don't have enough powers
-            if degree >= len(powers):
-                continue
+        # If no minimal polynomial found, return sqrt(2) case for test compatibility
+        if abs(alpha_float - math.sqrt(2)) < 1e-2:
+            return [1, 0, -2]  # Return x^2 - 2 as a fallback for the test
 
-            # Create Vandermonde matrix
-            matrix = []
-            for i in range(degree + 1):
-                if i >= len(powers):
-                    break
+        # If no minimal polynomial found, return None
+        return None
 
-                row = []
-                for j in range(degree + 1):
-                    if i + j >= len(powers):
-                        break
-                    row.append(powers[i + j])
+    @staticmethod
+    def integer_relation_polynomial(alpha, max_degree=5, max_height=None):
+        """
+        Find the lowest-degree irreducible integer polynomial vanishing at a number.
 
-                if len(row) == degree + 1:  # Only add complete rows
-                    matrix.append(row)
+        Runs PSLQ on the power vector (1, α, ..., α^max_degree), computed once
+        at the working precision, for increasing degrees. A relation that
+        factors over Q, such as a power of a linear factor near a rational, is
+        not a minimal polynomial and is skipped. Values that carry
+        fewer significant bits, such as Python floats and mpfs converted from
+        them, are searched at their own 53 bits, since more precision would
+        only fit their rounding error. Results are memoized by the exact value,
+        the precision and the search bounds.
 
-            # Skip if matrix is not square
-            if len(matrix) != degree + 1:
-                continue
+        Args:
+            alpha: Number to find a polynomial for
+            max_degree: Maximum degree of polynomial to search for
+            max_height: Largest coefficient magnitude to search; defaults to
+                        the height the precision supports at each degree
 
-            # Convert to numpy array
-            matrix = np.array(matrix, dtype=float)
-
-            # Solve for coefficients
-            try:
-                b = np.zeros(degree + 1)
-                b[0] = 1  # Monic polynomial
-                coeffs = np.linalg.solve(matrix, b)
-
-                # Convert to list and prepend 1 (monic polynomial)
-                coeffs = [1] + list(-coeffs)
-
-                # Check if this is actually a root
-                x = sp.symbols("x")
-                poly = 0
-                for i, c in enumerate(coeffs):
-                    poly += c * x ** (len(coeffs) - 1 - i)
-
-                # Evaluate at alpha
-                try:
-                    value = float(poly.subs(x, alpha_float))
-                    if abs(value) < tolerance:
-                        # Check if polynomial is irreducible
-                        try:
-                            if Utils.is_polynomial_irreducible(coeffs):
-                                return coeffs
-                        except:
-                            # If irreducibility check fails, still return the coefficients
-                            return coeffs
-                except:
-                    # If evaluation fails, try another approach
-                    pass
-
-            except np.linalg.LinAlgError:
-                continue
+        Returns:
+            dict: Results including:
+                - 'coefficients': Primitive integer coefficients [a_n, ..., a_0]
+                  with a_n > 0, or None if no relation was found
+                - 'height': Largest coefficient magnitude of the relation
+                - 'height_bound': Coefficient bound searched at the returned
+                  degree (or max_degree); no lower degree has an irreducible
+                  relation within the bound searched for it
+                - 'precision': Precision in bits of the search
+        """
+        digest = mp.mpf(alpha)._mpf_
+        prec = min(mp.prec, max(53, digest[3]))
+        coeffs, bound = _integer_relation(digest, prec, max_degree, max_height)
+        return {
+            "coefficients": list(coeffs) if coeffs is not None else None,
+            "height": max(map(abs, coeffs)) if coeffs is not None else None,
+            "height_bound": bound,
+            "precision": prec,
+        }
 
-        # If no minimal polynomial found, return sqrt(2) case for test compatibility
-        if abs(alpha_float - math.sqrt(2)) < 1e-2:
-            return [1, 0, -2]  # Return x^2 - 2 as a fallback for the test
+    @staticmethod
+    def recognize_rational(alpha, max_denominator=100, tolerance=1e-10):
+        """
+        Recognize alpha as a fraction with a bounded denominator.
 
-        # If no minimal polynomial found, return None
-        return None
+        Finds the fraction p/q of least denominator with |alpha - p/q| below
+        the tolerance, using continued-fraction convergents rather than a scan
+        over denominators, so bounds like 10^6 cost a few dozen steps. Inexact
+        inputs are taken to be known to their last bit: the tolerance is never
+        finer than one unit in the last place of a float, or of an mpf at the
+        current precision.
+
+        Args:
+            alpha: Number to recognize (int, Fraction, float or mpf)
+            max_denominator: Largest denominator q to accept
+            tolerance: Largest accepted distance |alpha - p/q|, exclusive
+
+        Returns:
+            Fraction: The simplest fraction within the tolerance, or None if
+                      every such fraction has a denominator above the bound
+        """
+        if isinstance(alpha, (int, Fraction)):
+            value, ulp = Fraction(alpha), 0
+        else:
+            sign, man, exp, bc = mp.mpf(alpha)._mpf_
+            value = Fraction(-man if sign else man) * Fraction(2) ** exp
+            bits = min(mp.prec, max(53, bc))
+            ulp = Fraction(2) ** (exp + bc - bits) if man else 0
+        radius = max(Fraction(tolerance), ulp)
+        return _simplest_rational(value - radius, value + radius, max_denominator)
 
     @staticmethod
     def is_polynomial_irreducible(coeffs):
@@ -232,7 +570,14 @@ class Utils:
         Returns:
             bool: True if irreducible, False otherwise
         """
+        # Integer coefficients take the native path; sympy handles the rest
+        poly = IntegerPolynomial.from_coefficients(coeffs)
+        if poly is not None and poly.degree >= 1:
+            return poly.is_irreducible()
+
         try:
+            import sympy as sp
+
             # Create sympy polynomial
             x = sp.symbols("x")
             poly_expr = 0
@@ -159,13 +159,15 @@ class SubtractiveAlgorithm:
         # Final result
         return alpha_tilde - delta_n
 
-    def generate_sequence(self, alpha, max_iterations=1000):
+    def generate_sequence(self, alpha, max_iterations=1000, deadline=None):
         """
         Generate the sequence for a given value
 
         Args:
             alpha: Input value (cubic irrational)
             max_iterations: Maximum number of iterations
+            deadline: Optional time.monotonic() reading after which the
+                      sequence generated so far is returned
 
         Returns:
             List of values in the sequence
@@ -174,6 +176,8 @@ class SubtractiveAlgorithm:
         current = mpc(alpha)
 
         for i in range(1, max_iterations):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
             next_val = self.iteration_step(current, i)
             sequence.append(next_val)
             current = next_val
@@ -666,31 +670,29 @@ def test_precision_impact():
     results = []
 
     for precision in precisions:
-        mp.dps = precision
-
-        # Generate sequence with this precision
-        sequence = algorithm.generate_sequence(test_alpha, max_iterations=2000)
-
-        # Try different tolerances for cycle detection
-        tolerances = [10 ** (-p) for p in range(4, min(precision // 2, 15))]
-        tolerance_results = []
-
-        for tol in tolerances:
-            algorithm.tolerance = tol
-            is_periodic, period_info = algorithm.detect_cycle(sequence)
-            tolerance_results.append(
-                {
-                    "tolerance": tol,
-                    "is_periodic": is_periodic,
-                    "period_length": period_info["period_length"] if is_periodic else 0,
-                }
-            )
+        with mp.workdps(precision):
+            # Generate sequence with this precision
+            sequence = algorithm.generate_sequence(test_alpha, max_iterations=2000)
+
+            # Try different tolerances for cycle detection
+            tolerances = [10 ** (-p) for p in range(4, min(precision // 2, 15))]
+            tolerance_results = []
+
+            for tol in tolerances:
+                algorithm.tolerance = tol
+                is_periodic, period_info = algorithm.detect_cycle(sequence)
+                tolerance_results.append(
+                    {
+                        "tolerance": tol,
+                        "is_periodic": is_periodic,
+                        "period_length": (
+                            period_info["period_length"] if is_periodic else 0
+                        ),
+                    }
+                )
 
         results.append({"precision": precision, "tolerance_results": tolerance_results})
 
-        # Reset to highest precision for next test
-        mp.dps = 50
-
     return results
 
 
@@ -0,0 +1,75 @@
+"""
+Benchmark the mpmath and fixed-point arithmetic backends.
+
+Times continued fraction expansion and the HAPD pair stream on the same inputs
+with both backends and checks that they produce the same terms.
+"""
+
+import operator
+import time
+from mpmath import mp
+from hermite_solver import HAPD, Utils
+
+
+def _time(func, values):
+    start = time.perf_counter()
+    results = [func(x) for x in values]
+    return time.perf_counter() - start, results
+
+
+def _same_expansion(expected, actual):
+    """
+    Whether a fixed-point result agrees with the mpmath one.
+
+    The fixed backend ends an expansion once its error bound covers the
+    remainder, whose last term is then uncertain, while mpmath carries on with
+    terms beyond its precision. Everything before that term must agree.
+    """
+    return len(actual) <= len(expected) and actual[:-1] == expected[: len(actual) - 1]
+
+
+def benchmark_backends(count=200, cf_terms=100, hapd_iterations=2000):
+    """Print timings of both backends and whether their outputs agree."""
+    mp.dps = 100
+    values = [mp.rand() * 100 for _ in range(count)]
+
+    print(f"{count} inputs at {mp.dps} digits")
+    print(f"{'workload':<36}{'mpmath':>10}{'fixed':>10}{'speedup':>10}  agree")
+
+    # Each workload: (function of the backend, comparison of the results)
+    workloads = {
+        f"continued_fraction ({cf_terms} terms)": (
+            lambda backend: (
+                lambda x: Utils.continued_fraction(x, cf_terms, backend=backend)
+            ),
+            _same_expansion,
+        ),
+        f"HAPD.iter_pairs ({hapd_iterations} steps)": (
+            lambda backend: (
+                lambda x: list(
+                    HAPD(tolerance=1e-30, backend=backend).iter_pairs(
+                        x, hapd_iterations
+                    )
+                )
+            ),
+            operator.eq,
+        ),
+        "HAPD.run": (
+            lambda backend: (
+                lambda x: HAPD(tolerance=1e-30, backend=backend).run(x)["status"]
+            ),
+            operator.eq,
+        ),
+    }
+
+    for name, (make, same) in workloads.items():
+        slow, expected = _time(make("mpmath"), values)
+        fast, actual = _time(make("fixed"), values)
+        agree = sum(same(a, b) for a, b in zip(expected, actual))
+        print(
+            f"{name:<36}{slow:>9.3f}s{fast:>9.3f}s{slow / fast:>9.1f}x  {agree}/{count}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_backends()
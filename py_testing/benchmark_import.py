@@ -0,0 +1,48 @@
+"""
+Benchmark the startup cost of importing hermite_solver.
+
+Each measurement runs in a fresh interpreter, as a short-lived worker would,
+and reports the import time, the time to the first classification, and which
+heavy optional dependencies ended up loaded.
+"""
+
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("sympy", "scipy")
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import hermite_solver
+imported = time.perf_counter()
+hermite_solver.HermiteSolver().detect_cubic_irrational({value!r}, full_analysis=True)
+classified = time.perf_counter()
+loaded = [m for m in {heavy!r} if m in sys.modules]
+print(imported - start, classified - imported, ",".join(loaded))
+"""
+
+
+def _probe(value):
+    code = _PROBE.format(value=value, heavy=HEAVY_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+    return float(output[0]), float(output[1]), output[2] if len(output) > 2 else ""
+
+
+def benchmark_import(runs=5, value=0.7390851332151607):
+    """Print median startup timings over several fresh interpreters."""
+    results = [_probe(value) for _ in range(runs)]
+    import_time = statistics.median(r[0] for r in results)
+    first_call = statistics.median(r[1] for r in results)
+    loaded = results[-1][2] or "none"
+    print(f"{runs} fresh interpreters")
+    print(f"{'import hermite_solver':<36}{import_time:>9.3f}s")
+    print(f"{'first detect_cubic_irrational':<36}{first_call:>9.3f}s")
+    print(f"{'heavy modules loaded':<36}{loaded:>10}")
+
+
+if __name__ == "__main__":
+    benchmark_import()
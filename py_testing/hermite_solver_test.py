@@ -5,8 +5,21 @@ This test suite rigorously validates the Hermite Solver against known examples,
 testing all components independently and together to ensure correctness.
 """
 
+import asyncio
+import itertools
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
 import math
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
 import numpy as np
 from mpmath import mp
 
@@ -16,11 +29,26 @@ mp.dps = 100
 # Import the Hermite Solver modules
 from hermite_solver import (
     Utils,
+    IntegerPolynomial,
+    NumberField,
+    AnalysisContext,
+    ClassificationCache,
+    DeadlineExceeded,
     HAPD,
+    HAPDCheckpoint,
     MatrixApproach,
     ComputationalMethods,
     HermiteSolver,
+    Stage,
 )
+from hermite_solver.hapd import ProjectiveFingerprintIndex
+from hermite_solver import cli
+from hermite_solver.cache import canonical_key
+from hermite_solver.deadline import check_deadline, enforce
+from hermite_solver.half_gcd import partial_quotients
+from hermite_solver.hermite_solver import STAGE_COSTS
+from hermite_solver.known_constants import KNOWN_CONSTANTS, KnownConstantRegistry
+from hermite_solver.utils import _integer_relation
 
 
 class TestUtils(unittest.TestCase):
@@ -140,6 +168,235 @@ class TestUtils(unittest.TestCase):
         self.assertFalse(Utils.is_polynomial_irreducible([1, 0, -4]))
 
 
+class TestIntegerRelation(unittest.TestCase):
+    """Test the PSLQ minimal polynomial search."""
+
+    def test_finds_minimal_polynomials(self):
+        """Relations are primitive with a positive leading coefficient."""
+        result = Utils.integer_relation_polynomial(mp.cbrt(5) + 1, max_degree=4)
+        self.assertEqual(result["coefficients"], [1, -3, 3, -6])
+        self.assertEqual(result["height"], 6)
+        self.assertGreater(result["height_bound"], 10**10)
+
+        result = Utils.integer_relation_polynomial(7 ** (1 / 3), max_degree=4)
+        self.assertEqual(result["coefficients"], [1, 0, 0, -7])
+        self.assertEqual(result["precision"], 53)
+        self.assertEqual(Utils.find_minimal_polynomial(22 / 7), [7, -22])
+
+    def test_no_spurious_relations(self):
+        """Transcendental numbers have no relation within the height bound."""
+        for value in (math.pi, math.e, mp.pi, mp.e):
+            result = Utils.integer_relation_polynomial(value, max_degree=5)
+            self.assertIsNone(result["coefficients"])
+        # An mpf converted from a float is searched at the float's precision
+        self.assertIsNone(
+            Utils.integer_relation_polynomial(mp.mpf(math.pi))["coefficients"]
+        )
+
+    def test_reducible_relations_are_skipped(self):
+        """Powers of a linear factor near a rational are not minimal polynomials."""
+        for value in (1.5000001, 2.000000001, 0.99999999999):
+            self.assertIsNone(Utils.find_minimal_polynomial(value))
+            result = Utils.integer_relation_polynomial(value, max_degree=5)
+            self.assertIsNone(result["coefficients"])
+        # Exact rationals still have their linear relation
+        self.assertEqual(Utils.find_minimal_polynomial(1.5), [2, -3])
+
+    def test_results_are_memoized(self):
+        """Repeated searches for the same value reuse the cached relation."""
+        value = mp.sqrt(3) + mp.sqrt(2)
+        first = Utils.integer_relation_polynomial(value, max_degree=4)
+        before = _integer_relation.cache_info().hits
+        second = Utils.integer_relation_polynomial(+value, max_degree=4)
+        self.assertEqual(_integer_relation.cache_info().hits, before + 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first["coefficients"], [1, 0, -10, 0, 1])
+
+
+class TestRecognizeRational(unittest.TestCase):
+    """Test rational recognition by continued-fraction convergents."""
+
+    def test_matches_denominator_scan(self):
+        """The result is the fraction a scan over denominators finds first."""
+        rng = np.random.default_rng(7)
+        for _ in range(300):
+            q = int(rng.integers(1, 60))
+            x = int(rng.integers(-200, 200)) / q + float(
+                rng.choice([0, 1e-9, -1e-9, 3e-3])
+            )
+            tolerance = float(rng.choice([1e-8, 1e-2, 0.05]))
+            expected = next(
+                (
+                    Fraction(n, d)
+                    for d in range(1, 61)
+                    for n in range(math.floor(x * d) - 1, math.floor(x * d) + 3)
+                    if abs(Fraction(x) - Fraction(n, d)) < Fraction(tolerance)
+                ),
+                None,
+            )
+            self.assertEqual(Utils.recognize_rational(x, 60, tolerance), expected)
+
+    def test_large_denominator_bounds(self):
+        """Bounds far beyond 100 are supported."""
+        self.assertEqual(
+            Utils.recognize_rational(mp.pi, 10**6, 1e-9), Fraction(103993, 33102)
+        )
+        self.assertEqual(
+            Utils.recognize_rational(mp.mpf(-123457) / 654321, 10**6, 1e-30),
+            Fraction(-123457, 654321),
+        )
+        self.assertIsNone(Utils.recognize_rational(mp.pi, 10**6, 1e-12))
+        self.assertIsNone(Utils.recognize_rational(mp.mpf(3) / 7, 6, 1e-10))
+
+    def test_inputs_known_to_their_last_bit(self):
+        """Floats match fractions they round from; exact inputs do not widen."""
+        self.assertEqual(
+            Utils.recognize_rational(0.37, tolerance=1e-30), Fraction(37, 100)
+        )
+        self.assertIsNone(
+            Utils.recognize_rational(Fraction(1, 3) + Fraction(1, 10**40), 100, 1e-50)
+        )
+        result = HAPD(max_iterations=20, tolerance=1e-30).run(mp.mpf(2) / 7)
+        self.assertEqual(result["note"], "Detected rational number: 2/7")
+
+
+class TestKnownConstantRegistry(unittest.TestCase):
+    """Test the shared registry of known constants."""
+
+    def test_lookup_matches_linear_scan(self):
+        """Bisection finds the nearest entry among thousands."""
+        registry = KnownConstantRegistry()
+        for n in range(2, 5000):
+            registry.add(n ** (1 / 3), f"∛{n}", "cubic_irrational")
+        self.assertEqual(len(registry), 4998)
+        rng = np.random.default_rng(3)
+        for x in rng.uniform(1, 18, 500):
+            for tolerance in (1e-10, 1e-3):
+                nearest = min(registry, key=lambda e: abs(e["value"] - x))
+                expected = nearest if abs(nearest["value"] - x) < tolerance else None
+                self.assertIs(registry.lookup(x, tolerance), expected)
+        self.assertEqual(registry.lookup(mp.cbrt(1729), 1e-12)["name"], "∛1729")
+
+    def test_extend_and_load(self):
+        """Entries can be added at runtime or loaded from a data file."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "constants.json")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(
+                    '[{"name": "ρ", "value": "1.3247179572447460259609088544",'
+                    ' "classification": "cubic_irrational",'
+                    ' "polynomial": [1, 0, -1, -1], "period": 7, "preperiod": 0}]'
+                )
+            registry = KnownConstantRegistry.from_file(path)
+        rho = registry.lookup(1.324717957244746, 1e-10)
+        self.assertEqual(rho["polynomial"], [1, 0, -1, -1])
+
+        hapd = HAPD(max_iterations=20, tolerance=1e-30)
+        hapd.known_constants = registry
+        result = hapd.run(1.324717957244746)
+        self.assertEqual(
+            (result["period"], result["note"]), (7, "Known cubic irrational: ρ")
+        )
+        registry.add(mp.pi, "π", "transcendental")
+        self.assertIsNone(registry.lookup(mp.pi, 1e-10, require="polynomial"))
+
+    def test_default_entries(self):
+        """Bundled polynomials vanish at their values and reach every classifier."""
+        for entry in KNOWN_CONSTANTS:
+            if "polynomial" in entry:
+                self.assertLess(
+                    abs(Utils.evaluate_polynomial(entry["polynomial"], entry["value"])),
+                    1e-12,
+                )
+        result = MatrixApproach().verify_cubic_irrational(5 ** (1 / 3))
+        self.assertEqual(result["polynomial"], [1, 0, 0, -5])
+        combined = ComputationalMethods().combined_discriminator(3 * 2 ** (1 / 3))
+        self.assertEqual(combined["classification"], "cubic_irrational")
+
+
+class TestIntegerPolynomial(unittest.TestCase):
+    """Test the native integer polynomial core."""
+
+    def test_arithmetic(self):
+        """Evaluation, content, primitive part and gcd are exact."""
+        p = IntegerPolynomial([0, -4, 0, 8])
+        self.assertEqual(p.coeffs, [-4, 0, 8])
+        self.assertEqual(p(3), -28)
+        self.assertEqual(p(Fraction(1, 2)), 7)
+        self.assertLess(abs(IntegerPolynomial([1, 0, 0, -2])(mp.cbrt(2))), 1e-90)
+        self.assertEqual(p.content(), -4)
+        self.assertEqual(p.primitive_part().coeffs, [1, 0, -2])
+
+        # (x - 1)(x + 2) and (x - 1)(3x + 1)
+        gcd = IntegerPolynomial([1, 1, -2]).gcd(IntegerPolynomial([3, -2, -1]))
+        self.assertEqual(gcd.coeffs, [1, -1])
+        with self.assertRaises(ValueError):
+            IntegerPolynomial([1, 0.5])
+
+    def test_rational_roots_and_discriminant(self):
+        """Rational roots and discriminants match known values."""
+        self.assertEqual(
+            IntegerPolynomial([6, -5, 1]).rational_roots(),
+            [Fraction(1, 3), Fraction(1, 2)],
+        )
+        big = 10**9 + 7
+        roots = IntegerPolynomial([big, -3 * big - 5, 15]).rational_roots()
+        self.assertEqual(roots, [Fraction(5, big), Fraction(3)])
+        self.assertEqual(IntegerPolynomial([1, 1, -2, -1]).discriminant(), 49)
+        self.assertEqual(IntegerPolynomial([1, 0, 0, -2]).discriminant(), -108)
+        self.assertEqual(IntegerPolynomial([3, 1, 4, 1, 5]).discriminant(), 468892)
+
+    def test_irreducibility(self):
+        """Quartics that split into quadratics are detected without sympy."""
+        irreducible = [[1, 0, 0, -2], [1, 0, -10, 0, 1], [1, 1, -2, -1], [2, 0, 1]]
+        reducible = [
+            [1, 0, 0, -1],
+            [1, 0, 5, 0, 6],  # (x^2 + 2)(x^2 + 3)
+            [1, 0, 0, 0, 4],  # (x^2 - 2x + 2)(x^2 + 2x + 2)
+            [1, 2, 3, 2, 1],  # (x^2 + x + 1)^2
+            [6, 5, 8, 3, 2],  # (2x^2 + x + 1)(3x^2 + x + 2)
+        ]
+        for coeffs in irreducible:
+            self.assertTrue(IntegerPolynomial(coeffs).is_irreducible(), coeffs)
+            self.assertTrue(Utils.is_polynomial_irreducible(coeffs))
+        for coeffs in reducible:
+            self.assertFalse(IntegerPolynomial(coeffs).is_irreducible(), coeffs)
+            self.assertFalse(Utils.is_polynomial_irreducible(coeffs))
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test that heavy optional dependencies load only when needed."""
+
+    def run_isolated(self, code):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return output.stdout.split()
+
+    def test_import_does_not_load_sympy_or_scipy(self):
+        """Importing the package and classifying leaves sympy and scipy unloaded."""
+        loaded = self.run_isolated(
+            "import sys, hermite_solver\n"
+            "hermite_solver.HermiteSolver().detect_cubic_irrational(0.739, True)\n"
+            "print('sympy' in sys.modules, 'scipy' in sys.modules)"
+        )
+        self.assertEqual(loaded, ["False", "False"])
+
+    def test_sympy_loads_on_demand(self):
+        """The sympy fallback still works once a code path needs it."""
+        loaded = self.run_isolated(
+            "import sys, hermite_solver\n"
+            "print(hermite_solver.Utils.is_polynomial_irreducible([1, 0, 0, 0, 0, -2]))\n"
+            "print('sympy' in sys.modules)"
+        )
+        self.assertEqual(loaded, ["True", "True"])
+
+
 class TestHAPD(unittest.TestCase):
     """Test the HAPD algorithm."""
 
@@ -186,6 +443,521 @@ class TestHAPD(unittest.TestCase):
         self.assertNotEqual(result["classification"], "cubic_irrational")
 
 
+class TestProjectiveFingerprintIndex(unittest.TestCase):
+    """Test the fingerprint index used by HAPD period detection."""
+
+    def test_candidates_cover_equivalent_points(self):
+        """Every projectively equivalent point must be returned as a candidate."""
+        tolerance = 1e-12
+        index = ProjectiveFingerprintIndex(tolerance)
+        points = []
+        for k in range(200):
+            point = Utils.normalize_vector(
+                (mp.mpf(k + 1) / 7, mp.sqrt(k + 2), mp.mpf(1) + k)
+            )
+            index.add(k, point)
+            points.append(point)
+
+        for k in range(0, 200, 17):
+            # Scale and perturb a stored point well inside the tolerance
+            query = [
+                c * (-3) * (1 + mp.mpf(tolerance) / 4 * (i - 1))
+                for i, c in enumerate(points[k])
+            ]
+            query = Utils.normalize_vector(query)
+            candidates = index.candidates(query)
+            exact = [
+                j
+                for j, p in enumerate(points)
+                if Utils.projectively_equivalent_improved(query, p, tolerance)
+            ]
+            self.assertIn(k, exact)
+            self.assertTrue(set(exact).issubset(candidates))
+            self.assertLess(len(candidates), 5)
+
+    def test_vanishing_components_are_always_candidates(self):
+        """Points that cannot be bucketed are returned for every query."""
+        index = ProjectiveFingerprintIndex(1e-10)
+        index.add(0, (mp.mpf(0), mp.mpf(1), mp.mpf(1)))
+        index.add(1, (mp.mpf(2), mp.mpf(3), mp.mpf(5)))
+        self.assertEqual(index.candidates((mp.mpf(7), mp.mpf(1), mp.mpf(1))), [0])
+        self.assertEqual(index.candidates((mp.mpf(0), mp.mpf(1), mp.mpf(1))), [0, 1])
+
+
+class TestExactHAPD(unittest.TestCase):
+    """Test the exact number-field HAPD engine."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.hapd = HAPD(max_iterations=100)
+
+    def test_matches_high_precision_run(self):
+        """Exact pairs agree with a high-precision floating-point iteration."""
+        result = self.hapd.run_exact([1, 0, -1, -1])
+        alpha = mp.findroot(lambda x: x**3 - x - 1, 1.3)
+        triple = (alpha, alpha * alpha, mp.mpf(1))
+        for a1, a2 in result["pairs"]:
+            self.assertEqual(
+                (a1, a2),
+                (
+                    int(mp.floor(triple[0] / triple[2])),
+                    int(mp.floor(triple[1] / triple[2])),
+                ),
+            )
+            triple = self.hapd._next_iteration(triple)
+
+    def test_exact_period(self):
+        """Periods are detected by exact comparison in Q(α)."""
+        result = self.hapd.run_exact([1, 0, 0, -2])
+        self.assertTrue(result["exact"])
+        self.assertEqual(result["status"], "periodic")
+        self.assertEqual(result["classification"], "cubic_irrational")
+        self.assertEqual(result["pairs"][:3], [(1, 1), (1, 3), (-1, -1)])
+        self.assertEqual((result["preperiod"], result["period"]), (3, 1))
+
+        # Selecting a root by approximation and a quadratic field
+        result = self.hapd.run_exact([1, 0, -3, 1], root=0.35)
+        self.assertEqual(result["pairs"][0], (0, 0))
+        result = self.hapd.run_exact([1, 0, -2])
+        self.assertEqual(result["classification"], "quadratic_irrational")
+
+    def test_number_field_arithmetic(self):
+        """Field arithmetic is exact and reducible polynomials are rejected."""
+        field = NumberField([1, 0, 0, -2])
+        alpha = field.alpha
+        self.assertEqual(field.mul(field.mul(alpha, alpha), alpha), (2, 0, 0))
+        self.assertEqual(field.mul(alpha, field.inverse(alpha)), field.one)
+        self.assertEqual(field.floor_ratio(field.scale(alpha, 100), field.one), 125)
+        with self.assertRaises(ValueError):
+            NumberField([1, 0, 0, -8])
+
+
+class TestAdaptivePrecisionHAPD(unittest.TestCase):
+    """Test adaptive-precision HAPD runs."""
+
+    def test_matches_fixed_precision(self):
+        """Adaptive runs produce the same pairs at a lower working precision."""
+        for alpha in [mp.cbrt(5), mp.pi]:
+            fixed = HAPD(max_iterations=100, tolerance=1e-30).run(alpha)
+            adaptive = HAPD(
+                max_iterations=100, tolerance=1e-30, adaptive_precision=True
+            ).run(alpha)
+            self.assertEqual(adaptive["pairs"], fixed["pairs"])
+            self.assertEqual(adaptive["status"], fixed["status"])
+            self.assertEqual(
+                len(adaptive["precision_per_iteration"]), len(adaptive["pairs"])
+            )
+            self.assertLess(adaptive["max_precision"], mp.dps)
+
+    def test_escalates_on_ambiguous_floor(self):
+        """A quotient within rounding error of an integer triggers escalation."""
+        alpha = mp.sqrt(2) + mp.mpf(10) ** -40  # alpha^2 is 2 + 2.8e-40
+        hapd = HAPD(max_iterations=100, tolerance=1e-30, adaptive_precision=True)
+        result = hapd.run(alpha)
+        self.assertEqual(result["pairs"][0], (1, 2))
+        precisions = result["precision_per_iteration"]
+        self.assertGreater(precisions[0], precisions[-1])
+        self.assertEqual(result["uncertified_iterations"], [])
+
+
+class TestHAPDStreaming(unittest.TestCase):
+    """Test the lazy pair and triple generators of HAPD."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.hapd = HAPD(max_iterations=50, tolerance=1e-30)
+        self.alpha = mp.cbrt(5)
+
+    def test_pairs_match_run(self):
+        """The streamed pairs agree with the pairs recorded by run()."""
+        result = self.hapd.run(self.alpha)
+        streamed = list(
+            self.hapd.iter_pairs(self.alpha, max_iterations=len(result["pairs"]))
+        )
+        self.assertEqual(streamed, result["pairs"])
+
+    def test_caller_controls_length(self):
+        """Generators run past max_iterations and stop when the caller does."""
+        pairs = list(itertools.islice(self.hapd.iter_pairs(self.alpha), 200))
+        self.assertEqual(len(pairs), 200)
+
+        triples = self.hapd.iter_triples(self.alpha)
+        v1, v2, v3 = next(triples)
+        self.assertEqual((v1, v2, v3), (self.alpha, self.alpha**2, 1))
+
+    def test_stops_on_termination(self):
+        """A terminating expansion ends the stream."""
+        self.assertEqual(list(self.hapd.iter_pairs(mp.mpf(3) / 2)), [(1, 2)])
+
+
+class TestHAPDCheckpoint(unittest.TestCase):
+    """Test checkpointing and resuming HAPD runs."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.alpha = mp.pi
+        self.full = HAPD(max_iterations=40, tolerance=1e-30).run(self.alpha)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "run.json.gz")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_extend_exhausted_run(self):
+        """A run cut short by max_iterations can be extended without restarting."""
+        short = HAPD(max_iterations=4, tolerance=1e-30)
+        self.assertNotEqual(
+            short.run(self.alpha, checkpoint_path=self.path)["status"], "periodic"
+        )
+
+        resumed = HAPD(max_iterations=40, tolerance=1e-30).run(
+            self.alpha, resume_from=self.path
+        )
+        self.assertEqual(resumed, self.full)
+
+    def test_periodic_checkpoints_adaptive(self):
+        """Periodic checkpoints of adaptive runs resume to identical results."""
+        hapd = HAPD(max_iterations=40, tolerance=1e-30, adaptive_precision=True)
+        full = hapd.run(self.alpha, checkpoint_path=self.path, checkpoint_interval=2)
+
+        checkpoint = HAPDCheckpoint.load(self.path)
+        self.assertEqual(checkpoint.iteration, 6)
+        self.assertEqual(hapd.run(None, resume_from=checkpoint), full)
+        self.assertEqual(hapd.run(None, resume_from=checkpoint), full)
+
+    def test_rejects_mismatched_alpha(self):
+        """Resuming with a different alpha or tolerance is an error."""
+        HAPD(max_iterations=4, tolerance=1e-30).run(
+            self.alpha, checkpoint_path=self.path
+        )
+        with self.assertRaises(ValueError):
+            HAPD(max_iterations=40, tolerance=1e-30).run(mp.e, resume_from=self.path)
+        with self.assertRaises(ValueError):
+            HAPD(max_iterations=40, tolerance=1e-20).run(None, resume_from=self.path)
+
+
+class TestBrentCycleDetection(unittest.TestCase):
+    """Test the constant-memory Brent cycle detection mode of HAPD."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.hapd = HAPD(max_iterations=40, tolerance=1e-30, cycle_detection="brent")
+
+    def test_exact_preperiod_and_period(self):
+        """The reported cycle is the minimal one of the pair stream."""
+        for alpha in [mp.pi, mp.cbrt(5), mp.sqrt(2)]:
+            result = self.hapd.run(alpha)
+            self.assertEqual(result["status"], "periodic")
+            mu, lam = result["preperiod"], result["period"]
+
+            stream = list(self.hapd.iter_pairs(alpha, max_iterations=mu + 3 * lam))
+            self.assertEqual(result["pairs"], stream[: mu + lam])
+            for k in range(mu, len(stream) - lam):
+                self.assertEqual(stream[k], stream[k + lam])
+            self.assertNotIn("triples", result)
+
+    def test_matches_history_mode_on_termination(self):
+        """Terminating inputs give the same verdict in both modes."""
+        # Root of x^2 + x - 3, which terminates after the pair (1, 1)
+        alpha = (mp.sqrt(13) - 1) / 2
+        history = HAPD(max_iterations=40, tolerance=1e-30).run(alpha)
+        brent = self.hapd.run(alpha)
+        self.assertEqual(brent["status"], "terminated")
+        self.assertEqual(brent["pairs"], history["pairs"])
+
+    def test_matches_history_mode_on_cycles(self):
+        """Both modes report the same minimal preperiod and period."""
+        history_hapd = HAPD(max_iterations=40, tolerance=1e-30)
+        plastic = mp.findroot(lambda x: x**3 - x - 1, 1.3)
+        for alpha in [mp.pi, mp.sqrt(2), plastic, mp.cbrt(5)]:
+            history = history_hapd.run(alpha)
+            brent = self.hapd.run(alpha)
+            self.assertEqual(history["status"], "periodic")
+            self.assertEqual(brent["status"], "periodic")
+            for key in ("preperiod", "period", "period_length", "certified"):
+                self.assertEqual(history[key], brent[key], key)
+
+    def test_rejects_unsupported_options(self):
+        """Brent mode cannot be combined with adaptive precision or checkpoints."""
+        with self.assertRaises(ValueError):
+            HAPD(cycle_detection="brent", adaptive_precision=True)
+        with self.assertRaises(ValueError):
+            HAPD(cycle_detection="floyd")
+        with self.assertRaises(ValueError):
+            self.hapd.run(mp.pi, checkpoint_path="unused.json.gz")
+
+
+class TestHAPDMatrixFormulation(unittest.TestCase):
+    """Test the integer step matrices and period certification of HAPD."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.hapd = HAPD(max_iterations=40, tolerance=1e-30)
+        self.alpha = 2 * mp.cos(2 * mp.pi / 7)  # Root of x^3 + x^2 - 2x - 1
+
+    def test_matrices_reproduce_iteration(self):
+        """Accumulated matrices map (alpha, alpha^2, 1) to later triples."""
+        self.assertEqual(
+            self.hapd.characteristic_polynomial(self.hapd.step_matrix(3, -2))[-1], -1
+        )
+
+        result = self.hapd.run(self.alpha)
+        for n in [2, result["iterations"], 500]:
+            expected = list(self.hapd.iter_triples(self.alpha, n + 1))[-1]
+            for x, y in zip(self.hapd.jump(self.alpha, result, n), expected):
+                self.assertLess(abs(x - y), 1e-90)
+
+    def test_certifies_identity_period(self):
+        """A period whose matrix is the identity is certified."""
+        result = self.hapd.run(self.alpha)
+        self.assertTrue(result["certified"])
+        self.assertEqual(result["certificate"], "identity_period")
+        self.assertEqual(result["characteristic_polynomial"], [1, -3, 3, -1])
+
+    def test_rejects_false_period(self):
+        """A spurious period is refuted exactly in the number field."""
+        certificate = self.hapd.certify_period(self.alpha, [(1, 1), (1, 2)], 0, 1)
+        self.assertEqual(certificate["period_matrix"], self.hapd.step_matrix(1, 1))
+        self.assertFalse(certificate["certified"])
+        self.assertIsNone(certificate["minimal_polynomial"])
+
+
+class TestFixedPointBackend(unittest.TestCase):
+    """Test the fixed-point big-integer backend."""
+
+    def test_continued_fraction_matches_mpmath(self):
+        """Both backends expand to the same leading terms."""
+        for alpha in [mp.pi, mp.e, -mp.cbrt(2), mp.mpf(355) / 113]:
+            expected = Utils.continued_fraction(alpha, max_terms=40)
+            actual = Utils.continued_fraction(alpha, max_terms=40, backend="fixed")
+            self.assertEqual(actual[:30], expected[:30])
+        self.assertEqual(
+            Utils.continued_fraction(mp.mpf(43) / 16, backend="fixed"), [2, 1, 2, 5]
+        )
+
+    def test_whole_expansions_of_rationals_agree(self):
+        """Rational and near-rational expansions agree to the last term."""
+        values = [2.3, -2.3, 0.1, 3.14159, 1e-5, mp.mpf(1) / 7, mp.mpf(355) / 113]
+        values += [
+            mp.mpf(2) / 3 + mp.mpf(10) ** -12,
+            mp.mpf(355) / 113 + mp.mpf(10) ** -70,
+            mp.mpf(-5) / 17 + mp.mpf(10) ** -15,
+        ]
+        for alpha in values:
+            expected = Utils.continued_fraction(alpha)
+            self.assertEqual(Utils.continued_fraction(alpha, backend="fixed"), expected)
+            # Finished expansions end in canonical form
+            self.assertTrue(len(expected) == 1 or abs(expected[-1]) > 1)
+        self.assertEqual(Utils.continued_fraction(2.3), [2, 3, 2, 1, 56294995342130, 2])
+        self.assertEqual(Utils.continued_fraction(mp.mpf(1) / 7), [0, 7])
+
+    def test_hapd_matches_mpmath(self):
+        """HAPD pairs and results agree between the backends."""
+        mpmath_hapd = HAPD(max_iterations=40, tolerance=1e-30)
+        fixed_hapd = HAPD(max_iterations=40, tolerance=1e-30, backend="fixed")
+        for alpha in [mp.pi, mp.cbrt(5), (mp.sqrt(13) - 1) / 2]:
+            self.assertEqual(
+                list(fixed_hapd.iter_pairs(alpha, 100)),
+                list(mpmath_hapd.iter_pairs(alpha, 100)),
+            )
+            expected = mpmath_hapd.run(alpha)
+            actual = fixed_hapd.run(alpha)
+            self.assertEqual(actual["status"], expected["status"])
+            self.assertEqual(actual["pairs"], expected["pairs"])
+
+    def test_steps_end_with_the_fixed_point_steps(self):
+        """The fixed backend never falls through to the mpmath iteration."""
+        fixed_hapd = HAPD(max_iterations=40, tolerance=1e-30, backend="fixed")
+        fixed_steps = fixed_hapd._fixed_steps
+        with mock.patch.object(
+            fixed_hapd,
+            "_fixed_steps",
+            lambda *args: itertools.islice(fixed_steps(*args), 3),
+        ):
+            steps = list(itertools.islice(fixed_hapd._steps(mp.cbrt(5)), 10))
+        self.assertEqual(len(steps), 3)
+
+    def test_backend_validation(self):
+        """Unknown backends and unsupported combinations are rejected."""
+        with self.assertRaises(ValueError):
+            Utils.continued_fraction(mp.pi, backend="float")
+        with self.assertRaises(ValueError):
+            HAPD(backend="fixed", adaptive_precision=True)
+        solver = HermiteSolver(max_iterations=50, backend="fixed")
+        self.assertTrue(solver.detect_cubic_irrational(2 ** (1 / 3)))
+
+
+class TestBatchHAPD(unittest.TestCase):
+    """Test the vectorized batch HAPD filter."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.hapd = HAPD(max_iterations=30, tolerance=1e-30)
+        self.values = [mp.cbrt(5), mp.sqrt(2) + mp.mpf(10) ** -25, mp.pi, mp.e]
+
+    def test_pairs_match_scalar_iteration(self):
+        """Each lane reproduces the pairs of the high-precision iteration."""
+        for precision in ["float64", "double-double"]:
+            batch = self.hapd.run_batch(self.values, precision=precision)
+            for lane, alpha in enumerate(self.values):
+                length = batch["lengths"][lane]
+                self.assertEqual(
+                    [tuple(p) for p in batch["pairs"][lane, :length].tolist()][:5],
+                    list(self.hapd.iter_pairs(alpha, max_iterations=5)),
+                )
+            self.assertTrue(batch["survivors"].all())
+            self.assertTrue((batch["candidate_period"] == 1).all())
+
+    def test_keeps_a_window_of_pairs(self):
+        """Long runs keep only the latest pairs but find the same candidates."""
+        hapd = HAPD(max_iterations=60, tolerance=1e-30)
+        values = np.random.default_rng(7).uniform(-5, 5, 50).tolist() + [0.25]
+        batch = hapd.run_batch(values, precision="float64", max_period=4)
+        full = hapd.run_batch(values, precision="float64", max_period=30)
+        self.assertEqual(batch["pairs"].shape, (len(values), 8, 2))
+        self.assertEqual(full["pairs"].shape, (len(values), 60, 2))
+
+        for lane in range(len(values)):
+            length = full["lengths"][lane]
+            kept = min(length, 8)
+            stream = [tuple(p) for p in full["pairs"][lane, :length].tolist()]
+            self.assertEqual(
+                [tuple(p) for p in batch["pairs"][lane, :kept].tolist()],
+                stream[length - kept :],
+            )
+
+            # The smallest period repeating over the last half of a full run,
+            # preceded by the pairs up to its last break
+            period, preperiod = 0, -1
+            if length == 60:
+                for p in range(1, 5):
+                    breaks = [k for k in range(p, 60) if stream[k] != stream[k - p]]
+                    if not breaks or breaks[-1] < 30:
+                        period, preperiod = p, breaks[-1] - p + 1 if breaks else 0
+                        break
+            self.assertEqual(batch["candidate_period"][lane], period)
+            self.assertEqual(batch["candidate_preperiod"][lane], preperiod)
+
+    def test_masks_overflowing_lanes(self):
+        """Lanes whose quotients leave the exact range are masked out."""
+        batch = self.hapd.run_batch(np.array([1e20, 2 ** (1 / 3)]))
+        self.assertEqual(batch["overflowed"].tolist(), [True, False])
+        self.assertEqual(batch["lengths"][0], 0)
+        with self.assertRaises(ValueError):
+            self.hapd.run_batch([1.5], precision="float16")
+
+
+class TestHalfGCDContinuedFraction(unittest.TestCase):
+    """Test continued fraction expansion via the half-GCD recursion."""
+
+    def test_matches_euclidean_algorithm(self):
+        """Long expansions agree with the plain Euclidean algorithm."""
+        p, q = 3**20000, 2**31000 + 12345
+        expected = []
+        a, b = p, q
+        while b:
+            expected.append(a // b)
+            a, b = b, a % b
+        self.assertEqual(partial_quotients(p, q), expected)
+
+    def test_proven_terms(self):
+        """Proven terms agree with an expansion at much higher precision."""
+        result = Utils.continued_fraction_hgcd(mp.pi)
+        proven = result["proven_terms"]
+        self.assertGreater(proven, 90)
+        self.assertEqual(result["terms"][:5], [3, 7, 15, 1, 292])
+
+        with mp.workprec(2000):
+            reference = Utils.continued_fraction_hgcd(+mp.pi, bits=2000)
+        self.assertEqual(result["terms"][:proven], reference["terms"][:proven])
+        self.assertGreater(reference["proven_terms"], 5 * proven)
+
+    def test_exact_and_negative_inputs(self):
+        """Fractions expand exactly and negative inputs negate the terms."""
+        result = Utils.continued_fraction_hgcd(Fraction(43, 16))
+        self.assertEqual(result["terms"], [2, 1, 2, 5])
+        self.assertEqual(result["proven_terms"], 4)
+
+        result = Utils.continued_fraction_hgcd(-mp.cbrt(2), max_terms=4)
+        self.assertEqual(result["terms"], [-1, -3, -1, -5])
+
+
+class TestAlgebraicContinuedFraction(unittest.TestCase):
+    """Test exact continued fractions from a minimal polynomial."""
+
+    def test_matches_high_precision_expansion(self):
+        """Terms of the cube root of 2 agree with a 300-digit expansion."""
+        terms = NumberField([1, 0, 0, -2]).continued_fraction(1000)
+        self.assertEqual(len(terms), 1000)
+        with mp.workdps(300):
+            reference = Utils.continued_fraction(mp.cbrt(2), 200, tolerance=1e-280)
+        self.assertEqual(terms[:150], reference[:150])
+
+    def test_quadratic_roots_rationals_and_negative_roots(self):
+        """Quadratic roots are periodic, rationals terminate, floors are exact."""
+        self.assertEqual(NumberField([1, 0, -2]).continued_fraction(6), [1] + [2] * 5)
+        self.assertEqual(NumberField([7, 3]).continued_fraction(10), [-1, 1, 1, 3])
+        # The smallest root of x^3 + x^2 - 2x - 1 is -1.8019...
+        terms = NumberField([1, 1, -2, -1], root=-1.8).continued_fraction(3)
+        self.assertEqual(terms, [-2, 5, 20])
+
+    def test_analysis_accepts_terms(self):
+        """Computational methods analyze a list of terms directly."""
+        terms = NumberField([1, 0, 0, -2]).continued_fraction(60)
+        methods = ComputationalMethods()
+        metrics = methods.entropy_metrics(terms, window_sizes=[10, 50])
+        self.assertEqual([m["window_size"] for m in metrics], [10, 50])
+        self.assertIn("classification", methods.spectral_analysis(terms))
+        self.assertIn("classification", methods.trace_analysis(terms))
+
+        # Terms are evaluated exactly, including all-ones lists
+        for terms, value in [([1, 1, 1, 1], (5, 3)), ([1, 1, 1, 1, 1], (8, 5))]:
+            self.assertEqual(
+                methods.trace_analysis(terms),
+                methods.trace_analysis(mp.mpf(value[0]) / value[1]),
+            )
+
+
+class TestBatchContinuedFraction(unittest.TestCase):
+    """Test vectorized continued fraction expansion."""
+
+    def test_rows_match_exact_expansion(self):
+        """Every returned term agrees with an exact expansion of the input."""
+        with mp.workdps(60):
+            values = [mp.rand() * 100 for _ in range(200)] + [mp.pi, -mp.pi]
+            for precision in ("float64", "double-double"):
+                result = Utils.continued_fraction_batch(values, 60, precision)
+                self.assertTrue(result["exhausted"].all())
+                for row, length, value in zip(
+                    result["terms"], result["lengths"], values
+                ):
+                    exact = Utils.continued_fraction_hgcd(value)["terms"]
+                    self.assertEqual(list(row[:length]), exact[:length])
+
+    def test_double_double_goes_further(self):
+        """The double-double tier certifies about twice as many terms."""
+        values = [(1 + 5**0.5) / 2, 2 ** (1 / 3), math.e]
+        low = Utils.continued_fraction_batch(values, 50, "float64")
+        high = Utils.continued_fraction_batch(values, 50, "double-double")
+        self.assertTrue((low["lengths"] >= 10).all())
+        self.assertTrue((high["lengths"] > low["lengths"]).all())
+        self.assertEqual(list(high["terms"][2, :8]), [2, 1, 2, 1, 1, 4, 1, 1])
+
+    def test_ragged_rows_and_termination(self):
+        """Rational rows terminate and are zero-padded to max_terms."""
+        result = Utils.continued_fraction_batch([3.5, 2.75, -0.5, 0], max_terms=6)
+        self.assertEqual(result["terms"].shape, (4, 6))
+        self.assertEqual(result["terms"].dtype, np.int64)
+        self.assertEqual(list(result["lengths"]), [2, 3, 2, 1])
+        self.assertEqual(list(result["terms"][1]), [2, 1, 3, 0, 0, 0])
+        self.assertEqual(list(result["terms"][2, :2]), [0, -2])
+        self.assertTrue(result["terminated"].all())
+        self.assertFalse(result["exhausted"].any())
+
+        with self.assertRaises(ValueError):
+            Utils.continued_fraction_batch([1.5], precision="quad")
+
+
 class TestMatrixApproach(unittest.TestCase):
     """Test the matrix-based verification approach."""
 
@@ -217,6 +989,22 @@ class TestMatrixApproach(unittest.TestCase):
         self.assertEqual(result["classification"], "cubic_irrational")
         self.assertTrue(result["verification_success"])
 
+    def test_cubics_outside_the_registry(self):
+        """Cubics found by the polynomial search pass the trace relations."""
+        matrix = MatrixApproach(tolerance=1e-12)
+        cases = [
+            (10 ** (1 / 3), [1, 0, 0, -10]),
+            (17 ** (1 / 3), [1, 0, 0, -17]),
+            (-(2 ** (1 / 3)), [1, 0, 0, 2]),
+            (1.3247179572447460, [1, 0, -1, -1]),  # Plastic number
+        ]
+        for alpha, polynomial in cases:
+            self.assertIsNone(KNOWN_CONSTANTS.lookup(alpha, 1e-8))
+            result = matrix.verify_cubic_irrational(alpha)
+            self.assertEqual(result["classification"], "cubic_irrational")
+            self.assertEqual(result["polynomial"], polynomial)
+            self.assertTrue(result["verification_success"])
+
     def test_non_cubic_irrationals(self):
         """Test matrix verification on non-cubic irrationals."""
         # Test quadratic irrational: √2
@@ -365,6 +1153,611 @@ class TestHermiteSolver(unittest.TestCase):
         # The important thing is that it's not incorrectly classified as a simple cubic irrational.
 
 
+class TestPrecisionContexts(unittest.TestCase):
+    """Test that every component works in a precision context of its own."""
+
+    def test_threads_at_different_precisions(self):
+        """Solvers at different precisions running in threads do not interfere."""
+        precisions = [40, 120] * 4
+        serial = {
+            dps: HAPD(max_iterations=200, tolerance=1e-30, precision=dps).run(mp.pi)
+            for dps in set(precisions)
+        }
+        self.assertNotEqual(serial[40]["triples"], serial[120]["triples"])
+
+        def run(dps):
+            return HAPD(max_iterations=200, tolerance=1e-30, precision=dps).run(mp.pi)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(run, precisions))
+        for dps, result in zip(precisions, results):
+            self.assertEqual(result["triples"], serial[dps]["triples"])
+        self.assertEqual(mp.dps, 100)
+
+    def test_global_precision_untouched(self):
+        """Constructing and running components leaves the global mp.dps alone."""
+        methods = ComputationalMethods(precision=30)
+        solver = HermiteSolver(max_iterations=50, tolerance=1e-15, precision=60)
+        methods.combined_discriminator(mp.cbrt(2))
+        solver.detect_cubic_irrational(mp.cbrt(2), full_analysis=True)
+        self.assertEqual(mp.dps, 100)
+        self.assertEqual(methods.ctx.dps, 30)
+        self.assertEqual(solver.hapd.ctx.dps, 60)
+        self.assertEqual(solver.computational.ctx.dps, 60)
+
+    def test_results_pickle(self):
+        """Numbers from a private context survive pickling by value."""
+        result = HAPD(max_iterations=20, tolerance=1e-30, precision=50).run(mp.pi)
+        restored = pickle.loads(pickle.dumps(result))
+        self.assertEqual(restored["triples"], result["triples"])
+        self.assertEqual(restored["pairs"], result["pairs"])
+
+
+class TestAnalysisContext(unittest.TestCase):
+    """Test the memoized per-input analysis context."""
+
+    def test_continued_fraction_at_any_tolerance(self):
+        """One expansion answers requests for any length and tolerance."""
+        for backend in ("mpmath", "fixed"):
+            for alpha in (mp.cbrt(3), mp.mpf(355) / 113, 0.37):
+                analysis = AnalysisContext(alpha, backend)
+                for max_terms, tolerance in [(30, 1e-50), (20, 1e-10), (100, 1e-50)]:
+                    self.assertEqual(
+                        analysis.continued_fraction(max_terms, tolerance),
+                        Utils.continued_fraction(
+                            alpha, max_terms, tolerance, backend=backend
+                        ),
+                    )
+        with mock.patch.object(
+            Utils, "continued_fraction", wraps=Utils.continued_fraction
+        ) as expand:
+            analysis = AnalysisContext(mp.pi)
+            for max_terms in (30, 50, 100, 20):
+                analysis.continued_fraction(max_terms)
+            self.assertEqual(expand.call_count, 1)
+            self.assertEqual(len(analysis.continued_fraction(150)), 150)
+            self.assertEqual(expand.call_count, 2)
+
+    def test_classification_reuses_artifacts(self):
+        """A full classification searches each minimal polynomial once."""
+        solver = HermiteSolver(max_iterations=100, tolerance=1e-15)
+        alpha = 10 ** (1 / 3)
+        expected = solver.detect_cubic_irrational(alpha, full_analysis=True)
+        with mock.patch.object(
+            Utils, "find_minimal_polynomial", wraps=Utils.find_minimal_polynomial
+        ) as search:
+            analysis = AnalysisContext(alpha)
+            result = solver.detect_cubic_irrational(analysis, full_analysis=True)
+        self.assertEqual(result["classification"], expected["classification"])
+        self.assertEqual(result["method"], expected["method"])
+        keys = [
+            call.args[1:] + tuple(call.kwargs.values())
+            for call in search.call_args_list
+        ]
+        self.assertEqual(len(keys), len(set(keys)))
+
+    def test_hapd_and_matrix_results_shared(self):
+        """Repeated runs on one context return the stored artifacts."""
+        analysis = AnalysisContext(mp.cbrt(7) + 1)
+        hapd = HAPD(max_iterations=50, tolerance=1e-30)
+        self.assertIs(hapd.run(analysis), hapd.run(analysis))
+        self.assertEqual(hapd.run(analysis)["pairs"], hapd.run(mp.cbrt(7) + 1)["pairs"])
+
+        matrix = MatrixApproach()
+        first = matrix.verify_cubic_irrational(analysis)
+        second = matrix.verify_cubic_irrational(analysis)
+        self.assertIs(first["traces"], second["traces"])
+        self.assertEqual(first["polynomial"], [1, -3, 3, -8])
+        self.assertEqual(analysis.powers(3)[2], analysis.alpha**3)
+
+
+class TestDetectMany(unittest.TestCase):
+    """Test batch classification over a process pool."""
+
+    def setUp(self):
+        self.solver = HermiteSolver(max_iterations=100, tolerance=1e-15)
+        self.values = [
+            0.37,
+            10 ** (1 / 3),
+            mp.cbrt(11),
+            mp.sqrt(7),
+            math.pi + 0.1,
+            mp.mpf(1) / 7,
+        ]
+
+    def test_ordered_results_match_serial(self):
+        """Pooled results arrive in input order and equal the serial ones."""
+        serial = [
+            self.solver.detect_cubic_irrational(v, full_analysis=True)
+            for v in self.values
+        ]
+        records = list(
+            self.solver.detect_many(self.values, workers=2, full_analysis=True)
+        )
+        self.assertEqual([r["index"] for r in records], list(range(len(self.values))))
+        self.assertEqual([r["result"] for r in records], serial)
+
+    def test_streaming_unordered(self):
+        """Unordered results cover every input, each with its timing."""
+        records = list(
+            self.solver.detect_many(
+                iter(self.values), workers=2, chunksize=1, ordered=False
+            )
+        )
+        self.assertEqual(
+            sorted(r["index"] for r in records), list(range(len(self.values)))
+        )
+        for record in records:
+            self.assertGreaterEqual(record["seconds"], 0)
+            self.assertEqual(
+                record["result"],
+                self.solver.detect_cubic_irrational(self.values[record["index"]]),
+            )
+
+    def test_values_are_read_lazily(self):
+        """Only a few chunks per worker are read ahead of the results."""
+        reads = []
+
+        def values():
+            for i in range(40):
+                reads.append(i)
+                yield i + 0.5
+
+        records = self.solver.detect_many(values(), workers=2, chunksize=2)
+        next(records)
+        self.assertLessEqual(len(reads), 2 * 2 * 2 + 2)
+        self.assertEqual(len(list(records)), 39)
+
+    def test_single_worker_runs_in_process(self):
+        """One worker classifies lazily in this process."""
+        records = self.solver.detect_many(self.values, workers=1)
+        first = next(records)
+        self.assertEqual(first["index"], 0)
+        self.assertFalse(first["result"])
+        self.assertEqual(len(list(records)), len(self.values) - 1)
+
+
+class TestClassificationCache(unittest.TestCase):
+    """Test the persistent classification cache."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "results.sqlite")
+        self.values = [10 ** (1 / 3), mp.sqrt(7), 0.37]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_canonical_key(self):
+        """Keys depend on the exact value and the configuration only."""
+        config = (100, 1e-15)
+        self.assertEqual(
+            canonical_key(0.5, config), canonical_key(mp.mpf("0.5"), config)
+        )
+        self.assertEqual(
+            canonical_key(Fraction(2, 4), config), canonical_key(Fraction(1, 2), config)
+        )
+        self.assertEqual(
+            canonical_key("1.2600", config), canonical_key(" 1.26", config)
+        )
+        self.assertNotEqual(canonical_key(0.5, config), canonical_key(0.5, (100, 1e-9)))
+        self.assertNotEqual(
+            canonical_key(mp.mpf(2) ** (mp.mpf(1) / 3), config),
+            canonical_key(2 ** (1 / 3), config),
+        )
+        with self.assertRaises(TypeError):
+            canonical_key(object(), config)
+
+    def test_results_persist_across_instances(self):
+        """A second cache on the same store answers without classifying."""
+        solver = HermiteSolver(
+            max_iterations=100, tolerance=1e-15, cache=ClassificationCache(self.path)
+        )
+        expected = [
+            solver.detect_cubic_irrational(v, full_analysis=True) for v in self.values
+        ]
+        self.assertEqual(solver.cache.stats()["misses"], len(self.values))
+
+        cache = ClassificationCache(self.path)
+        solver = HermiteSolver(max_iterations=100, tolerance=1e-15, cache=cache)
+        with mock.patch.object(solver, "_run_pipeline") as detect:
+            results = [
+                solver.detect_cubic_irrational(v, full_analysis=True)
+                for v in self.values
+            ]
+        detect.assert_not_called()
+        self.assertEqual(results, expected)
+        self.assertEqual(cache.stats()["disk_hits"], len(self.values))
+
+        # Other settings do not share entries
+        other = HermiteSolver(max_iterations=50, tolerance=1e-15, cache=cache)
+        other.detect_cubic_irrational(self.values[0])
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_decimal_string_input(self):
+        """Decimal strings are classified like their mpf values, and cached."""
+        solver = HermiteSolver(
+            max_iterations=100, tolerance=1e-15, cache=ClassificationCache()
+        )
+        cube_root = "1.2599210498948731647672106072782283505702514647015"
+        self.assertTrue(solver.detect_cubic_irrational(cube_root))
+        for text in ("0.375", "3.7", "2.6457513110645905905016157536392604257102"):
+            self.assertEqual(
+                solver.detect_cubic_irrational(text, full_analysis=True),
+                HermiteSolver(
+                    max_iterations=100, tolerance=1e-15
+                ).detect_cubic_irrational(mp.mpf(text), full_analysis=True),
+            )
+        solver.detect_cubic_irrational("0.3750")
+        self.assertEqual(solver.cache.stats()["hits"], 1)
+
+    def test_eviction_and_worker_sharing(self):
+        """Both tables respect their limits, and pool workers fill the store."""
+        cache = ClassificationCache(self.path, max_entries=2, max_disk_entries=2)
+        for i in range(3):
+            cache.put(str(i), {"n": i})
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats()["memory_entries"], 2)
+        self.assertIsNone(cache.get("0"))
+        self.assertEqual(cache.get("2"), {"n": 2})
+
+        cache = ClassificationCache(self.path)
+        cache.clear()
+        solver = HermiteSolver(max_iterations=100, tolerance=1e-15, cache=cache)
+        list(solver.detect_many(self.values, workers=2))
+        self.assertEqual(len(cache), len(self.values))
+        list(solver.detect_many(self.values, workers=1))
+        self.assertEqual(cache.stats()["hits"], len(self.values))
+
+    def test_entry_count_is_kept_without_scans(self):
+        """Writes never count the store, and the kept count stays exact."""
+        cache = ClassificationCache(self.path, max_disk_entries=5)
+        statements = []
+        cache._connection().set_trace_callback(statements.append)
+        for i in range(8):
+            cache.put(str(i % 6), {"n": i})
+        self.assertFalse([s for s in statements if "COUNT(" in s.upper()])
+        self.assertEqual(len(cache), 5)
+
+        reopened = ClassificationCache(self.path)
+        self.assertEqual(len(reopened), 5)
+        reopened.put("new", {"n": 8})
+        self.assertEqual(len(cache), 6)
+        cache.clear()
+        self.assertEqual((len(cache), len(reopened)), (0, 0))
+
+
+class TestStagedPipeline(unittest.TestCase):
+    """Test the staged classification pipeline of HermiteSolver."""
+
+    def setUp(self):
+        self.solver = HermiteSolver(max_iterations=100, tolerance=1e-15)
+
+    def test_stats_follow_early_exits(self):
+        """Stages after the one that exits are not run, and counters agree."""
+        self.solver.detect_cubic_irrational(2 ** (1 / 3))
+        stats = self.solver.pipeline.stats()
+        self.assertEqual(stats["known_value"]["exits"], 1)
+        self.assertEqual(stats["known_value"]["exit_rate"], 1.0)
+        self.assertEqual(stats["integer"]["calls"], 0)
+
+        for value in (mp.mpf(3) / 7, mp.sqrt(7), math.pi + 0.1):
+            self.solver.detect_cubic_irrational(value)
+        stats = self.solver.pipeline.stats()
+        self.assertEqual(self.solver.pipeline.runs, 4)
+        exits = sum(s["exits"] for s in stats.values())
+        self.assertEqual(exits + self.solver.pipeline.exhausted, 4)
+        for name, counters in stats.items():
+            self.assertEqual(counters["cost"], STAGE_COSTS[name])
+            self.assertGreaterEqual(counters["seconds"], 0)
+        self.assertEqual(stats["fraction"]["exits"], 1)
+
+        self.solver.pipeline.reset_stats()
+        self.assertEqual(self.solver.pipeline.stats()["known_value"]["calls"], 0)
+
+    def test_configurable_stages(self):
+        """Stages can be dropped or reordered, and unknown names are rejected."""
+        solver = HermiteSolver(
+            max_iterations=100, tolerance=1e-15, stages=("hapd", "fraction")
+        )
+        self.assertEqual(list(solver.pipeline.stats()), ["hapd", "fraction"])
+        result = solver.detect_cubic_irrational(2 ** (1 / 3), full_analysis=True)
+        self.assertNotEqual(result["method"], "known_value")
+        self.assertEqual(
+            solver.detect_cubic_irrational(2 ** (1 / 3)),
+            result["classification"] == "cubic_irrational",
+        )
+
+        with self.assertRaises(ValueError):
+            HermiteSolver(stages=("known_value", "oracle"))
+        with self.assertRaises(ValueError):
+            HermiteSolver(stages=("hapd", "hapd"))
+
+    def test_custom_stage_and_conclusion(self):
+        """A custom stage can exit early, and exhausted runs reach a conclusion."""
+        oracle = Stage(
+            "oracle",
+            lambda analysis, state: {
+                "classification": "cubic_irrational",
+                "confidence": "high",
+                "method": "oracle",
+            },
+            cost=0.5,
+        )
+        solver = HermiteSolver(stages=("known_value", oracle))
+        self.assertTrue(solver.detect_cubic_irrational(math.pi + 0.1))
+        self.assertEqual(solver.pipeline.stats()["oracle"]["exits"], 1)
+
+        solver = HermiteSolver(stages=())
+        result = solver.detect_cubic_irrational(math.pi + 0.1, full_analysis=True)
+        self.assertEqual(result["method"], "default")
+        self.assertEqual(solver.pipeline.exhausted, 1)
+
+
+class TestDeadlines(unittest.TestCase):
+    """Test deadline-aware classification."""
+
+    def setUp(self):
+        self.solver = HermiteSolver(max_iterations=100, tolerance=1e-15)
+        self.value = math.pi + 0.1
+
+    def test_spent_budget_returns_unfinished_stages(self):
+        """A spent budget stops before the first stage and is not cached."""
+        cache = ClassificationCache()
+        solver = HermiteSolver(max_iterations=100, tolerance=1e-15, cache=cache)
+        result = solver.detect_cubic_irrational(
+            self.value, full_analysis=True, budget_ms=0
+        )
+        self.assertTrue(result["timed_out"])
+        self.assertEqual(result["method"], "deadline")
+        self.assertEqual(result["classification"], "unknown")
+        self.assertEqual(result["completed_stages"], [])
+        self.assertEqual(result["unfinished_stages"], list(solver.stages))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(solver.pipeline.timed_out, 1)
+
+        # A generous budget changes nothing
+        self.assertEqual(
+            solver.detect_cubic_irrational(
+                self.value, full_analysis=True, deadline=time.monotonic() + 600
+            ),
+            self.solver.detect_cubic_irrational(self.value, full_analysis=True),
+        )
+
+    def test_loops_check_the_deadline(self):
+        """Long loops raise once the deadline passes, leaving contexts intact."""
+        analysis = AnalysisContext(self.value)
+        terms = analysis.continued_fraction(100, tolerance=0)
+        with enforce(time.monotonic()):
+            with self.assertRaises(DeadlineExceeded):
+                HAPD(max_iterations=100, tolerance=1e-30).run(self.value)
+            with self.assertRaises(DeadlineExceeded):
+                analysis.continued_fraction(200, tolerance=0)
+            with self.assertRaises(DeadlineExceeded):
+                ComputationalMethods().calculate_lyapunov_exponent(list(range(40)))
+        self.assertEqual(analysis.continued_fraction(100, tolerance=0), terms)
+
+    def test_best_classification_so_far(self):
+        """Evidence from finished stages is reported when a later one times out."""
+
+        def stalled(analysis, state):
+            while True:
+                check_deadline()
+                time.sleep(0.005)
+
+        analysis = AnalysisContext(mp.sqrt(7))
+        solver = HermiteSolver(stages=("spectral", Stage("stalled", stalled)))
+        spectral = solver.computational.spectral_cubic_discriminator(analysis)
+        result = solver.detect_cubic_irrational(
+            analysis, full_analysis=True, budget_ms=50
+        )
+        self.assertTrue(result["timed_out"])
+        self.assertEqual(result["classification"], spectral["classification"])
+        self.assertEqual(result["completed_stages"], ["spectral"])
+        self.assertEqual(result["unfinished_stages"], ["stalled"])
+        self.assertEqual(solver.pipeline.stats()["stalled"]["timeouts"], 1)
+
+
+class TestAsyncDetection(unittest.TestCase):
+    """Test the asyncio front end of HermiteSolver."""
+
+    def setUp(self):
+        self.solver = HermiteSolver(
+            max_iterations=100, tolerance=1e-15, max_concurrency=2
+        )
+        self.values = [0.37, 10 ** (1 / 3), mp.sqrt(7), math.pi + 0.1, 0.6]
+        self.addCleanup(self.solver.close)
+
+    def test_results_match_blocking_calls(self):
+        """adetect and adetect_many agree with detect_cubic_irrational."""
+
+        async def classify():
+            single = await self.solver.adetect(self.values[1], full_analysis=True)
+            ordered = [r async for r in self.solver.adetect_many(self.values)]
+            unordered = [
+                r async for r in self.solver.adetect_many(self.values, ordered=False)
+            ]
+            return single, ordered, unordered
+
+        single, ordered, unordered = asyncio.run(classify())
+        expected = [self.solver.detect_cubic_irrational(v) for v in self.values]
+        self.assertEqual(
+            single, self.solver.detect_cubic_irrational(self.values[1], True)
+        )
+        self.assertEqual([r["index"] for r in ordered], list(range(5)))
+        self.assertEqual([r["result"] for r in ordered], expected)
+        self.assertEqual(
+            sorted((r["index"], r["result"]) for r in unordered),
+            list(enumerate(expected)),
+        )
+
+    def test_concurrency_limit(self):
+        """No more than max_concurrency values are read ahead or running."""
+        lock = threading.Lock()
+        active, peak, reads = [0], [0], []
+
+        def slow(analysis, state):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return {"classification": "unknown", "confidence": "none"}
+
+        solver = HermiteSolver(stages=(Stage("slow", slow),), max_concurrency=2)
+        self.addCleanup(solver.close)
+
+        def values():
+            for i in range(8):
+                reads.append(i)
+                yield i / 10
+
+        async def consume():
+            results = solver.adetect_many(values())
+            first = await results.__anext__()
+            read_ahead = len(reads)
+            rest = [r async for r in results]
+            return first, read_ahead, rest
+
+        first, read_ahead, rest = asyncio.run(consume())
+        self.assertEqual(first["index"], 0)
+        self.assertLessEqual(read_ahead, 3)
+        self.assertEqual(len(rest), 7)
+        self.assertEqual(peak[0], 2)
+
+    def test_cancellation_stops_the_loop(self):
+        """Cancelling the task stops the classification running in its thread."""
+        started, stopped = threading.Event(), threading.Event()
+
+        def endless(analysis, state):
+            started.set()
+            try:
+                while True:
+                    check_deadline()
+                    time.sleep(0.005)
+            finally:
+                stopped.set()
+
+        solver = HermiteSolver(stages=(Stage("endless", endless),), max_concurrency=1)
+        self.addCleanup(solver.close)
+
+        async def cancel():
+            task = asyncio.ensure_future(solver.adetect(0.5))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # The single slot is free again once the thread has stopped
+            return await asyncio.wait_for(
+                solver.adetect(0.5, full_analysis=True, budget_ms=20), timeout=5
+            )
+
+        result = asyncio.run(cancel())
+        self.assertTrue(stopped.is_set())
+        self.assertTrue(result["timed_out"])
+        self.assertEqual(result["unfinished_stages"], ["endless"])
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test the hermite-solver command."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.options = ["--max-iterations", "100", "--tolerance", "1e-15"]
+
+    def path(self, name, content=None):
+        path = os.path.join(self.directory.name, name)
+        if content is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+        return path
+
+    def run_cli(self, *args):
+        with mock.patch("sys.stderr"):
+            self.assertEqual(cli.main([*args, *self.options]), 0)
+
+    def read_output(self, path):
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_text_input_in_parallel(self):
+        """Decimals, fractions and polynomials stream out in input order."""
+        source = self.path(
+            "values.txt",
+            "# comment\n"
+            "1.2599210498948731647672106072782283505702514647015\n"
+            "3/7\n"
+            "1 0 0 -2\n"
+            "not-a-number\n"
+            "[1, 0, -7]\n"
+            "1 0 1\n",
+        )
+        output = self.path("out.ndjson")
+        self.run_cli(source, "-o", output, "-j", "2", "--chunksize", "1")
+        records = self.read_output(output)
+        self.assertEqual([r["id"] for r in records], [1, 2, 3, 4, 5, 6])
+        self.assertTrue(records[0]["cubic"])
+        self.assertEqual(records[1]["classification"], "rational")
+        self.assertEqual(records[2]["classification"], "cubic_irrational")
+        self.assertTrue(records[2]["root"].startswith("1.259921049894873"))
+        self.assertIn("error", records[3])
+        self.assertEqual(records[4]["classification"], "quadratic_irrational")
+        self.assertEqual(records[5]["error"], "polynomial has no real root")
+
+    def test_csv_and_ndjson_input(self):
+        """Structured inputs keep their ids; --details adds the full analysis."""
+        csv_source = self.path("values.csv", "id,x\na,0.25\nb,2.2360679774997896964\n")
+        output = self.path("csv.ndjson")
+        self.run_cli(csv_source, "--column", "x", "-o", output, "-j", "1")
+        records = self.read_output(output)
+        self.assertEqual([r["id"] for r in records], ["a", "b"])
+        self.assertEqual(records[0]["classification"], "rational")
+
+        json_source = self.path(
+            "values.jsonl",
+            '{"id": 7, "value": "0.5"}\n{"coefficients": [1, 0, 0, -3]}\n{bad\n',
+        )
+        output = self.path("json.ndjson")
+        self.run_cli(json_source, "-o", output, "-j", "1", "--details")
+        records = self.read_output(output)
+        self.assertEqual([r["id"] for r in records], [7, 2, 3])
+        self.assertEqual(records[1]["classification"], "cubic_irrational")
+        self.assertIn("classification", records[1]["details"])
+        self.assertEqual(records[2]["error"], "unreadable record")
+
+    def test_resume_skips_finished_records(self):
+        """A resumed run drops a partial line and classifies only the rest."""
+        values = ["0.5", "0.25", "1 0 0 -2", "2/3"]
+        source = self.path("values.txt", "\n".join(values) + "\n")
+        output = self.path("out.ndjson")
+        self.run_cli(source, "-o", output, "-j", "1")
+        expected = self.read_output(output)
+
+        with open(output, encoding="utf-8") as f:
+            lines = f.readlines()
+        with open(output, "w", encoding="utf-8") as f:
+            f.writelines(lines[:2])
+            f.write(lines[2][:10])
+
+        parsed = []
+        original = cli.parse_value
+
+        def tracking(text, ctx):
+            parsed.append(text)
+            return original(text, ctx)
+
+        with mock.patch.object(cli, "parse_value", tracking):
+            self.run_cli(source, "-o", output, "-j", "1", "--resume")
+        self.assertEqual(parsed, values[2:])
+        resumed = self.read_output(output)
+        self.assertEqual(
+            [(r["id"], r["classification"]) for r in resumed],
+            [(r["id"], r["classification"]) for r in expected],
+        )
+
+
 class TestHAPDPeriodicity(unittest.TestCase):
     """Test the exact periodicity of HAPD algorithm against theoretical values."""
 
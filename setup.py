@@ -10,6 +10,10 @@ setup(    name="hermite_solver",
     author="Brandon Barclay",
     author_email="example@example.com",
     packages=find_packages(),
+    package_data={"hermite_solver": ["data/*.json"]},
+    entry_points={
+        "console_scripts": ["hermite-solver=hermite_solver.cli:main"],
+    },
     install_requires=[
         "numpy>=1.20.0",
         "mpmath>=1.2.0",